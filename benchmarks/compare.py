@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""Compare two benchmark result files and flag statistically significant slowdowns.
+
+Records are matched on (name, backend, instance). For each pair the tool runs a
+two-sided Mann-Whitney U test on the repeated samples and reports Cliff's delta
+as the effect size. A pair counts as a regression when the difference is
+significant and the candidate median is slower by more than the threshold. The
+tool exits with status 1 if any pair regressed.
+
+Example:
+    uv run python benchmarks/compare.py benchmarks/results/micro_old.json \
+        benchmarks/results/micro_new.json --threshold 0.05 --alpha 0.01
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import statistics
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from harness import format_seconds
+
+Key = Tuple[str, Optional[str], str]
+
+
+def load(path: Path) -> Tuple[Dict[str, Any], Dict[Key, List[float]]]:
+    """Environment and samples keyed by (name, backend, instance)."""
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    samples: Dict[Key, List[float]] = {}
+    for record in payload.get("results", []):
+        if record.get("samples"):
+            key = (record["name"], record.get("backend"), record["instance"])
+            samples[key] = [float(s) for s in record["samples"]]
+    return payload.get("environment", {}), samples
+
+
+def _ranks(values: List[float]) -> Tuple[List[float], List[int]]:
+    """Average ranks (1-based) and the sizes of tied groups."""
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    ties: List[int] = []
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[order[k]] = (i + j) / 2 + 1
+        ties.append(j - i + 1)
+        i = j + 1
+    return ranks, ties
+
+
+def mann_whitney_u(a: List[float], b: List[float]) -> Tuple[float, float]:
+    """U statistic of ``a`` and its two-sided p-value (normal approximation).
+
+    The variance is corrected for ties and the z score for continuity, as
+    scipy.stats.mannwhitneyu(method="asymptotic") does.
+    """
+    n1, n2 = len(a), len(b)
+    ranks, ties = _ranks(a + b)
+    u = sum(ranks[:n1]) - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    tie_term = sum(t**3 - t for t in ties) / (n * (n - 1))
+    sigma = math.sqrt(n1 * n2 / 12 * ((n + 1) - tie_term))
+    if sigma == 0:
+        return u, 1.0
+    z = (abs(u - n1 * n2 / 2) - 0.5) / sigma
+    return u, min(1.0, math.erfc(max(z, 0.0) / math.sqrt(2)))
+
+
+def cliffs_delta(baseline: List[float], candidate: List[float]) -> float:
+    """P(candidate > baseline) - P(candidate < baseline); positive means slower."""
+    greater = less = 0
+    for c in candidate:
+        for b in baseline:
+            if c > b:
+                greater += 1
+            elif c < b:
+                less += 1
+    return (greater - less) / (len(baseline) * len(candidate))
+
+
+def effect_label(delta: float) -> str:
+    # Romano et al. (2006) thresholds for |delta|.
+    size = abs(delta)
+    if size < 0.147:
+        return "negligible"
+    if size < 0.33:
+        return "small"
+    if size < 0.474:
+        return "medium"
+    return "large"
+
+
+def compare(
+    baseline: List[float], candidate: List[float], threshold: float, alpha: float
+) -> Dict[str, Any]:
+    base_median = statistics.median(baseline)
+    cand_median = statistics.median(candidate)
+    ratio = cand_median / base_median if base_median > 0 else math.inf
+    _, p_value = mann_whitney_u(baseline, candidate)
+    delta = cliffs_delta(baseline, candidate)
+    if p_value >= alpha:
+        verdict = "same"
+    elif ratio > 1 + threshold:
+        verdict = "regression"
+    elif ratio < 1 / (1 + threshold):
+        verdict = "improvement"
+    else:
+        verdict = "same"
+    return {
+        "baseline_median": base_median,
+        "candidate_median": cand_median,
+        "ratio": ratio,
+        "p_value": p_value,
+        "cliffs_delta": delta,
+        "effect": effect_label(delta),
+        "verdict": verdict,
+        "n_baseline": len(baseline),
+        "n_candidate": len(candidate),
+    }
+
+
+def _label(key: Key) -> str:
+    name, backend, instance = key
+    return f"{name}[{backend}] {instance}" if backend else f"{name} {instance}"
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", help="Baseline result JSON")
+    parser.add_argument("candidate", help="Candidate result JSON")
+    parser.add_argument(
+        "--threshold", type=float, default=0.05, help="Relative median slowdown to flag (0.05 = 5%%)"
+    )
+    parser.add_argument("--alpha", type=float, default=0.05, help="Significance level")
+    parser.add_argument("--output", help="Write the comparison as JSON here")
+    args = parser.parse_args(argv)
+
+    base_env, baseline = load(Path(args.baseline))
+    cand_env, candidate = load(Path(args.candidate))
+
+    base_packages = base_env.get("packages", {})
+    for name, version in sorted(cand_env.get("packages", {}).items()):
+        if base_packages.get(name) != version:
+            print(f"[compare] {name}: {base_packages.get(name)} -> {version}")
+
+    comparisons = []
+    for key in sorted(baseline.keys() & candidate.keys(), key=lambda k: tuple(map(str, k))):
+        result = compare(baseline[key], candidate[key], args.threshold, args.alpha)
+        comparisons.append({"name": key[0], "backend": key[1], "instance": key[2], **result})
+        print(
+            f"{_label(key):40} {format_seconds(result['baseline_median']):>10} -> "
+            f"{format_seconds(result['candidate_median']):>10} x{result['ratio']:.3f} "
+            f"p={result['p_value']:.3g} delta={result['cliffs_delta']:+.2f} "
+            f"({result['effect']}) {result['verdict'].upper()}",
+            flush=True,
+        )
+    for key in sorted(baseline.keys() ^ candidate.keys(), key=lambda k: tuple(map(str, k))):
+        side = "baseline" if key in baseline else "candidate"
+        print(f"{_label(key):40} only in {side}")
+
+    small = [c for c in comparisons if min(c["n_baseline"], c["n_candidate"]) < 5]
+    if small:
+        print(
+            f"[compare] {len(small)} pairs have fewer than 5 samples on a side; "
+            "the test rarely reaches significance there"
+        )
+
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "baseline": args.baseline,
+            "candidate": args.candidate,
+            "threshold": args.threshold,
+            "alpha": args.alpha,
+            "comparisons": comparisons,
+        }
+        output.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+    regressions = [c for c in comparisons if c["verdict"] == "regression"]
+    print(
+        f"[compare] {len(comparisons)} compared, {len(regressions)} regressions, "
+        f"{sum(c['verdict'] == 'improvement' for c in comparisons)} improvements"
+    )
+    if regressions:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Shared timing, statistics and result-file helpers for the benchmarks."""
+
+from __future__ import annotations
+
+import gc
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+RESULTS_DIR = PROJECT_ROOT / "benchmarks" / "results"
+PACKAGES = ("ortools", "pulp", "pyomo", "highspy", "numpy")
+
+
+def time_samples(
+    fn: Callable[[], Any], warmup: int, repeats: int, min_time: float
+) -> tuple[int, List[float]]:
+    """Per-call seconds for ``repeats`` samples after ``warmup`` calls.
+
+    Fast calls are looped so each sample lasts at least ``min_time``; the
+    garbage collector is paused while a sample runs, as timeit does.
+    """
+    for _ in range(warmup):
+        fn()
+    start = time.perf_counter()
+    fn()
+    first = time.perf_counter() - start
+    loops = max(1, min(1_000_000, math.ceil(min_time / first))) if first > 0 else 1_000_000
+
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    try:
+        for _ in range(repeats):
+            gc.collect()
+            gc.disable()
+            start = time.perf_counter()
+            for _ in range(loops):
+                fn()
+            samples.append((time.perf_counter() - start) / loops)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return loops, samples
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    if len(samples) > 1:
+        cuts = statistics.quantiles(samples, n=100, method="inclusive")
+        p50, p90, p99 = cuts[49], cuts[89], cuts[98]
+        stdev = statistics.stdev(samples)
+    else:
+        p50 = p90 = p99 = samples[0]
+        stdev = 0.0
+    return {
+        "min": min(samples),
+        "p50": p50,
+        "p90": p90,
+        "p99": p99,
+        "max": max(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": stdev,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def environment() -> Dict[str, Any]:
+    versions = {}
+    for name in PACKAGES:
+        try:
+            versions[name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            versions[name] = None
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "packages": versions,
+    }
+
+
+def default_output(kind: str) -> Path:
+    ts = datetime.now().strftime("%Y%m%d-%H%M%S")
+    return RESULTS_DIR / f"{kind}_{ts}.json"
+
+
+def write_results(
+    path: Path,
+    kind: str,
+    config: Dict[str, Any],
+    results: List[Dict[str, Any]],
+    extra: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Write results; every record carries name, backend, instance and samples."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"kind": kind, "environment": environment(), "config": config, "results": results}
+    payload.update(extra or {})
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def format_seconds(value: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if value >= scale:
+            return f"{value / scale:.3f}{unit}"
+    return f"{value / 1e-9:.1f}ns"
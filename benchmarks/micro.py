@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks for the library's hot paths, one phase at a time.
+
+Example:
+    uv run python benchmarks/micro.py --sizes 15,1000,100000 --filter build_model
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from harness import default_output, format_seconds, summarize, time_samples, write_results
+
+from parking_problem.generators import gen_uniform  # noqa: E402
+from parking_problem.solvers import (  # noqa: E402
+    solver_highspy,
+    solver_kk,
+    solver_ortools,
+    solver_pulp,
+    solver_pyomo,
+)
+from parking_problem.solvers.base import scale_lengths  # noqa: E402
+from parking_problem.validator import validate_lengths, validate_solution  # noqa: E402
+
+DEFAULT_SIZES = "15,1000,100000,1000000"
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    backend: Optional[str]
+    # setup(lengths) returns the zero-argument call to time
+    setup: Callable[[List[float]], Callable[[], Any]]
+
+
+def _solved_ortools(lengths: List[float]) -> Callable[[], Any]:
+    from ortools.sat.python import cp_model
+
+    built = solver_ortools.build_model(lengths)
+    solver = cp_model.CpSolver()
+    solver.parameters.num_workers = 1
+    solver.parameters.max_time_in_seconds = 10
+    status = solver.Solve(built.model)
+    return lambda: solver_ortools.extract(lengths, built, solver, status)
+
+
+def _solved_pulp(lengths: List[float]) -> Callable[[], Any]:
+    import pulp
+
+    built = solver_pulp.build_model(lengths)
+    built.problem.solve(pulp.PULP_CBC_CMD(msg=False, timeLimit=10, warmStart=True))
+    return lambda: solver_pulp.extract(lengths, built)
+
+
+def _solved_highs(lengths: List[float]) -> Callable[[], Any]:
+    import highspy
+
+    built = solver_highspy.build_model(lengths)
+    h = highspy.Highs()
+    h.setOptionValue("output_flag", False)
+    h.setOptionValue("time_limit", 10.0)
+    h.passModel(built.lp)
+    h.run()
+    return lambda: solver_highspy.extract(lengths, built, h)
+
+
+def _solved_pyomo(lengths: List[float]) -> Callable[[], Any]:
+    import pyomo.environ as pyo
+
+    built = solver_pyomo.build_model(lengths)
+    solver = pyo.SolverFactory("appsi_highs")
+    solver.options["time_limit"] = 10.0
+    result = solver.solve(built.model)
+    return lambda: solver_pyomo.extract(lengths, built, str(result.solver.status))
+
+
+def _validate_solution(lengths: List[float]) -> Callable[[], Any]:
+    solution = solver_kk.solve(lengths)
+    return lambda: validate_solution(lengths, solution)
+
+
+def _differencing(lengths: List[float]) -> Callable[[], Any]:
+    scaled, _ = scale_lengths(lengths)
+    return lambda: solver_kk.differencing(scaled)
+
+
+CASES = [
+    Case("scale_lengths", None, lambda lengths: lambda: scale_lengths(lengths)),
+    Case("differencing", None, _differencing),
+    Case("build_model", "ortools", lambda lengths: lambda: solver_ortools.build_model(lengths)),
+    Case("build_model", "pulp", lambda lengths: lambda: solver_pulp.build_model(lengths)),
+    Case("build_model", "highs", lambda lengths: lambda: solver_highspy.build_model(lengths)),
+    Case("build_model", "pyomo", lambda lengths: lambda: solver_pyomo.build_model(lengths)),
+    Case("extract", "ortools", _solved_ortools),
+    Case("extract", "pulp", _solved_pulp),
+    Case("extract", "highs", _solved_highs),
+    Case("extract", "pyomo", _solved_pyomo),
+    Case("validate_lengths", None, lambda lengths: lambda: validate_lengths(lengths)),
+    Case("validate_solution", None, _validate_solution),
+]
+
+
+def _label(case: Case) -> str:
+    return f"{case.name}[{case.backend}]" if case.backend else case.name
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Comma-separated car counts")
+    parser.add_argument("--filter", default="", help="Regex on case labels, e.g. 'extract'")
+    parser.add_argument("--warmup", type=int, default=2, help="Untimed calls before sampling")
+    parser.add_argument("--repeats", type=int, default=15, help="Timed samples per case")
+    parser.add_argument(
+        "--min-time", type=float, default=0.01, help="Minimum seconds per sample (loops fast calls)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed for generated lengths")
+    parser.add_argument("--output", help="Result JSON path (default: benchmarks/results/)")
+    args = parser.parse_args(argv)
+
+    # Benchmarks time the library, not solver logging or the solution cache.
+    os.environ["SOLVER_LOG"] = "false"
+    os.environ.pop("SOLUTION_CACHE_PATH", None)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    pattern = re.compile(args.filter)
+    cases = [case for case in CASES if pattern.search(_label(case))]
+    if not cases:
+        raise SystemExit(f"No benchmark matches --filter {args.filter!r}")
+
+    results: List[Dict[str, Any]] = []
+    for n in sizes:
+        lengths = gen_uniform(n, 1.0, 10.0, seed=args.seed + n)
+        for case in cases:
+            fn = case.setup(lengths)
+            loops, samples = time_samples(fn, args.warmup, args.repeats, args.min_time)
+            stats = summarize(samples)
+            results.append(
+                {
+                    "name": case.name,
+                    "backend": case.backend,
+                    "instance": f"n={n}",
+                    "n": n,
+                    "loops": loops,
+                    "samples": samples,
+                    "stats": stats,
+                }
+            )
+            print(
+                f"{_label(case):28} n={n:<8} p50={format_seconds(stats['p50']):>10} "
+                f"p90={format_seconds(stats['p90']):>10} p99={format_seconds(stats['p99']):>10} "
+                f"loops={loops}",
+                flush=True,
+            )
+
+    output = Path(args.output) if args.output else default_output("micro")
+    config = {
+        "sizes": sizes,
+        "filter": args.filter,
+        "warmup": args.warmup,
+        "repeats": args.repeats,
+        "min_time": args.min_time,
+        "seed": args.seed,
+    }
+    write_results(output, "micro", config, results)
+    print(f"[micro] wrote {output}")
+
+
+if __name__ == "__main__":
+    main()
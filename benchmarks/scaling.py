@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""End-to-end scaling benchmark over instance size and coefficient magnitude.
+
+Every run solves one generated instance (integer lengths in [1, magnitude])
+in a fresh process pinned to a fixed CPU set. Each run records wall time,
+time to the first incumbent, time to optimal and peak RSS. The tool then
+fits t ~ a * n^b per backend and magnitude.
+
+Example:
+    uv run python benchmarks/scaling.py --sizes 15,1000,100000 --magnitudes 1e3,1e12 \
+        --backends ortools,highs --threads 4 --time-limit 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import multiprocessing as mp
+import os
+import queue
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from harness import default_output, format_seconds, write_results
+
+DEFAULT_SIZES = "15,100,1000,10000,100000"
+DEFAULT_MAGNITUDES = "1e3,1e6,1e9,1e12"
+DEFAULT_BACKENDS = "dp,kk,ckk,ortools,highs,pulp"
+# The dp bitset holds sum/2 bits; skip it above this many.
+DP_MAX_BITS = 1 << 31
+
+
+def _run_one(
+    backend: str,
+    n: int,
+    magnitude: int,
+    seed: int,
+    cpus: List[int],
+    time_limit: float,
+    results,
+) -> None:
+    # Pin before importing any solver so every engine thread inherits the mask.
+    if cpus and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cpus)
+    os.environ.update(
+        SOLVER_TIME_LIMIT=str(time_limit),
+        PRESOLVE="false",
+        SOLVER_LOG="false",
+        MAX_THREADS="1",
+        OMP_NUM_THREADS=str(max(1, len(cpus))),
+    )
+    os.environ.pop("SOLUTION_CACHE_PATH", None)
+    os.environ.pop("CONVERGENCE_LOG_PATH", None)
+    os.environ.pop("TELEMETRY_PATH", None)
+
+    import resource
+
+    from parking_problem.generators import gen_integers
+    from parking_problem.solver_main import solve
+    from parking_problem.solvers.base import is_optimal
+
+    lengths = gen_integers(n, magnitude, seed)
+    incumbents: List[float] = []
+    try:
+        start = time.perf_counter()
+        solution = solve(
+            lengths, backend, "highs", on_incumbent=lambda t, objective, bound: incumbents.append(t)
+        )
+        wall = time.perf_counter() - start
+        first = incumbents[0] if incumbents else None
+        results.put(
+            {
+                "status": solution.status,
+                "wall": wall,
+                # Engines without incumbent reports only have their final answer.
+                "first_incumbent": first if first is not None else wall,
+                "time_to_optimal": wall if is_optimal(solution) else None,
+                "max_side": solution.max_side,
+                "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+            }
+        )
+    except BaseException as exc:  # noqa: BLE001 - reported back to the parent
+        results.put({"status": "error", "error": repr(exc)})
+
+
+def run_cell(
+    backend: str, n: int, magnitude: int, seed: int, cpus: List[int], time_limit: float
+) -> Dict[str, Any]:
+    """Solve one instance in a spawned process; kill it if it overruns."""
+    ctx = mp.get_context("spawn")
+    results = ctx.Queue()
+    proc = ctx.Process(
+        target=_run_one, args=(backend, n, magnitude, seed, cpus, time_limit, results)
+    )
+    proc.start()
+    try:
+        # Engines enforce SOLVER_TIME_LIMIT; the grace covers build and import.
+        return results.get(timeout=time_limit * 1.5 + 30)
+    except queue.Empty:
+        return {"status": "timeout"}
+    finally:
+        if proc.is_alive():
+            proc.kill()
+        proc.join()
+        results.close()
+
+
+def fit_power_law(ns: List[int], times: List[float]) -> Optional[Dict[str, float]]:
+    """Least-squares fit of log t = log a + b log n; None with fewer than 2 points."""
+    if len(ns) < 2:
+        return None
+    x = np.log(np.asarray(ns, dtype=np.float64))
+    y = np.log(np.maximum(np.asarray(times, dtype=np.float64), 1e-9))
+    b, log_a = np.polyfit(x, y, 1)
+    predicted = log_a + b * x
+    ss_res = float(np.sum((y - predicted) ** 2))
+    ss_tot = float(np.sum((y - y.mean()) ** 2))
+    return {
+        "a": math.exp(log_a),
+        "exponent": float(b),
+        "r2": 1.0 - ss_res / ss_tot if ss_tot > 0 else 1.0,
+        "points": len(ns),
+    }
+
+
+def _parse_cpus(spec: Optional[str], threads: int) -> List[int]:
+    if spec:
+        cpus: List[int] = []
+        for part in spec.split(","):
+            lo, _, hi = part.partition("-")
+            cpus.extend(range(int(lo), int(hi or lo) + 1))
+        return cpus
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))[:threads]
+    return []
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Comma-separated car counts")
+    parser.add_argument(
+        "--magnitudes", default=DEFAULT_MAGNITUDES, help="Comma-separated maximum lengths"
+    )
+    parser.add_argument("--backends", default=DEFAULT_BACKENDS, help="Comma-separated backends")
+    parser.add_argument("--repeats", type=int, default=3, help="Runs per cell (new instance seed)")
+    parser.add_argument("--threads", type=int, default=1, help="CPUs per run when --cpus is unset")
+    parser.add_argument("--cpus", help="CPU list to pin runs to, e.g. 0-3 or 0,2")
+    parser.add_argument("--time-limit", type=float, default=30.0, help="Seconds per solve")
+    parser.add_argument("--seed", type=int, default=0, help="Base seed for generated instances")
+    parser.add_argument("--output", help="Result JSON path (default: benchmarks/results/)")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    magnitudes = [int(float(m)) for m in args.magnitudes.split(",") if m.strip()]
+    backends = [b.strip() for b in args.backends.split(",") if b.strip()]
+    cpus = _parse_cpus(args.cpus, args.threads)
+
+    results: List[Dict[str, Any]] = []
+    for backend in backends:
+        for magnitude in magnitudes:
+            for n in sizes:
+                record: Dict[str, Any] = {
+                    "name": "solve",
+                    "backend": backend,
+                    "instance": f"n={n},max={magnitude}",
+                    "n": n,
+                    "magnitude": magnitude,
+                    "samples": [],
+                    "runs": [],
+                }
+                if backend == "dp" and n * magnitude // 4 > DP_MAX_BITS:
+                    record["skipped"] = "bitset larger than DP_MAX_BITS"
+                    results.append(record)
+                    print(f"{backend:8} n={n:<7} max={magnitude:<14.0e} skipped", flush=True)
+                    continue
+                for repeat in range(args.repeats):
+                    seed = args.seed + repeat
+                    run = run_cell(backend, n, magnitude, seed, cpus, args.time_limit)
+                    run["seed"] = seed
+                    record["runs"].append(run)
+                    if "wall" in run:
+                        record["samples"].append(run["wall"])
+                walls = record["samples"]
+                statuses = sorted({run["status"] for run in record["runs"]})
+                median = format_seconds(statistics.median(walls)) if walls else "-"
+                print(
+                    f"{backend:8} n={n:<7} max={magnitude:<14.0e} median={median:>10} "
+                    f"status={','.join(statuses)}",
+                    flush=True,
+                )
+                results.append(record)
+
+    # Scaling fits over cells where every run proved optimality.
+    fits = []
+    for backend in backends:
+        for magnitude in magnitudes:
+            cells = [
+                r
+                for r in results
+                if r["backend"] == backend
+                and r["magnitude"] == magnitude
+                and r["runs"]
+                and all(run.get("time_to_optimal") is not None for run in r["runs"])
+            ]
+            fit = fit_power_law(
+                [r["n"] for r in cells], [statistics.median(r["samples"]) for r in cells]
+            )
+            if fit is None:
+                continue
+            fits.append({"backend": backend, "magnitude": magnitude, **fit})
+            print(
+                f"[fit] {backend:8} max={magnitude:<14.0e} t ~ {fit['a']:.3g} * n^{fit['exponent']:.2f} "
+                f"(r2={fit['r2']:.3f}, {fit['points']} sizes)",
+                flush=True,
+            )
+
+    output = Path(args.output) if args.output else default_output("scaling")
+    config = {
+        "sizes": sizes,
+        "magnitudes": magnitudes,
+        "backends": backends,
+        "repeats": args.repeats,
+        "cpus": cpus,
+        "time_limit": args.time_limit,
+        "seed": args.seed,
+    }
+    write_results(output, "scaling", config, results, extra={"fits": fits})
+    print(f"[scaling] wrote {output}")
+
+
+if __name__ == "__main__":
+    main()
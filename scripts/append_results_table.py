@@ -3,19 +3,20 @@
 
 from __future__ import annotations
 
-import csv
+import sys
 from pathlib import Path
 
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from parking_problem import results  # noqa: E402
+
 CSV_PATH = Path("reports/solver_comparison.csv")
 MD_PATH = Path("reports/parking_problem_report.md")
 
 
 def main() -> None:
-    rows = []
-    with CSV_PATH.open("r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            rows.append(row)
+    rows = results.load_report_rows(CSV_PATH)
 
     lines = MD_PATH.read_text(encoding="utf-8").splitlines()
 
@@ -5,29 +5,13 @@ from __future__ import annotations
 
 import argparse
 import json
-import random
+import sys
 from pathlib import Path
 
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
 
-def gen_uniform(n: int, lo: float, hi: float, seed: int) -> list[float]:
-    rng = random.Random(seed)
-    return [round(rng.uniform(lo, hi), 2) for _ in range(n)]
-
-
-def gen_bimodal(n: int, lo1: float, hi1: float, lo2: float, hi2: float, seed: int) -> list[float]:
-    rng = random.Random(seed)
-    out: list[float] = []
-    for _ in range(n):
-        if rng.random() < 0.5:
-            out.append(round(rng.uniform(lo1, hi1), 2))
-        else:
-            out.append(round(rng.uniform(lo2, hi2), 2))
-    return out
-
-
-def gen_narrow(n: int, center: float, spread: float, seed: int) -> list[float]:
-    rng = random.Random(seed)
-    return [round(center + rng.uniform(-spread, spread), 2) for _ in range(n)]
+from parking_problem.generators import gen_bimodal, gen_narrow, gen_uniform  # noqa: E402
 
 
 def write_instance(out_dir: Path, name: str, lengths: list[float]) -> None:
@@ -3,22 +3,23 @@
 
 from __future__ import annotations
 
-import csv
+import sys
 from pathlib import Path
 from datetime import datetime
 
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from parking_problem import results  # noqa: E402
+
 CSV_PATH = Path("reports/solver_comparison.csv")
 OUT_TEX = Path("reports/parking_problem_report.tex")
 PLOTS_DIR = Path("reports/plots")
 
 
 def load_table():
-    rows = []
-    with CSV_PATH.open("r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            rows.append(row)
-    return rows
+    # The results database when generate_report.py has built one, else the CSV.
+    return results.load_report_rows(CSV_PATH)
 
 
 def esc_tex(s: str) -> str:
@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-import csv
+import sys
 from pathlib import Path
 from datetime import datetime
 
@@ -12,18 +12,19 @@ from reportlab.lib.units import cm
 from reportlab.pdfgen import canvas
 from reportlab.lib.utils import ImageReader
 
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from parking_problem import results  # noqa: E402
+
 CSV_PATH = Path("reports/solver_comparison.csv")
 PLOTS_DIR = Path("reports/plots")
 OUT_PDF = Path("reports/solver_report.pdf")
 
 
 def read_csv():
-    rows = []
-    with CSV_PATH.open("r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            rows.append(row)
-    return rows
+    # The results database when generate_report.py has built one, else the CSV.
+    return results.load_report_rows(CSV_PATH)
 
 
 def draw_wrapped_text(c, text, x, y, width, leading=14):
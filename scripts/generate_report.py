@@ -3,66 +3,42 @@
 
 from __future__ import annotations
 
-import re
+import argparse
+import sys
 from pathlib import Path
-from typing import Dict, Tuple, List
+from typing import List
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from parking_problem import results  # noqa: E402
 
 LOG_DIR = Path("tests/logs")
 OUT_MD = Path("reports/solver_comparison.md")
 OUT_CSV = Path("reports/solver_comparison.csv")
 
-STATUS_RE = re.compile(r"^\[result\] status=(.+?) max_side=([0-9.eE+-]+)")
-TIME_RE = re.compile(r"^\[convergence\] ([0-9.]+),")
-
-
-def parse_log(path: Path) -> Dict[str, str]:
-    data = {
-        "log": path.name,
-        "instance": path.name.split("_", 1)[1].rsplit("_", 1)[0],
-        "solver": path.name.split("_")[-2],
-        "status": "",
-        "max_side": "",
-        "time_sec": "",
-        "conv_points": "0",
-    }
-    lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
-    conv_points = 0
-    for line in lines:
-        m = STATUS_RE.search(line)
-        if m:
-            data["status"] = m.group(1)
-            data["max_side"] = m.group(2)
-        if line.startswith("[convergence]") and "time_sec" not in line:
-            conv_points += 1
-            if data["time_sec"] == "":
-                tm = TIME_RE.search(line)
-                if tm:
-                    data["time_sec"] = tm.group(1)
-    data["conv_points"] = str(conv_points)
-    return data
-
 
 def main() -> None:
-    logs = sorted(LOG_DIR.glob("output_*.log"))
-    rows = [parse_log(p) for p in logs]
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logs-dir", default=str(LOG_DIR))
+    parser.add_argument("--db", default=results.db_path(), help="Results database (RESULTS_DB_PATH)")
+    parser.add_argument(
+        "--telemetry", action="append", default=[], help="Telemetry JSONL file to ingest as well"
+    )
+    args = parser.parse_args()
+
+    # Only logs and telemetry not seen before are parsed; earlier runs come from the db.
+    conn = results.connect(args.db)
+    ingested = results.ingest_logs(conn, args.logs_dir)
+    for path in args.telemetry:
+        results.ingest_telemetry(conn, path)
+    rows = results.report_rows(conn)
+    conn.close()
+    print(f"Ingested {ingested} new logs into {args.db} ({len(rows)} runs)")
 
     OUT_MD.parent.mkdir(parents=True, exist_ok=True)
 
-    # CSV
-    with OUT_CSV.open("w", encoding="utf-8") as f:
-        f.write("instance,solver,status,max_side,time_sec,conv_points,log\n")
-        for r in rows:
-            f.write(",".join(
-                [
-                    r["instance"],
-                    r["solver"],
-                    r["status"],
-                    r["max_side"],
-                    r["time_sec"],
-                    r["conv_points"],
-                    r["log"],
-                ]
-            ) + "\n")
+    results.write_csv(OUT_CSV, rows)
 
     # Markdown
     lines: List[str] = []
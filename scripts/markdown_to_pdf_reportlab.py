@@ -3,6 +3,10 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet
@@ -17,19 +21,39 @@ import re
 
 IN_MD = Path("reports/parking_problem_report.md")
 OUT_PDF = Path("reports/parking_problem_report_pretty.pdf")
-
-
-def _render_math_to_image(expr: str, out_dir: Path) -> Path:
-    out_dir.mkdir(parents=True, exist_ok=True)
-    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".png", dir=out_dir)
+PLOTS_DIR = Path("reports/plots")
+# Rendered formulas, named by the hash of expression and settings.
+MATH_DIR = PLOTS_DIR / "math"
+MATH_SETTINGS = {"dpi": 200, "fontsize": 12, "fallback_fontsize": 11, "pad_inches": 0.05}
+
+_BLOCK_MATH = "[[BLOCK_MATH:"
+_INLINE_MATH_RE = re.compile(r"\[\[INLINE_MATH:(.*?)\]\]")
+
+
+def _math_path(expr: str) -> Path:
+    key = json.dumps([expr, MATH_SETTINGS, matplotlib.__version__], sort_keys=True)
+    return MATH_DIR / f"{hashlib.sha256(key.encode()).hexdigest()[:20]}.png"
+
+
+def _render_math_to_image(expr: str, out_path: Path) -> Path:
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    # Written aside and renamed, so a reader never sees half a PNG.
+    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".png", dir=out_path.parent)
+    tmp.close()
+    save = dict(
+        dpi=MATH_SETTINGS["dpi"],
+        bbox_inches="tight",
+        pad_inches=MATH_SETTINGS["pad_inches"],
+        transparent=True,
+    )
     try:
         fig = plt.figure()
-        fig.text(0.01, 0.5, f"${expr}$", fontsize=12)
+        fig.text(0.01, 0.5, f"${expr}$", fontsize=MATH_SETTINGS["fontsize"])
         fig.patch.set_alpha(0.0)
-        fig.savefig(tmp.name, dpi=200, bbox_inches="tight", pad_inches=0.05, transparent=True)
+        fig.savefig(tmp.name, **save)
         plt.close(fig)
-        return Path(tmp.name)
     except Exception:
+        plt.close("all")
         # Fallback: render as plain text without LaTeX
         clean = expr
         clean = clean.replace("\\\\", "\n")
@@ -43,11 +67,47 @@ def _render_math_to_image(expr: str, out_dir: Path) -> Path:
         clean = clean.replace("\\forall", "forall")
         clean = clean.replace("\\in", "in")
         fig = plt.figure()
-        fig.text(0.01, 0.5, clean, fontsize=11)
+        fig.text(0.01, 0.5, clean, fontsize=MATH_SETTINGS["fallback_fontsize"])
         fig.patch.set_alpha(0.0)
-        fig.savefig(tmp.name, dpi=200, bbox_inches="tight", pad_inches=0.05, transparent=True)
+        fig.savefig(tmp.name, **save)
         plt.close(fig)
-        return Path(tmp.name)
+    os.replace(tmp.name, out_path)
+    return out_path
+
+
+def _math_exprs(lines: list[str]) -> set[str]:
+    exprs = set()
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith(_BLOCK_MATH) and stripped.endswith("]]"):
+            exprs.add(stripped[len(_BLOCK_MATH):-2].strip())
+        for expr in _INLINE_MATH_RE.findall(line):
+            if expr.strip():
+                exprs.add(expr.strip())
+    return exprs
+
+
+def render_math(exprs: set[str], workers: int | None = None) -> dict[str, Path]:
+    """Image per expression; only formulas not rendered by an earlier build are drawn."""
+    images = {expr: _math_path(expr) for expr in exprs}
+    missing = sorted(expr for expr, path in images.items() if not path.exists())
+    workers = min(workers or os.cpu_count() or 1, len(missing))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_render_math_to_image, missing, [images[e] for e in missing]))
+    else:
+        for expr in missing:
+            _render_math_to_image(expr, images[expr])
+    return images
+
+
+def remove_orphans(keep: set[Path]) -> int:
+    """Delete cached formulas this report no longer uses, and old tempfile litter."""
+    orphans = {p for p in MATH_DIR.glob("*.png") if p not in keep}
+    orphans.update(PLOTS_DIR.glob("tmp*.png"))
+    for path in orphans:
+        path.unlink(missing_ok=True)
+    return len(orphans)
 
 
 def _preprocess_markdown(text: str) -> list[str]:
@@ -61,7 +121,7 @@ def _preprocess_markdown(text: str) -> list[str]:
     return text.splitlines()
 
 
-def parse_markdown(lines: list[str]):
+def parse_markdown(lines: list[str], math_images: dict[str, Path]):
     styles = getSampleStyleSheet()
     flow = []
     i = 0
@@ -76,8 +136,7 @@ def parse_markdown(lines: list[str]):
         # Block math token
         if line.strip().startswith("[[BLOCK_MATH:") and line.strip().endswith("]]"):
             expr = line.strip()[13:-2].strip()
-            img = _render_math_to_image(expr, Path("reports/plots"))
-            flow.append(Image(str(img), width=400, height=40))
+            flow.append(Image(str(math_images[expr]), width=400, height=40))
             flow.append(Spacer(1, 8))
             i += 1
             continue
@@ -121,8 +180,7 @@ def parse_markdown(lines: list[str]):
                 if part.startswith("[[INLINE_MATH:") and part.endswith("]]"):
                     expr = part[14:-2].strip()
                     if expr:
-                        img = _render_math_to_image(expr, Path("reports/plots"))
-                        flow.append(Image(str(img), width=120, height=20))
+                        flow.append(Image(str(math_images[expr]), width=120, height=20))
                 else:
                     if part.strip():
                         flow.append(Paragraph(part, styles["BodyText"]))
@@ -135,12 +193,14 @@ def parse_markdown(lines: list[str]):
 def main() -> None:
     text = IN_MD.read_text(encoding="utf-8")
     lines = _preprocess_markdown(text)
-    flow = parse_markdown(lines)
+    math_images = render_math(_math_exprs(lines))
+    flow = parse_markdown(lines, math_images)
 
     OUT_PDF.parent.mkdir(parents=True, exist_ok=True)
     doc = SimpleDocTemplate(str(OUT_PDF), pagesize=A4, rightMargin=40, leftMargin=40, topMargin=40, bottomMargin=40)
     doc.build(flow)
-    print(f"Wrote {OUT_PDF}")
+    removed = remove_orphans(set(math_images.values()))
+    print(f"Wrote {OUT_PDF} ({len(math_images)} formulas, {removed} stale images removed)")
 
 
 if __name__ == "__main__":
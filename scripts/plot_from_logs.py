@@ -4,9 +4,29 @@
 from __future__ import annotations
 
 import argparse
+import gzip
+import json
 import re
+import sys
 from pathlib import Path
 
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from parking_problem import plotting  # noqa: E402
+
+
+def read_log(path: Path) -> str:
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8", errors="ignore") as f:
+        return f.read()
+
+
+def sidecar_path(log_path: Path) -> Path:
+    """convergence_<run>.json next to output_<run>.log[.gz]."""
+    run = log_path.name.replace("output_", "", 1).split(".log")[0]
+    return log_path.with_name(f"convergence_{run}.json")
+
 
 def parse_convergence_lines(log_text: str) -> list[tuple[float, float]]:
     points = []
@@ -24,13 +44,13 @@ def parse_convergence_lines(log_text: str) -> list[tuple[float, float]]:
 
 
 def parse_ortools(log_text: str) -> list[tuple[float, float]]:
-    pattern = re.compile(r"^#\\d+\\s+(\\d+\\.?\\d*)s\\s+best:([0-9.]+)", re.MULTILINE)
+    pattern = re.compile(r"^#\d+\s+(\d+\.?\d*)s\s+best:([0-9.]+)", re.MULTILINE)
     return [(float(m.group(1)), float(m.group(2))) for m in pattern.finditer(log_text)]
 
 
 def parse_cbc(log_text: str) -> list[tuple[float, float]]:
     pattern = re.compile(
-        r",\\s*([0-9.]+)\\s*best solution,\\s*best possible\\s*([0-9.]+)\\s*\\((\\d+\\.?\\d*) seconds\\)",
+        r",\s*([0-9.]+)\s*best solution,\s*best possible\s*([0-9.]+)\s*\((\d+\.?\d*) seconds\)",
         re.IGNORECASE,
     )
     points = []
@@ -45,8 +65,8 @@ def parse_cbc(log_text: str) -> list[tuple[float, float]]:
 
 def parse_highs_convergence(log_text: str) -> list[tuple[float, float]]:
     # Heuristic: capture lines like "Objective value:  28.6" with nearby "Time"
-    obj_pattern = re.compile(r"Objective value:\\s*([0-9.+-eE]+)")
-    time_pattern = re.compile(r"Time \\(Wallclock seconds\\):\\s*([0-9.]+)")
+    obj_pattern = re.compile(r"Objective value:\s*([0-9.+-eE]+)")
+    time_pattern = re.compile(r"Time \(Wallclock seconds\):\s*([0-9.]+)")
     points = []
     last_time = None
     for line in log_text.splitlines():
@@ -60,47 +80,38 @@ def parse_highs_convergence(log_text: str) -> list[tuple[float, float]]:
     return points
 
 
-def plot(points: list[tuple[float, float]], out_path: Path, title: str) -> None:
-    import matplotlib
-
-    matplotlib.use("Agg")
-    import matplotlib.pyplot as plt  # noqa: E402
-
-    if not points:
-        return
-    points = sorted(points, key=lambda x: x[0])
-    times = [p[0] for p in points]
-    objs = [p[1] for p in points]
-
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.figure(figsize=(6, 4))
-    plt.plot(times, objs, marker="o", linewidth=1)
-    plt.title(title)
-    plt.xlabel("Time (s)")
-    plt.ylabel("Objective (max side)")
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(out_path, dpi=150)
-    plt.close()
-
-
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--logs-dir", default="tests/logs")
     parser.add_argument("--out-dir", default="tests/plots")
-    parser.add_argument("--pattern", default="output_*.log")
+    parser.add_argument("--pattern", default="output_*.log*")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Render processes (default: all CPUs)"
+    )
     args = parser.parse_args()
 
     logs_dir = Path(args.logs_dir)
     out_dir = Path(args.out_dir)
 
+    jobs = []
     for log_path in sorted(logs_dir.glob(args.pattern)):
-        text = log_path.read_text(encoding="utf-8", errors="ignore")
+        run = sidecar_path(log_path)
+        title = log_path.name.split(".log")[0]
+        out_path = out_dir / f"{title}.png"
+        # The runner's sidecar holds the points already; no need to open the log.
+        if run.exists():
+            points = json.loads(run.read_text(encoding="utf-8"))["points"]
+            if points:
+                jobs.append(plotting.convergence_job(points, out_path, title))
+            continue
+
+        text = read_log(log_path)
         points = parse_convergence_lines(text)
+        # Logs from before the combined format kept the solver trace apart.
         solver_log_path = logs_dir / log_path.name.replace("output_", "solver_")
         solver_text = ""
         if solver_log_path.exists():
-            solver_text = solver_log_path.read_text(encoding="utf-8", errors="ignore")
+            solver_text = read_log(solver_log_path)
 
         if len(points) <= 1:
             # try fallback parsers (prefer solver log if available)
@@ -112,9 +123,12 @@ def main() -> None:
             elif "highs" in log_path.name or "pyomo" in log_path.name:
                 points = parse_highs_convergence(target_text)
 
-        title = log_path.stem
-        out_path = out_dir / f"{log_path.stem}.png"
-        plot(points, out_path, title)
+        if points:
+            jobs.append(plotting.convergence_job(points, out_path, title))
+
+    # Charts whose points did not change since the last run are skipped.
+    rendered, skipped = plotting.render_all(jobs, workers=args.workers)
+    print(f"Rendered {rendered} plots into {out_dir}, {skipped} unchanged")
 
 
 if __name__ == "__main__":
@@ -1 +1,7 @@
 """Parking Problem package."""
+
+from .batch import solve_many
+from .incremental import IncrementalPartitioner
+from .solver_main import solve
+
+__all__ = ["IncrementalPartitioner", "solve", "solve_many"]
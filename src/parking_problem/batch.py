@@ -0,0 +1,75 @@
+"""Batch solving of many instances across a process pool."""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .solver_main import solve
+from .solvers.base import Solution
+
+
+def _solve_chunk(chunk: List[List[float]], backend: str, pyomo_solver: str) -> List[Solution]:
+    return [solve(lengths, backend, pyomo_solver) for lengths in chunk]
+
+
+def solve_many(
+    instances: Iterable[List[float]],
+    backend: str,
+    pyomo_solver: str = "highs",
+    workers: Optional[int] = None,
+    ordered: bool = True,
+    chunksize: int = 1,
+    max_in_flight: Optional[int] = None,
+) -> Iterator[Tuple[int, Solution]]:
+    """Solve instances across a process pool, yielding (index, Solution) pairs.
+
+    Pairs come back in input order when ``ordered`` is true and in completion
+    order otherwise. Instances are sent to workers ``chunksize`` at a time, and
+    at most ``max_in_flight`` chunks (default: twice the worker count) are
+    pending or buffered at once, so ``instances`` may be an unbounded stream.
+    """
+    workers = workers or os.cpu_count() or 1
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be >= 1, got {chunksize}")
+    if workers == 1:
+        for index, lengths in enumerate(instances):
+            yield index, solve(lengths, backend, pyomo_solver)
+        return
+
+    limit = max(1, max_in_flight or 2 * workers)
+    source = iter(instances)
+    next_start = 0
+    next_yield = 0
+    pending: Dict[Future, int] = {}
+    finished: Dict[int, List[Solution]] = {}
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while True:
+            if ordered:
+                while next_yield in finished:
+                    solutions = finished.pop(next_yield)
+                    for offset, solution in enumerate(solutions):
+                        yield next_yield + offset, solution
+                    next_yield += len(solutions)
+
+            while len(pending) + len(finished) < limit:
+                chunk = list(islice(source, chunksize))
+                if not chunk:
+                    break
+                pending[pool.submit(_solve_chunk, chunk, backend, pyomo_solver)] = next_start
+                next_start += len(chunk)
+
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                start = pending.pop(future)
+                solutions = future.result()
+                if ordered:
+                    finished[start] = solutions
+                    continue
+                for offset, solution in enumerate(solutions):
+                    yield start + offset, solution
@@ -0,0 +1,133 @@
+"""Content-addressed cache of optimal solutions, keyed by the length multiset."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .solvers.base import Solution, is_optimal, make_solution, scale_lengths
+
+
+@dataclass(frozen=True)
+class _Entry:
+    status: str
+    gap: Optional[float]
+    positions: List[int]
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS solutions (
+    key TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    gap REAL,
+    positions TEXT NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS solutions_last_used ON solutions (last_used);
+"""
+
+_memory: "OrderedDict[Tuple[str, str], _Entry]" = OrderedDict()
+_connections: Dict[Tuple[int, str], sqlite3.Connection] = {}
+
+
+def _cache_path() -> str:
+    return os.getenv("SOLUTION_CACHE_PATH", "")
+
+
+def _max_entries() -> int:
+    try:
+        return max(1, int(os.getenv("SOLUTION_CACHE_MAX_ENTRIES", "10000")))
+    except ValueError:
+        return 10000
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    # One connection per process; a forked child must not reuse the parent's.
+    key = (os.getpid(), path)
+    conn = _connections.get(key)
+    if conn is None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        _connections[key] = conn
+    return conn
+
+
+def _canonical(lengths: List[float]) -> Tuple[List[int], List[int], int]:
+    scaled, factor = scale_lengths(lengths)
+    order = sorted(range(len(scaled)), key=scaled.__getitem__)
+    return scaled, order, factor
+
+
+def _key(scaled: List[int], order: List[int], factor: int, backend: str, options: str) -> str:
+    digest = hashlib.sha256(f"{backend}|{options}|{factor}|".encode())
+    digest.update(",".join(str(scaled[i]) for i in order).encode())
+    return digest.hexdigest()
+
+
+def _remember(key: Tuple[str, str], entry: _Entry) -> None:
+    _memory[key] = entry
+    _memory.move_to_end(key)
+    while len(_memory) > _max_entries():
+        _memory.popitem(last=False)
+
+
+def lookup(lengths: List[float], backend: str, options: str = "") -> Optional[Solution]:
+    """Cached optimal solution for any permutation of ``lengths``, if present."""
+    path = _cache_path()
+    if not path:
+        return None
+    scaled, order, factor = _canonical(lengths)
+    key = _key(scaled, order, factor, backend, options)
+
+    entry = _memory.get((path, key))
+    if entry is not None:
+        _memory.move_to_end((path, key))
+    else:
+        conn = _connect(path)
+        row = conn.execute(
+            "SELECT status, gap, positions FROM solutions WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        conn.execute("UPDATE solutions SET last_used = ? WHERE key = ?", (time.time(), key))
+        entry = _Entry(status=row[0], gap=row[1], positions=json.loads(row[2]))
+        _remember((path, key), entry)
+
+    # Positions refer to the sorted order; map them back through this
+    # instance's permutation.
+    side_a = [order[p] for p in entry.positions]
+    return make_solution(lengths, side_a, entry.status, gap=entry.gap)
+
+
+def store(lengths: List[float], backend: str, solution: Solution, options: str = "") -> None:
+    """Store an optimal solution and evict the least recently used overflow."""
+    path = _cache_path()
+    if not path or not is_optimal(solution):
+        return
+    scaled, order, factor = _canonical(lengths)
+    key = _key(scaled, order, factor, backend, options)
+    in_a = set(solution.side_a)
+    positions = [p for p, i in enumerate(order) if i in in_a]
+    entry = _Entry(status=solution.status, gap=solution.gap, positions=positions)
+    _remember((path, key), entry)
+
+    conn = _connect(path)
+    conn.execute(
+        "INSERT OR REPLACE INTO solutions (key, status, gap, positions, last_used) "
+        "VALUES (?, ?, ?, ?, ?)",
+        (key, entry.status, entry.gap, json.dumps(positions), time.time()),
+    )
+    conn.execute(
+        "DELETE FROM solutions WHERE key IN ("
+        "SELECT key FROM solutions ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+        (_max_entries(),),
+    )
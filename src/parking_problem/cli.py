@@ -4,9 +4,14 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
+from collections import deque
+from dataclasses import asdict
+from itertools import count
 from pathlib import Path
-from typing import List
+from typing import Any, Deque, Dict, Iterator, List, Optional, TextIO, Tuple
 
+from .batch import solve_many
 from .solver_main import solve
 from .validator import validate_lengths, validate_solution
 
@@ -43,6 +48,74 @@ def _get_instance(name: str, instance_file: str | None) -> List[float]:
     raise SystemExit(f"Unknown instance: {name}")
 
 
+def _parse_line(line: str, line_no: int, expected_count: int | None) -> Tuple[Any, List[float]]:
+    payload = json.loads(line)
+    if isinstance(payload, dict):
+        instance_id = payload.get("id", line_no)
+        lengths = payload.get("lengths")
+    else:
+        instance_id, lengths = line_no, payload
+    if not isinstance(lengths, list):
+        raise ValueError("Expected a JSON list of lengths or an object with 'lengths'")
+    validate_lengths(lengths, expected_count=expected_count)
+    return instance_id, lengths
+
+
+def _write(out: TextIO, record: Dict[str, Any]) -> None:
+    out.write(json.dumps(record) + "\n")
+    out.flush()
+
+
+def _stream(args: argparse.Namespace, source: TextIO, out: TextIO) -> None:
+    """Solve one JSON instance per input line, writing one JSON result per line.
+
+    Lines that fail to parse or validate produce an ``error`` record instead of
+    stopping the stream. With ``--ordered`` every record keeps input order.
+    """
+    # solve_many index -> (line number, id, lengths) for instances in flight.
+    accepted: Dict[int, Tuple[int, Any, List[float]]] = {}
+    # Error records held back so ordered output stays in input order.
+    held: Deque[Tuple[int, Dict[str, Any]]] = deque()
+    next_index = count()
+
+    def flush_errors(before: Optional[int]) -> None:
+        while held and (before is None or held[0][0] < before):
+            _write(out, held.popleft()[1])
+
+    def instances() -> Iterator[List[float]]:
+        for line_no, line in enumerate(source, start=1):
+            if not line.strip():
+                continue
+            try:
+                instance_id, lengths = _parse_line(line, line_no, args.expected_count)
+            except ValueError as exc:
+                error = {"id": line_no, "error": str(exc)}
+                if args.ordered:
+                    held.append((line_no, error))
+                else:
+                    _write(out, error)
+                continue
+            accepted[next(next_index)] = (line_no, instance_id, lengths)
+            yield lengths
+
+    results = solve_many(
+        instances(),
+        args.solver,
+        args.pyomo_solver,
+        workers=args.workers,
+        ordered=args.ordered,
+        chunksize=args.chunksize,
+        max_in_flight=args.max_in_flight,
+    )
+    for index, solution in results:
+        line_no, instance_id, lengths = accepted.pop(index)
+        validate_solution(lengths, solution)
+        if args.ordered:
+            flush_errors(line_no)
+        _write(out, {"id": instance_id, **asdict(solution)})
+    flush_errors(None)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument(
@@ -56,7 +129,7 @@ def main() -> None:
     )
     parser.add_argument(
         "--solver",
-        choices=["ortools", "pulp", "highs", "pyomo"],
+        choices=["ortools", "pulp", "highs", "pyomo", "dp", "kk", "ckk", "portfolio"],
         default="ortools",
         help="Choose open-source solver backend",
     )
@@ -66,10 +139,45 @@ def main() -> None:
         default="highs",
         help="Pyomo backend solver (used with --solver pyomo)",
     )
+    parser.add_argument(
+        "--expected-count",
+        type=int,
+        help="Reject instances that do not have exactly this many cars",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Read JSON instances line by line and write one JSON solution per line",
+    )
+    parser.add_argument(
+        "--input",
+        default="-",
+        help="JSON lines input for --stream (default: stdin)",
+    )
+    parser.add_argument(
+        "--ordered",
+        action="store_true",
+        help="Keep --stream output in input order",
+    )
+    parser.add_argument("--workers", type=int, help="Worker processes for --stream")
+    parser.add_argument(
+        "--chunksize", type=int, default=1, help="Instances per worker task for --stream"
+    )
+    parser.add_argument(
+        "--max-in-flight", type=int, help="Bound on chunks in flight for --stream"
+    )
     args = parser.parse_args()
 
+    if args.stream:
+        if args.input == "-":
+            _stream(args, sys.stdin, sys.stdout)
+        else:
+            with open(args.input, "r", encoding="utf-8") as source:
+                _stream(args, source, sys.stdout)
+        return
+
     lengths = _get_instance(args.instance, args.instance_file)
-    validate_lengths(lengths, expected_count=15)
+    validate_lengths(lengths, expected_count=args.expected_count)
     result = solve(lengths, args.solver, args.pyomo_solver)
     validate_solution(lengths, result)
 
@@ -77,6 +185,8 @@ def main() -> None:
     print("L (max side length):", result.max_side)
     print("side A indices:", result.side_a, "sum:", result.sum_a)
     print("side B indices:", result.side_b, "sum:", result.sum_b)
+    if result.gap is not None:
+        print("gap to ceil(sum/2):", result.gap)
 
 
 if __name__ == "__main__":
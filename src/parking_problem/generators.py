@@ -0,0 +1,51 @@
+"""Random instance generators for datasets, tuning and benchmarks."""
+
+from __future__ import annotations
+
+import random
+from typing import Dict, List
+
+
+def gen_uniform(n: int, lo: float, hi: float, seed: int, decimals: int = 2) -> List[float]:
+    rng = random.Random(seed)
+    return [round(rng.uniform(lo, hi), decimals) for _ in range(n)]
+
+
+def gen_bimodal(
+    n: int, lo1: float, hi1: float, lo2: float, hi2: float, seed: int, decimals: int = 2
+) -> List[float]:
+    rng = random.Random(seed)
+    out: List[float] = []
+    for _ in range(n):
+        if rng.random() < 0.5:
+            out.append(round(rng.uniform(lo1, hi1), decimals))
+        else:
+            out.append(round(rng.uniform(lo2, hi2), decimals))
+    return out
+
+
+def gen_narrow(n: int, center: float, spread: float, seed: int, decimals: int = 2) -> List[float]:
+    rng = random.Random(seed)
+    return [round(center + rng.uniform(-spread, spread), decimals) for _ in range(n)]
+
+
+def gen_integers(n: int, max_value: int, seed: int) -> List[float]:
+    """Integer lengths in [1, max_value]; floats stay exact up to 2**53."""
+    rng = random.Random(seed)
+    return [float(rng.randint(1, max_value)) for _ in range(n)]
+
+
+def benchmark_set(seed: int = 0) -> Dict[str, List[float]]:
+    """Generated instances spanning lot size, precision and duplicate ratio.
+
+    High-precision lengths on few cars are the hard partition regime (few
+    perfect splits, little for the LP bound to work with); two-decimal lengths
+    on many cars have many duplicates and are easy for the count model.
+    """
+    return {
+        "uniform_30_d6": gen_uniform(30, 1.0, 10.0, seed + 1, decimals=6),
+        "uniform_60_d4": gen_uniform(60, 1.0, 10.0, seed + 2, decimals=4),
+        "bimodal_100_d3": gen_bimodal(100, 0.1, 2.0, 8.0, 10.0, seed + 3, decimals=3),
+        "narrow_300_d2": gen_narrow(300, 5.0, 0.6, seed + 4),
+        "uniform_1000_d2": gen_uniform(1000, 1.0, 10.0, seed + 5),
+    }
@@ -0,0 +1,88 @@
+"""Incremental exact partitioning for a lot that changes one car at a time."""
+
+from __future__ import annotations
+
+from typing import Iterable, List, Optional
+
+from .solvers.base import Solution, make_solution, scale_lengths
+
+
+class IncrementalPartitioner:
+    """Keeps the reachable-sum bitsets of the current lot between updates.
+
+    ``_prefixes[i]`` has bit ``s`` set when some subset of the first ``i`` cars
+    sums to ``s``. Adding a car appends one prefix; removing car ``i`` only
+    rebuilds the prefixes after it, so removing recent arrivals is cheapest.
+    Indices shift down after a removal, like ``list.pop``.
+    """
+
+    def __init__(self, lengths: Iterable[float] = ()) -> None:
+        self._lengths: List[float] = []
+        self._scaled: List[int] = []
+        self._factor = 1
+        self._prefixes: List[int] = [1]
+        self._solution: Optional[Solution] = None
+        for length in lengths:
+            self._append(length)
+
+    @property
+    def lengths(self) -> List[float]:
+        return list(self._lengths)
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def add(self, length: float) -> Solution:
+        """Park a car of ``length`` and return the new optimal split."""
+        self._append(length)
+        return self.solution()
+
+    def remove(self, index: int) -> Solution:
+        """Remove the car at ``index`` and return the new optimal split."""
+        if not -len(self._lengths) <= index < len(self._lengths):
+            raise IndexError(f"No car at index {index}")
+        index %= len(self._lengths)
+        del self._lengths[index]
+        del self._scaled[index]
+        del self._prefixes[index + 1 :]
+        for w in self._scaled[index:]:
+            self._prefixes.append(self._prefixes[-1] | (self._prefixes[-1] << w))
+        self._solution = None
+        return self.solution()
+
+    def solution(self) -> Solution:
+        """Optimal split of the current lot."""
+        if self._solution is None:
+            self._solution = make_solution(self._lengths, self._best_subset(), "OPTIMAL")
+        return self._solution
+
+    def _append(self, length: float) -> None:
+        _, factor = scale_lengths([length])
+        if factor > self._factor:
+            # More decimals than the current scale can hold: rebuild once.
+            lengths = self._lengths + [length]
+            self._lengths, self._scaled, self._prefixes = [], [], [1]
+            self._factor = factor
+            for v in lengths:
+                self._push(v)
+        else:
+            self._push(length)
+        self._solution = None
+
+    def _push(self, length: float) -> None:
+        w = int(round(length * self._factor))
+        self._lengths.append(length)
+        self._scaled.append(w)
+        self._prefixes.append(self._prefixes[-1] | (self._prefixes[-1] << w))
+
+    def _best_subset(self) -> List[int]:
+        # Same walk-back as solver_dp.best_subset, over the stored prefixes.
+        half = sum(self._scaled) // 2
+        target = (self._prefixes[-1] & ((1 << (half + 1)) - 1)).bit_length() - 1
+        side_a: List[int] = []
+        for i in range(len(self._scaled) - 1, -1, -1):
+            if (self._prefixes[i] >> target) & 1:
+                continue
+            side_a.append(i)
+            target -= self._scaled[i]
+        return side_a
@@ -0,0 +1,180 @@
+"""Chart rendering for convergence logs and reports: parallel, cached and downsampled.
+
+Each chart is a ``PlotJob``: a kind of chart, an output path and the data to
+draw. ``render_all`` hashes every job's content and skips the ones whose hash
+matches the manifest kept next to their outputs, then draws the rest in a
+process pool. Long convergence series are reduced with LTTB before drawing.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+MANIFEST = ".plot_manifest.json"
+# Convergence lines beyond this many points are downsampled.
+MAX_POINTS = 2000
+# Bump when a renderer draws differently, so cached charts are redrawn.
+RENDER_VERSION = 1
+
+
+@dataclass(frozen=True)
+class PlotJob:
+    kind: str  # "line", "bar", "box", "grouped" or "scatter"
+    path: str
+    title: str
+    data: Dict[str, Any]
+    xlabel: str = ""
+    ylabel: str = ""
+    size: Tuple[float, float] = (6, 4)
+
+    def digest(self) -> str:
+        content = {k: v for k, v in asdict(self).items() if k != "path"}
+        payload = json.dumps([RENDER_VERSION, content], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def lttb(
+    points: Sequence[Sequence[float]], threshold: int = MAX_POINTS
+) -> List[Tuple[float, float]]:
+    """Largest-Triangle-Three-Buckets downsampling of (x, y) points sorted by x.
+
+    Keeps the first and last points and, per bucket, the point forming the
+    largest triangle with the previous pick and the next bucket's average.
+    """
+    n = len(points)
+    if threshold < 3 or n <= threshold:
+        return [(p[0], p[1]) for p in points]
+    bucket = (n - 2) / (threshold - 2)
+    sampled = [(points[0][0], points[0][1])]
+    a = 0
+    for i in range(threshold - 2):
+        avg_start = int((i + 1) * bucket) + 1
+        avg_end = min(int((i + 2) * bucket) + 1, n)
+        count = avg_end - avg_start
+        avg_x = sum(points[j][0] for j in range(avg_start, avg_end)) / count
+        avg_y = sum(points[j][1] for j in range(avg_start, avg_end)) / count
+
+        ax, ay = points[a][0], points[a][1]
+        best, best_area = int(i * bucket) + 1, -1.0
+        for j in range(int(i * bucket) + 1, int((i + 1) * bucket) + 1):
+            area = abs((ax - avg_x) * (points[j][1] - ay) - (ax - points[j][0]) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        sampled.append((points[best][0], points[best][1]))
+        a = best
+    sampled.append((points[-1][0], points[-1][1]))
+    return sampled
+
+
+def convergence_job(points: Sequence[Sequence[float]], path: str, title: str) -> PlotJob:
+    """Objective over time, sorted and downsampled."""
+    return PlotJob(
+        kind="line",
+        path=str(path),
+        title=title,
+        data={"points": lttb(sorted((p[0], p[1]) for p in points))},
+        xlabel="Time (s)",
+        ylabel="Objective (max side)",
+    )
+
+
+def render(job: PlotJob) -> None:
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt  # noqa: E402
+
+    data = job.data
+    Path(job.path).parent.mkdir(parents=True, exist_ok=True)
+    plt.figure(figsize=job.size)
+    if job.kind == "line":
+        xs = [p[0] for p in data["points"]]
+        ys = [p[1] for p in data["points"]]
+        plt.plot(xs, ys, marker="o" if len(xs) <= 200 else None, linewidth=1)
+        plt.grid(True, alpha=0.3)
+    elif job.kind == "bar":
+        plt.bar(data["labels"], data["values"])
+    elif job.kind == "box":
+        plt.boxplot(data["series"], labels=data["labels"], showfliers=True)
+    elif job.kind == "grouped":
+        groups, series = data["groups"], data["series"]
+        width = 0.8 / max(1, len(series))
+        for i, (name, values) in enumerate(series.items()):
+            plt.bar([g + i * width for g in range(len(groups))], values, width=width, label=name)
+        plt.xticks(
+            [g + width * (len(series) - 1) / 2 for g in range(len(groups))],
+            groups,
+            rotation=30,
+            ha="right",
+        )
+        plt.legend(fontsize=8)
+    elif job.kind == "scatter":
+        for name, pts in data["series"].items():
+            plt.scatter([p[0] for p in pts], [p[1] for p in pts], label=name, alpha=0.8)
+        plt.legend(fontsize=8)
+    else:
+        plt.close()
+        raise ValueError(f"Unknown plot kind: {job.kind}")
+    plt.title(job.title)
+    if job.xlabel:
+        plt.xlabel(job.xlabel)
+    if job.ylabel:
+        plt.ylabel(job.ylabel)
+    plt.tight_layout()
+    plt.savefig(job.path, dpi=150)
+    plt.close()
+
+
+def _load_manifest(directory: Path) -> Dict[str, str]:
+    try:
+        return json.loads((directory / MANIFEST).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(directory: Path, manifest: Dict[str, str]) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    tmp = directory / f"{MANIFEST}.{os.getpid()}"
+    tmp.write_text(json.dumps(manifest, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(tmp, directory / MANIFEST)
+
+
+def render_all(jobs: Sequence[PlotJob], workers: Optional[int] = None) -> Tuple[int, int]:
+    """Draw the jobs whose content changed; returns (rendered, skipped)."""
+    manifests: Dict[Path, Dict[str, str]] = {}
+    todo: List[Tuple[PlotJob, str]] = []
+    for job in jobs:
+        path = Path(job.path)
+        if path.parent not in manifests:
+            manifests[path.parent] = _load_manifest(path.parent)
+        digest = job.digest()
+        if manifests[path.parent].get(path.name) == digest and path.exists():
+            continue
+        todo.append((job, digest))
+
+    workers = min(workers or os.cpu_count() or 1, len(todo))
+    drawn: List[Tuple[PlotJob, str]] = []
+    try:
+        if workers <= 1:
+            for job, digest in todo:
+                render(job)
+                drawn.append((job, digest))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [(pool.submit(render, job), job, digest) for job, digest in todo]
+                for future, job, digest in futures:
+                    future.result()
+                    drawn.append((job, digest))
+    finally:
+        # Keep what was drawn even if one chart failed.
+        for job, digest in drawn:
+            manifests[Path(job.path).parent][Path(job.path).name] = digest
+        for directory in {Path(job.path).parent for job, _ in drawn}:
+            _save_manifest(directory, manifests[directory])
+    return len(todo), len(jobs) - len(todo)
@@ -0,0 +1,297 @@
+"""Incremental report build: ``python -m parking_problem.report build``.
+
+The scripts/ report chain is modelled as stages with declared inputs and
+outputs; a stage depends on the stages producing its inputs. A build hashes
+each stage's inputs (its script included) and reruns it only when they
+changed since its last successful run, or when one of its outputs is missing
+or was edited. Stages whose dependencies are done run in parallel.
+
+Hashes live in ``reports/.build_state.json``; file contents are rehashed only
+when their size or mtime changed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+STATE_PATH = "reports/.build_state.json"
+
+CSV = "reports/solver_comparison.csv"
+REPORT_MD = "reports/parking_problem_report.md"
+REPORT_PLOTS = tuple(
+    f"reports/plots/{name}.png"
+    for name in (
+        "avg_time_by_solver",
+        "time_boxplot_by_solver",
+        "avg_convergence_by_solver",
+        "convergence_boxplot_by_solver",
+        "avg_max_side_by_solver",
+        "time_by_instance",
+        "max_side_by_instance",
+        "conv_by_instance",
+    )
+)
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    script: str  # run with the project root as working directory
+    inputs: Tuple[str, ...]  # paths or glob patterns
+    outputs: Tuple[str, ...]
+
+
+STAGES: Tuple[Stage, ...] = (
+    Stage(
+        "results",
+        "scripts/generate_report.py",
+        ("tests/logs/output_*.log*", "tests/logs/convergence_*.json"),
+        (CSV, "reports/solver_comparison.md"),
+    ),
+    # Rewrites its own input: the appendix table of the report markdown.
+    Stage("table", "scripts/append_results_table.py", (CSV, REPORT_MD), (REPORT_MD,)),
+    Stage("plots", "scripts/plot_report.py", (CSV,), REPORT_PLOTS),
+    Stage(
+        "latex",
+        "scripts/generate_latex_report.py",
+        (CSV,),
+        ("reports/parking_problem_report.tex",),
+    ),
+    Stage(
+        "latex_full",
+        "scripts/md_to_latex_full.py",
+        (REPORT_MD,),
+        ("reports/parking_problem_report_full.tex",),
+    ),
+    Stage(
+        "pdf",
+        "scripts/generate_pdf_report.py",
+        (CSV,) + REPORT_PLOTS,
+        ("reports/solver_report.pdf",),
+    ),
+    Stage(
+        "pretty_pdf",
+        "scripts/markdown_to_pdf_reportlab.py",
+        (REPORT_MD,),
+        ("reports/parking_problem_report_pretty.pdf",),
+    ),
+)
+
+
+def _is_pattern(path: str) -> bool:
+    return glob.has_magic(path)
+
+
+class _Hasher:
+    """Content hashes by relative path, reusing cached ones while size and mtime hold."""
+
+    def __init__(self, root: Path, cache: Dict[str, List]) -> None:
+        self.root = root
+        self.cache = cache
+        self.seen: Set[str] = set()
+
+    def file(self, rel: str) -> Optional[str]:
+        self.seen.add(rel)
+        path = self.root / rel
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            self.cache.pop(rel, None)
+            return None
+        cached = self.cache.get(rel)
+        if cached is not None and cached[:2] == [st.st_size, st.st_mtime_ns]:
+            return cached[2]
+        digest = hashlib.sha256()
+        with path.open("rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        self.cache[rel] = [st.st_size, st.st_mtime_ns, digest.hexdigest()]
+        return digest.hexdigest()
+
+    def expand(self, patterns: Sequence[str]) -> List[str]:
+        paths: List[str] = []
+        for pattern in patterns:
+            if _is_pattern(pattern):
+                matches = glob.glob(str(self.root / pattern))
+                paths.extend(sorted(Path(m).relative_to(self.root).as_posix() for m in matches))
+            else:
+                paths.append(pattern)
+        return paths
+
+    def combined(self, patterns: Sequence[str]) -> str:
+        digest = hashlib.sha256()
+        for rel in self.expand(patterns):
+            digest.update(f"{rel}\0{self.file(rel) or '-'}\n".encode())
+        return digest.hexdigest()
+
+
+def dependencies(stages: Sequence[Stage]) -> Dict[str, Set[str]]:
+    """Stage name -> names of the stages producing one of its inputs."""
+    producers: Dict[str, str] = {}
+    for stage in stages:
+        for output in stage.outputs:
+            producers.setdefault(output, stage.name)
+    deps: Dict[str, Set[str]] = {}
+    for stage in stages:
+        deps[stage.name] = {
+            producers[i] for i in stage.inputs if producers.get(i, stage.name) != stage.name
+        }
+    return deps
+
+
+def _load_state(path: Path) -> Dict:
+    try:
+        state = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        state = {}
+    state.setdefault("files", {})
+    state.setdefault("stages", {})
+    return state
+
+
+def _save_state(path: Path, state: Dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(state, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _run(stage: Stage, root: Path) -> Tuple[int, str, float]:
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, str(root / stage.script)],
+        cwd=root,
+        capture_output=True,
+        text=True,
+    )
+    return proc.returncode, proc.stdout + proc.stderr, time.perf_counter() - start
+
+
+def build(
+    root: Path,
+    stages: Sequence[Stage] = STAGES,
+    jobs: Optional[int] = None,
+    force: bool = False,
+    dry_run: bool = False,
+    state_path: str = STATE_PATH,
+) -> Dict[str, str]:
+    """Bring every stage up to date; returns name -> built/fresh/failed/skipped.
+
+    With ``dry_run`` nothing runs and out-of-date stages (and their
+    dependents) are reported as stale.
+    """
+    root = root.resolve()
+    state_file = root / state_path
+    state = _load_state(state_file)
+    hasher = _Hasher(root, state["files"])
+    deps = dependencies(stages)
+    by_name = {stage.name: stage for stage in stages}
+    outcome: Dict[str, str] = {}
+    pending = [stage.name for stage in stages]
+    running: Dict[Future, Tuple[Stage, str]] = {}
+
+    def inputs_of(stage: Stage) -> Tuple[str, ...]:
+        return (stage.script,) + stage.inputs
+
+    def fresh(stage: Stage, digest: str) -> bool:
+        record = state["stages"].get(stage.name)
+        if force or record is None or record["inputs"] != digest:
+            return False
+        return all(hasher.file(o) == record["outputs"].get(o) for o in stage.outputs)
+
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+        while pending or running:
+            for name in list(pending):
+                stage = by_name[name]
+                if any(d not in outcome for d in deps[name]):
+                    continue
+                pending.remove(name)
+                if any(outcome[d] in ("failed", "skipped") for d in deps[name]):
+                    outcome[name] = "skipped"
+                    continue
+                # Dependencies are done, so their outputs exist unless this is a dry run.
+                upstream = {o for d in deps[name] for o in by_name[d].outputs}
+                missing = [
+                    i
+                    for i in inputs_of(stage)
+                    if not _is_pattern(i)
+                    and not (root / i).exists()
+                    and not (dry_run and i in upstream)
+                ]
+                if missing:
+                    print(f"[report] {name}: skipped, missing {', '.join(missing)}", flush=True)
+                    outcome[name] = "skipped"
+                    continue
+                digest = hasher.combined(inputs_of(stage))
+                stale_deps = any(outcome[d] == "stale" for d in deps[name])
+                if not stale_deps and fresh(stage, digest):
+                    outcome[name] = "fresh"
+                elif dry_run:
+                    print(f"[report] {name}: stale", flush=True)
+                    outcome[name] = "stale"
+                else:
+                    running[pool.submit(_run, stage, root)] = (stage, digest)
+            if not running:
+                if pending and all(any(d not in outcome for d in deps[n]) for n in pending):
+                    raise SystemExit(f"Report stages have a dependency cycle: {pending}")
+                continue
+
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in done:
+                stage, digest = running.pop(future)
+                code, output, seconds = future.result()
+                if code != 0:
+                    outcome[stage.name] = "failed"
+                    print(f"[report] {stage.name}: failed ({stage.script})", flush=True)
+                    print(output.rstrip(), flush=True)
+                    continue
+                outcome[stage.name] = "built"
+                print(f"[report] {stage.name}: built in {seconds:.1f}s", flush=True)
+                # A stage that rewrites one of its inputs is fresh at the new content.
+                if set(stage.inputs) & set(stage.outputs):
+                    digest = hasher.combined(inputs_of(stage))
+                state["stages"][stage.name] = {
+                    "inputs": digest,
+                    "outputs": {o: hasher.file(o) for o in stage.outputs},
+                }
+
+    if not dry_run:
+        # Forget files no stage looks at any more, e.g. deleted logs.
+        state["files"] = {rel: v for rel, v in state["files"].items() if rel in hasher.seen}
+        _save_state(state_file, state)
+    return outcome
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m parking_problem.report")
+    commands = parser.add_subparsers(dest="command", required=True)
+    cmd = commands.add_parser("build", help="Rebuild the report outputs whose inputs changed")
+    cmd.add_argument("--root", default=".", help="Project root (default: current directory)")
+    cmd.add_argument("--jobs", type=int, default=None, help="Stages run at once (default: CPUs)")
+    cmd.add_argument("--force", action="store_true", help="Rebuild every stage")
+    cmd.add_argument(
+        "--dry-run", action="store_true", help="List stale stages without running them"
+    )
+    args = parser.parse_args(argv)
+
+    outcome = build(Path(args.root), jobs=args.jobs, force=args.force, dry_run=args.dry_run)
+    kinds = ("stale", "fresh") if args.dry_run else ("built", "fresh")
+    counts = {k: sum(v == k for v in outcome.values()) for k in kinds + ("skipped", "failed")}
+    print("[report] " + ", ".join(f"{n} {k}" for k, n in counts.items()))
+    if counts["failed"]:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,348 @@
+"""SQLite store of solver runs, convergence points and solver stats for the reports.
+
+Ingestion is incremental: each runner log (``output_*.log[.gz]`` with its
+``convergence_*.json`` sidecar) or telemetry file is recorded with its size
+and mtime, and only new or changed files are parsed. Telemetry files are
+append-only, so a grown one is read from where the last ingestion stopped.
+"""
+
+from __future__ import annotations
+
+import csv
+import functools
+import gzip
+import json
+import os
+import re
+import sqlite3
+import subprocess
+from datetime import datetime
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+PathLike = Union[str, Path]
+
+DEFAULT_PATH = "reports/results.sqlite"
+
+REPORT_COLUMNS = ["instance", "solver", "status", "max_side", "time_sec", "conv_points", "log"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    run_key TEXT NOT NULL DEFAULT '',
+    log TEXT NOT NULL,
+    instance TEXT NOT NULL DEFAULT '',
+    backend TEXT NOT NULL DEFAULT '',
+    timestamp TEXT,
+    code_version TEXT,
+    status TEXT,
+    max_side REAL,
+    time_sec REAL,
+    UNIQUE (source, run_key)
+);
+CREATE INDEX IF NOT EXISTS runs_instance ON runs (instance);
+CREATE INDEX IF NOT EXISTS runs_backend ON runs (backend);
+CREATE INDEX IF NOT EXISTS runs_timestamp ON runs (timestamp);
+CREATE INDEX IF NOT EXISTS runs_code_version ON runs (code_version);
+
+CREATE TABLE IF NOT EXISTS convergence (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    t REAL NOT NULL,
+    objective REAL NOT NULL,
+    bound REAL
+);
+CREATE INDEX IF NOT EXISTS convergence_run ON convergence (run_id);
+
+CREATE TABLE IF NOT EXISTS solver_stats (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    value TEXT,
+    PRIMARY KEY (run_id, name)
+);
+
+CREATE TABLE IF NOT EXISTS ingested_files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    offset INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+_STATUS_RE = re.compile(r"^\[result\] status=(.+?) max_side=([0-9.eE+-]+)")
+_DONE_RE = re.compile(r"^\[done\] .*elapsed=([0-9.]+)s")
+_CONVERGENCE_RE = re.compile(r"^\[convergence\] ([0-9.eE+-]+),([0-9.eE+-]+),")
+# "name: value" lines of the [ortools_stats] / [pyomo_stats] blocks.
+_STAT_RE = re.compile(r"^\s*-?\s*([A-Za-z_][\w ]*?)\s*:\s*(.+?)\s*$")
+_TS_RE = re.compile(r"_(\d{8}-\d{6}-\d{6})\.log")
+
+
+def db_path() -> str:
+    return os.getenv("RESULTS_DB_PATH", DEFAULT_PATH)
+
+
+def connect(path: PathLike) -> sqlite3.Connection:
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), timeout=30, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA foreign_keys=ON")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+@functools.lru_cache(maxsize=None)
+def code_version() -> str:
+    """Git commit of the checkout, or the package version outside one."""
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        if out.returncode == 0 and out.stdout.strip():
+            return out.stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        pass
+    try:
+        return metadata.version("parking-problem")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _seen(conn: sqlite3.Connection, path: Path) -> Tuple[Optional[Tuple[int, int, int]], os.stat_result]:
+    st = path.stat()
+    row = conn.execute(
+        "SELECT size, mtime_ns, offset FROM ingested_files WHERE path = ?", (str(path),)
+    ).fetchone()
+    return row, st
+
+
+def _mark(conn: sqlite3.Connection, path: Path, st: os.stat_result, offset: int = 0) -> None:
+    conn.execute(
+        "INSERT OR REPLACE INTO ingested_files (path, size, mtime_ns, offset) VALUES (?, ?, ?, ?)",
+        (str(path), st.st_size, st.st_mtime_ns, offset),
+    )
+
+
+def _run_id(conn: sqlite3.Connection, source: str, run_key: str, log: str) -> int:
+    row = conn.execute(
+        "SELECT id FROM runs WHERE source = ? AND run_key = ?", (source, run_key)
+    ).fetchone()
+    if row is not None:
+        return row[0]
+    cur = conn.execute(
+        "INSERT INTO runs (source, run_key, log) VALUES (?, ?, ?)", (source, run_key, log)
+    )
+    return cur.lastrowid
+
+
+def _stats(conn: sqlite3.Connection, run_id: int, stats: Dict[str, Any]) -> None:
+    conn.executemany(
+        "INSERT OR REPLACE INTO solver_stats (run_id, name, value) VALUES (?, ?, ?)",
+        [(run_id, name, None if value is None else str(value)) for name, value in stats.items()],
+    )
+
+
+def _open_log(path: Path):
+    opener = gzip.open if path.suffix == ".gz" else open
+    return opener(path, "rt", encoding="utf-8", errors="ignore")
+
+
+def _parse_log(path: Path) -> Dict[str, Any]:
+    """Summary, convergence points and engine stats from one pass over a runner log."""
+    name = path.name.replace("output_", "", 1).split(".log")[0]
+    ts = _TS_RE.search(path.name)
+    summary: Dict[str, Any] = {
+        # Legacy names: output_<instance>_<solver>_<timestamp>.log
+        "instance": name.rsplit("_", 2)[0],
+        "solver": name.rsplit("_", 2)[-2] if name.count("_") >= 2 else "",
+        "timestamp": (
+            datetime.strptime(ts.group(1), "%Y%m%d-%H%M%S-%f").isoformat() if ts else None
+        ),
+        "status": None,
+        "max_side": None,
+        "time_sec": None,
+        "points": [],
+        "stats": {},
+    }
+    in_stats = False
+    with _open_log(path) as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if line.startswith("["):
+                in_stats = line.endswith("_stats]")
+                m = _STATUS_RE.search(line)
+                if m:
+                    summary["status"] = m.group(1)
+                    summary["max_side"] = float(m.group(2))
+                    continue
+                m = _DONE_RE.search(line)
+                if m:
+                    summary["time_sec"] = float(m.group(1))
+                    continue
+                m = _CONVERGENCE_RE.search(line)
+                if m:
+                    summary["points"].append((float(m.group(1)), float(m.group(2))))
+                continue
+            if in_stats:
+                m = _STAT_RE.match(line)
+                if m:
+                    summary["stats"][m.group(1).strip().replace(" ", "_").lower()] = m.group(2)
+
+    sidecar = path.with_name(f"convergence_{name}.json")
+    if sidecar.exists():
+        summary.update(json.loads(sidecar.read_text(encoding="utf-8")))
+    return summary
+
+
+def _ingest_log(conn: sqlite3.Connection, path: Path, st: os.stat_result) -> None:
+    summary = _parse_log(path)
+    source = str(path)
+    conn.execute("BEGIN")
+    try:
+        # A changed file replaces what it contributed before.
+        conn.execute("DELETE FROM runs WHERE source = ?", (source,))
+        run_id = _run_id(conn, source, "", path.name)
+        conn.execute(
+            "UPDATE runs SET instance = ?, backend = ?, timestamp = ?, code_version = ?, "
+            "status = ?, max_side = ?, time_sec = ? WHERE id = ?",
+            (
+                summary["instance"],
+                summary["solver"],
+                summary["timestamp"],
+                summary.get("code_version"),
+                summary["status"],
+                summary["max_side"],
+                summary["time_sec"],
+                run_id,
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO convergence (run_id, t, objective, bound) VALUES (?, ?, ?, ?)",
+            [(run_id, p[0], p[1], p[2] if len(p) > 2 else None) for p in summary["points"]],
+        )
+        _stats(conn, run_id, summary["stats"])
+        _mark(conn, path, st)
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def ingest_logs(conn: sqlite3.Connection, log_dir: PathLike, pattern: str = "output_*.log*") -> int:
+    """Ingest runner logs not seen before (or changed since); returns how many."""
+    count = 0
+    for path in sorted(Path(log_dir).glob(pattern)):
+        row, st = _seen(conn, path)
+        if row is not None and row[:2] == (st.st_size, st.st_mtime_ns):
+            continue
+        _ingest_log(conn, path, st)
+        count += 1
+    return count
+
+
+def _apply_event(conn: sqlite3.Connection, source: str, log: str, event: Dict[str, Any]) -> None:
+    if "run" not in event:
+        return
+    run_id = _run_id(conn, source, event["run"], log)
+    kind = event.get("event")
+    if kind == "run_start":
+        conn.execute(
+            "UPDATE runs SET backend = ?, timestamp = ? WHERE id = ?",
+            (event.get("backend", ""), datetime.fromtimestamp(event["ts"]).isoformat(), run_id),
+        )
+        _stats(conn, run_id, {"n": event.get("n")})
+    elif kind == "incumbent":
+        conn.execute(
+            "INSERT INTO convergence (run_id, t, objective, bound) VALUES (?, ?, ?, ?)",
+            (run_id, event["t"], event["objective"], event.get("bound")),
+        )
+    elif kind == "phase":
+        _stats(conn, run_id, {f"phase_{event['name']}_sec": event["seconds"]})
+    elif kind == "run_end":
+        conn.execute(
+            "UPDATE runs SET status = ?, max_side = ?, time_sec = ? WHERE id = ?",
+            (event.get("status"), event.get("max_side"), event.get("t"), run_id),
+        )
+        _stats(conn, run_id, {"gap": event.get("gap"), "cached": event.get("cached")})
+
+
+def ingest_telemetry(conn: sqlite3.Connection, path: PathLike) -> int:
+    """Ingest events appended to a telemetry file since the last call; returns how many."""
+    path = Path(path)
+    row, st = _seen(conn, path)
+    if row is not None and row[:2] == (st.st_size, st.st_mtime_ns):
+        return 0
+    source = str(path)
+    offset = row[2] if row is not None else 0
+    conn.execute("BEGIN")
+    try:
+        if offset > st.st_size:
+            # Truncated or rewritten: start over.
+            conn.execute("DELETE FROM runs WHERE source = ?", (source,))
+            offset = 0
+        with path.open("rb") as f:
+            f.seek(offset)
+            data = f.read()
+        # A torn final line is picked up on the next ingestion.
+        complete = data[: data.rfind(b"\n") + 1]
+        count = 0
+        for line in complete.splitlines():
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            _apply_event(conn, source, path.name, event)
+            count += 1
+        _mark(conn, path, st, offset + len(complete))
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    return count
+
+
+def report_rows(conn: sqlite3.Connection) -> List[Dict[str, str]]:
+    """One row per run with the solver_comparison.csv columns, as strings."""
+    cur = conn.execute(
+        "SELECT r.instance, r.backend, r.status, r.max_side, r.time_sec, "
+        "(SELECT COUNT(*) FROM convergence c WHERE c.run_id = r.id), r.log "
+        "FROM runs r ORDER BY r.log, r.run_key"
+    )
+    rows = []
+    for instance, backend, status, max_side, time_sec, points, log in cur:
+        rows.append(
+            {
+                "instance": instance,
+                "solver": backend,
+                "status": status or "",
+                "max_side": "" if max_side is None else str(max_side),
+                "time_sec": "" if time_sec is None else f"{time_sec:.6f}",
+                "conv_points": str(points),
+                "log": log,
+            }
+        )
+    return rows
+
+
+def load_report_rows(csv_path: PathLike, path: Optional[PathLike] = None) -> List[Dict[str, str]]:
+    """Report rows from the results database, or from the CSV when there is none."""
+    path = Path(path or db_path())
+    if path.exists():
+        conn = connect(path)
+        try:
+            return report_rows(conn)
+        finally:
+            conn.close()
+    with Path(csv_path).open("r", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def write_csv(path: PathLike, rows: Iterable[Dict[str, str]]) -> None:
+    with Path(path).open("w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=REPORT_COLUMNS, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(rows)
@@ -2,19 +2,86 @@
 
 from __future__ import annotations
 
-from typing import List
+import os
+from typing import List, Optional
 
-from .solvers.base import Solution
-from .solvers import solver_ortools, solver_pulp, solver_pyomo
+from . import cache, telemetry
+from .solvers.base import Solution, lower_bound, make_solution, scale_lengths
+from .solvers import (
+    solver_ckk,
+    solver_dp,
+    solver_highspy,
+    solver_kk,
+    solver_ortools,
+    solver_portfolio,
+    solver_pulp,
+    solver_pyomo,
+)
+from .solvers.solver_kk import differencing
 
+BACKENDS = ("ortools", "pulp", "highs", "pyomo", "dp", "kk", "ckk", "portfolio")
+
+
+def presolve(lengths: List[float]) -> Optional[Solution]:
+    """Return an OPTIMAL solution when the differencing heuristic meets the bound."""
+    scaled, factor = scale_lengths(lengths)
+    side_a, diff = differencing(scaled)
+    total = sum(scaled)
+    max_side = (total + diff) // 2
+    if max_side != lower_bound(scaled):
+        return None
+    gap = (max_side - (total + 1) // 2) / factor
+    return make_solution(lengths, side_a, "OPTIMAL", gap=gap)
+
+
+def solve(
+    lengths: List[float],
+    backend: str,
+    pyomo_solver: str,
+    on_incumbent: Optional[telemetry.OnIncumbent] = None,
+) -> Solution:
+    """Solve with ``backend``.
+
+    ``on_incumbent(time, objective, bound)`` is called for each improving
+    solution, from the engine's thread; returning True stops the search and
+    returns the incumbent. Engines without live reports (and cached or
+    presolved answers) report their final solution once.
+    """
+    if backend not in BACKENDS:
+        raise SystemExit(f"Unknown solver backend: {backend}")
+
+    options = pyomo_solver if backend == "pyomo" else ""
+    with telemetry.run(backend, len(lengths), on_incumbent):
+        result = cache.lookup(lengths, backend, options)
+        cached = result is not None
+        if result is None:
+            result = _solve(lengths, backend, pyomo_solver)
+            cache.store(lengths, backend, result, options)
+        telemetry.run_end(result, cached=cached)
+    return result
+
+
+def _solve(lengths: List[float], backend: str, pyomo_solver: str) -> Solution:
+    if os.getenv("PRESOLVE", "true").lower() != "false":
+        with telemetry.phase("presolve"):
+            result = presolve(lengths)
+        if result is not None:
+            return result
 
-def solve(lengths: List[float], backend: str, pyomo_solver: str) -> Solution:
     if backend == "ortools":
         return solver_ortools.solve(lengths)
     if backend == "pulp":
         return solver_pulp.solve(lengths)
     if backend == "highs":
-        return solver_pyomo.solve(lengths, "highs")
+        return solver_highspy.solve(lengths)
     if backend == "pyomo":
         return solver_pyomo.solve(lengths, pyomo_solver)
+    if backend == "dp":
+        return solver_dp.solve(lengths)
+    if backend == "kk":
+        return solver_kk.solve(lengths)
+    if backend == "ckk":
+        return solver_ckk.solve(lengths)
+    if backend == "portfolio":
+        return solver_portfolio.solve(lengths)
     raise SystemExit(f"Unknown solver backend: {backend}")
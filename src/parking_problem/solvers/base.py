@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+
+OPTIMAL_STATUSES = {"OPTIMAL", "Optimal"}
+
+# Integrality/feasibility slack MIP engines accept by default (HiGHS, CBC).
+MIP_TOLERANCE = 1e-6
 
 
 @dataclass(frozen=True)
@@ -14,6 +21,16 @@ class Solution:
     side_b: List[int]
     sum_a: float
     sum_b: float
+    gap: Optional[float] = None
+
+
+def is_optimal(solution: Solution) -> bool:
+    return solution.status in OPTIMAL_STATUSES
+
+
+def log_is_stream(path: str) -> bool:
+    """True when SOLVER_LOG_PATH names a pipe or terminal (e.g. /dev/stdout), not a file."""
+    return os.path.exists(path) and not os.path.isfile(path)
 
 
 def scale_lengths(lengths: List[float]) -> Tuple[List[int], int]:
@@ -26,3 +43,44 @@ def scale_lengths(lengths: List[float]) -> Tuple[List[int], int]:
     factor = 10 ** max_decimals
     scaled = [int(round(v * factor)) for v in lengths]
     return scaled, factor
+
+
+def lower_bound(scaled: List[int]) -> int:
+    """Trivial bound on L: max(largest item, ceil(total / 2))."""
+    return max(max(scaled), (sum(scaled) + 1) // 2)
+
+
+def proves_optimum(scaled: List[int], side_a: List[int]) -> bool:
+    """Whether a MIP engine's optimality claim for ``side_a`` can be trusted.
+
+    Once MIP_TOLERANCE times the total reaches one scaled unit, the engine's
+    bound no longer separates neighbouring objective values; only meeting the
+    lower bound still proves the split optimal.
+    """
+    total = sum(scaled)
+    if total * MIP_TOLERANCE < 1:
+        return True
+    sum_a = sum(scaled[i] for i in side_a)
+    return max(sum_a, total - sum_a) == lower_bound(scaled)
+
+
+def make_solution(
+    lengths: List[float],
+    side_a: List[int],
+    status: str,
+    gap: Optional[float] = None,
+) -> Solution:
+    """Build a Solution from the indices placed on side A."""
+    in_a = set(side_a)
+    side_b = [i for i in range(len(lengths)) if i not in in_a]
+    sum_a = sum(lengths[i] for i in side_a)
+    sum_b = sum(lengths[i] for i in side_b)
+    return Solution(
+        status=status,
+        max_side=max(sum_a, sum_b),
+        side_a=sorted(side_a),
+        side_b=side_b,
+        sum_a=sum_a,
+        sum_b=sum_b,
+        gap=gap,
+    )
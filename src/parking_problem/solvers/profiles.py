@@ -0,0 +1,171 @@
+"""Solver parameter profiles chosen from instance features."""
+
+from __future__ import annotations
+
+import json
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List
+
+from .reduction import Groups
+
+
+@dataclass(frozen=True)
+class Features:
+    n: int
+    distinct: int
+    bits: int
+    duplicate_ratio: float
+
+
+# Built-in rules: the first rule whose ``when`` matches wins. Conditions are
+# upper bounds (max_*) or lower bounds (min_*) on the Features fields.
+DEFAULT_PROFILES: Dict[str, List[Dict[str, Any]]] = {
+    "ortools": [
+        # A handful of count variables: worker start-up costs more than the
+        # search, and presolve has nothing to remove.
+        {
+            "when": {"max_distinct": 16},
+            "params": {"num_workers": 1, "cp_model_presolve": False, "linearization_level": 0},
+        },
+        {
+            "when": {"max_distinct": 128, "max_bits": 32},
+            "params": {"num_workers": 1, "linearization_level": 1},
+        },
+        # Wide coefficients make the LP relaxation the main source of bounds.
+        {
+            "when": {"max_distinct": 1024},
+            "params": {
+                "num_workers": 4,
+                "linearization_level": 2,
+                "subsolvers": ["default_lp", "max_lp", "core", "quick_restart"],
+            },
+        },
+        {
+            "when": {},
+            "params": {
+                "num_workers": 8,
+                "linearization_level": 2,
+                "subsolvers": [
+                    "default_lp",
+                    "max_lp",
+                    "core",
+                    "quick_restart",
+                    "reduced_costs",
+                    "pseudo_costs",
+                ],
+            },
+        },
+    ],
+}
+
+
+# Parameters forced for a backend in this process, ahead of every rule.
+_overrides: Dict[str, Dict[str, Any]] = {}
+
+
+def features(scaled: List[int], groups: Groups) -> Features:
+    n = len(scaled)
+    distinct = len(groups.values)
+    return Features(
+        n=n,
+        distinct=distinct,
+        bits=max(scaled).bit_length() if scaled else 0,
+        duplicate_ratio=1 - distinct / n if n else 0.0,
+    )
+
+
+@lru_cache(maxsize=None)
+def _load_profiles(path: str) -> Dict[str, List[Dict[str, Any]]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+    except (OSError, ValueError) as exc:
+        raise SystemExit(f"Invalid SOLVER_PROFILE_PATH {path}: {exc}") from exc
+    if not isinstance(payload, dict):
+        raise SystemExit(f"Invalid SOLVER_PROFILE_PATH {path}: expected a JSON object")
+    return payload
+
+
+def _matches(when: Dict[str, Any], feats: Features) -> bool:
+    for key, limit in when.items():
+        bound, _, field = key.partition("_")
+        value = getattr(feats, field, None)
+        if value is None or bound not in ("max", "min"):
+            raise SystemExit(f"Unknown profile condition: {key}")
+        if bound == "max" and value > limit:
+            return False
+        if bound == "min" and value < limit:
+            return False
+    return True
+
+
+def thread_budget() -> int:
+    # MAX_THREADS solves may run side by side; split the CPUs this process may
+    # run on (its affinity mask, e.g. under taskset) between them.
+    try:
+        concurrent = max(1, int(os.getenv("MAX_THREADS", "1")))
+    except ValueError:
+        concurrent = 1
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    return max(1, cpus // concurrent)
+
+
+def params_for(backend: str, feats: Features) -> Dict[str, Any]:
+    """Parameters for ``backend`` on an instance with ``feats``.
+
+    Rules from the JSON file at SOLVER_PROFILE_PATH (e.g. one written by
+    ``python -m parking_problem.tune``) are tried before the built-in ones;
+    the first match wins. ``num_workers`` is capped by the CPU
+    share of this run.
+    """
+    rules: List[Dict[str, Any]] = []
+    if backend in _overrides:
+        rules.append({"params": _overrides[backend]})
+    path = os.getenv("SOLVER_PROFILE_PATH", "")
+    if path:
+        rules.extend(_load_profiles(path).get(backend, []))
+    rules.extend(DEFAULT_PROFILES.get(backend, []))
+
+    for rule in rules:
+        if _matches(rule.get("when", {}), feats):
+            params = dict(rule.get("params", {}))
+            break
+    else:
+        params = {}
+    if "num_workers" in params:
+        params["num_workers"] = max(1, min(int(params["num_workers"]), thread_budget()))
+    return params
+
+
+@contextmanager
+def override(backend: str, params: Dict[str, Any]) -> Iterator[None]:
+    """Use exactly ``params`` for ``backend`` inside the block (for tuning)."""
+    previous = _overrides.get(backend)
+    _overrides[backend] = params
+    try:
+        yield
+    finally:
+        if previous is None:
+            del _overrides[backend]
+        else:
+            _overrides[backend] = previous
+
+
+def apply_cpsat(parameters: Any, params: Dict[str, Any]) -> None:
+    """Set CP-SAT SatParameters fields; list values replace repeated fields."""
+    for name, value in params.items():
+        try:
+            if isinstance(value, list):
+                field = getattr(parameters, name)
+                field.clear()
+                field.extend(value)
+            else:
+                setattr(parameters, name, value)
+        except (AttributeError, TypeError) as exc:
+            raise SystemExit(f"Invalid CP-SAT parameter {name}={value!r}: {exc}") from exc
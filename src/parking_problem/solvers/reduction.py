@@ -0,0 +1,34 @@
+"""Model reduction: group cars with equal scaled length into count variables."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List
+
+
+@dataclass(frozen=True)
+class Groups:
+    values: List[int]
+    members: List[List[int]]
+
+
+def group_lengths(scaled: List[int]) -> Groups:
+    """Group car indices by scaled length, in order of first appearance."""
+    by_value: Dict[int, List[int]] = {}
+    for i, w in enumerate(scaled):
+        by_value.setdefault(w, []).append(i)
+    return Groups(values=list(by_value), members=list(by_value.values()))
+
+
+def counts_for(groups: Groups, side_a: List[int]) -> List[int]:
+    """How many cars of each group a per-car assignment puts on side A."""
+    in_a = set(side_a)
+    return [sum(1 for i in members if i in in_a) for members in groups.members]
+
+
+def expand(groups: Groups, counts: List[int]) -> List[int]:
+    """Per-car side A indices for the chosen count of each group."""
+    side_a: List[int] = []
+    for members, count in zip(groups.members, counts):
+        side_a.extend(members[:count])
+    return sorted(side_a)
@@ -0,0 +1,96 @@
+"""Complete Karmarkar-Karp (CKK) anytime exact backend."""
+
+from __future__ import annotations
+
+import os
+import time
+from bisect import insort
+from operator import itemgetter
+from typing import List
+
+from .. import telemetry
+from .base import Solution, make_solution, scale_lengths
+from .solver_kk import differencing
+
+_value = itemgetter(0)
+
+
+def _expand(root, rest, n: int) -> List[int]:
+    # Nodes are car indices or (same_side, left, right) tuples built while
+    # branching; the root of the final leaf sits alone against all the rest.
+    side = [0] * n
+    stack = [(root, 0)] + [(node, 1) for node in rest]
+    while stack:
+        node, s = stack.pop()
+        if isinstance(node, int):
+            side[node] = s
+            continue
+        same_side, left, right = node
+        stack.append((left, s))
+        stack.append((right, s if same_side else 1 - s))
+    return [i for i in range(n) if side[i] == 0]
+
+
+def solve(lengths: List[float]) -> Solution:
+    n = len(lengths)
+    scaled, factor = scale_lengths(lengths)
+    total = sum(scaled)
+    perfect = total % 2
+
+    try:
+        time_limit = float(os.getenv("SOLVER_TIME_LIMIT", "0"))
+    except ValueError:
+        time_limit = 0
+
+    start_time = time.perf_counter()
+    report = telemetry.reporter()
+    bound = (total + 1) // 2 / factor
+
+    def _incumbent(diff: int) -> bool:
+        return report is not None and report((total + diff) // 2 / factor, bound)
+
+    # The first leaf of the CKK tree is exactly the Karmarkar-Karp partition.
+    side_a, best = differencing(scaled)
+    best_leaf = None
+    stop = _incumbent(best)
+
+    status = "OPTIMAL"
+    stack = [] if stop else [(sorted(zip(scaled, range(n)), key=_value), total)]
+    nodes = 0
+    while stack and best > perfect:
+        nodes += 1
+        if time_limit > 0 and nodes % 1024 == 0:
+            if time.perf_counter() - start_time >= time_limit:
+                status = "FEASIBLE"
+                break
+
+        items, tot = stack.pop()
+        a, a_node = items[-1]
+        rest = tot - a
+        if a >= rest:
+            # Largest element against everything else is the best completion.
+            if a - rest < best:
+                best = a - rest
+                best_leaf = (a_node, [node for _, node in items[:-1]])
+                stop = _incumbent(best)
+                if stop:
+                    break
+            continue
+
+        b, b_node = items[-2]
+        base = items[:-2]
+        # Same-side branch is explored second; skip it when putting a and b
+        # together already forces a difference no better than the incumbent.
+        if 2 * (a + b) - tot < best:
+            joined = list(base)
+            insort(joined, (a + b, (True, a_node, b_node)), key=_value)
+            stack.append((joined, tot))
+        split = base
+        insort(split, (a - b, (False, a_node, b_node)), key=_value)
+        stack.append((split, tot - 2 * b))
+
+    if stop and best > perfect:
+        status = "FEASIBLE"
+    if best_leaf is not None:
+        side_a = _expand(best_leaf[0], best_leaf[1], n)
+    return make_solution(lengths, side_a, status)
@@ -0,0 +1,38 @@
+"""Exact subset-sum backend using a big-integer bitset (no MIP engine)."""
+
+from __future__ import annotations
+
+from typing import List
+
+from .base import Solution, make_solution, scale_lengths
+
+
+def best_subset(scaled: List[int]) -> List[int]:
+    """Indices of a subset whose sum is the largest reachable value <= total // 2.
+
+    Bit ``s`` of the running bitset is set when sum ``s`` is reachable; bits
+    above ``total // 2`` are masked off since they can never be the target.
+    One prefix bitset per item is kept to walk the choice back.
+    """
+    half = sum(scaled) // 2
+    mask = (1 << (half + 1)) - 1
+
+    prefixes = []
+    reach = 1
+    for w in scaled:
+        prefixes.append(reach)
+        reach = (reach | (reach << w)) & mask
+
+    target = reach.bit_length() - 1
+    side_a: List[int] = []
+    for i in range(len(scaled) - 1, -1, -1):
+        if (prefixes[i] >> target) & 1:
+            continue
+        side_a.append(i)
+        target -= scaled[i]
+    return side_a
+
+
+def solve(lengths: List[float]) -> Solution:
+    scaled, _ = scale_lengths(lengths)
+    return make_solution(lengths, best_subset(scaled), "OPTIMAL")
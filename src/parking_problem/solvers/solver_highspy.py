@@ -0,0 +1,152 @@
+"""HiGHS backend building the column-wise model directly with highspy."""
+
+from __future__ import annotations
+
+import math
+import os
+from dataclasses import dataclass
+from typing import Any, List
+
+import numpy as np
+
+from .. import telemetry
+from . import profiles
+from .base import Solution, lower_bound, make_solution, proves_optimum, scale_lengths
+from .reduction import Groups, counts_for, expand, group_lengths
+from .solver_kk import differencing
+
+
+def _highspy():
+    try:
+        import highspy
+    except Exception as exc:  # pragma: no cover - optional dependency
+        raise SystemExit(f"highspy is not available: {exc}") from exc
+    return highspy
+
+
+@dataclass
+class Model:
+    lp: Any
+    start: np.ndarray
+    scaled: List[int]
+    factor: int
+    groups: Groups
+
+
+def build_model(lengths: List[float]) -> Model:
+    """Column-wise HighsLp of the aggregated model, plus the differencing start."""
+    highspy = _highspy()
+    scaled, factor = scale_lengths(lengths)
+    groups = group_lengths(scaled)
+    k = len(groups.values)
+    coef = np.array([lengths[members[0]] for members in groups.members], dtype=np.float64)
+    size = np.array([len(members) for members in groups.members], dtype=np.float64)
+    total = float(coef @ size)
+
+    # Columns: y_0..y_{k-1} (cars of each distinct length on side A), then L.
+    # Rows: sum_a - L <= 0 and total - sum_a <= L, i.e. -sum_a - L <= -total.
+    lp = highspy.HighsLp()
+    lp.num_col_ = k + 1
+    lp.num_row_ = 2
+    lp.col_cost_ = np.append(np.zeros(k), 1.0)
+    L_low = lower_bound(scaled) / factor
+    lp.col_lower_ = np.append(np.zeros(k), L_low)
+    lp.col_upper_ = np.append(size, highspy.kHighsInf)
+    lp.row_lower_ = np.full(2, -highspy.kHighsInf)
+    lp.row_upper_ = np.array([0.0, -total])
+    lp.integrality_ = [highspy.HighsVarType.kInteger] * k + [highspy.HighsVarType.kContinuous]
+    lp.a_matrix_.format_ = highspy.MatrixFormat.kColwise
+    lp.a_matrix_.start_ = np.arange(0, 2 * (k + 2), 2, dtype=np.int32)
+    lp.a_matrix_.index_ = np.tile(np.array([0, 1], dtype=np.int32), k + 1)
+    lp.a_matrix_.value_ = np.column_stack(
+        (np.append(coef, -1.0), np.append(-coef, -1.0))
+    ).ravel()
+
+    # Warm start from the largest-differencing partition
+    hint_a, _ = differencing(scaled)
+    hint = np.array(counts_for(groups, hint_a), dtype=np.float64)
+    hint_sum_a = float(coef @ hint)
+    # Float sums can land a hair under the exact bound; keep the start feasible
+    start = np.append(hint, max(hint_sum_a, total - hint_sum_a, L_low))
+    return Model(lp=lp, start=start, scaled=scaled, factor=factor, groups=groups)
+
+
+def extract(lengths: List[float], built: Model, h: Any) -> Solution:
+    highspy = _highspy()
+    k = len(built.groups.values)
+    model_status = h.getModelStatus()
+    col_value = np.asarray(h.getSolution().col_value)
+    if col_value.size != k + 1:
+        raise SystemExit(f"HiGHS returned no solution: {h.modelStatusToString(model_status)}")
+
+    counts = np.rint(col_value[:k]).astype(np.int64).tolist()
+    side_a = expand(built.groups, counts)
+    if model_status == highspy.HighsModelStatus.kOptimal and proves_optimum(built.scaled, side_a):
+        status = "OPTIMAL"
+    else:
+        status = "FEASIBLE"
+    # L is only tight up to the MIP feasibility tolerance; report the side sums
+    return make_solution(lengths, side_a, status)
+
+
+def solve(lengths: List[float]) -> Solution:
+    highspy = _highspy()
+    with telemetry.phase("build"):
+        built = build_model(lengths)
+    factor = built.factor
+
+    h = highspy.Highs()
+    log_only = os.getenv("LOG_TO_FILE_ONLY", "").lower() == "true"
+    per_run_log = os.getenv("PER_RUN_LOG", "").lower() == "true"
+    log_enabled = os.getenv("SOLVER_LOG", "").lower() == "true"
+    log_path = os.getenv("SOLVER_LOG_PATH", "")
+    if log_enabled and per_run_log and log_path:
+        h.setOptionValue("log_file", log_path)
+        h.setOptionValue("log_to_console", False)
+    elif not log_enabled or log_only:
+        h.setOptionValue("output_flag", False)
+
+    # HiGHS stops at a 1e-4 relative gap by default, which can leave an
+    # objective several units of the last decimal above the optimum. Any
+    # better split is at least 1/factor lower, so a smaller gap is a proof.
+    h.setOptionValue("mip_rel_gap", 0.0)
+    h.setOptionValue("mip_abs_gap", 0.999 / factor)
+
+    try:
+        time_limit = float(os.getenv("SOLVER_TIME_LIMIT", "0"))
+    except ValueError:
+        time_limit = 0
+    if time_limit > 0:
+        h.setOptionValue("time_limit", time_limit)
+
+    feats = profiles.features(built.scaled, built.groups)
+    for name, value in profiles.params_for("highs", feats).items():
+        if h.setOptionValue(name, value) != highspy.HighsStatus.kOk:
+            raise SystemExit(f"Invalid HiGHS option {name}={value!r}")
+
+    h.passModel(built.lp)
+    start = highspy.HighsSolution()
+    start.col_value = list(built.start)
+    start.value_valid = True
+    h.setSolution(start)
+
+    report = telemetry.reporter()
+    if report is not None:
+        stop = False
+
+        def _improving(event: Any) -> None:
+            nonlocal stop
+            bound = event.data_out.mip_dual_bound
+            if report(event.data_out.objective_function_value, bound if math.isfinite(bound) else None):
+                stop = True
+
+        def _interrupt(event: Any) -> None:
+            if stop:
+                event.interrupt()
+
+        h.cbMipImprovingSolution.subscribe(_improving)
+        h.cbMipInterrupt.subscribe(_interrupt)
+
+    with telemetry.phase("search"):
+        h.run()
+    return extract(lengths, built, h)
@@ -0,0 +1,111 @@
+"""Karmarkar-Karp largest-differencing heuristic backend."""
+
+from __future__ import annotations
+
+from heapq import heapify, heappop, heappush, heapreplace
+from typing import List, Tuple
+
+import numpy as np
+
+from .base import Solution, lower_bound, make_solution, scale_lengths
+
+
+def _differencing_heap(scaled: List[int]) -> Tuple[List[int], List[int], int]:
+    # Value and index are packed into one int so the heap holds plain ints
+    # instead of tuples; negated because heapq is a min-heap.
+    n = len(scaled)
+    shift = n.bit_length()
+    mask = (1 << shift) - 1
+    heap = [-((w << shift) | i) for i, w in enumerate(scaled)]
+    heapify(heap)
+    keep: List[int] = []
+    drop: List[int] = []
+    for _ in range(n - 1):
+        a = -heappop(heap)
+        b = -heap[0]
+        ia = a & mask
+        heapreplace(heap, -((((a >> shift) - (b >> shift)) << shift) | ia))
+        keep.append(ia)
+        drop.append(b & mask)
+    return keep, drop, -heap[0] >> shift
+
+
+def _differencing_buckets(scaled: List[int]) -> Tuple[List[int], List[int], int]:
+    # Equal values cancel to zero in pairs, so each distinct value is one heap
+    # entry and its copies are differenced in bulk.
+    buckets: dict[int, List[int]] = {}
+    for i, w in enumerate(scaled):
+        reps = buckets.get(w)
+        if reps is None:
+            buckets[w] = [i]
+        else:
+            reps.append(i)
+    buckets.pop(0, None)
+    heap = [-w for w in buckets]
+    heapify(heap)
+    keep: List[int] = []
+    drop: List[int] = []
+    while heap:
+        v = -heap[0]
+        reps = buckets[v]
+        if len(reps) >= 2:
+            k = len(reps) - (len(reps) & 1)
+            keep.extend(reps[0:k:2])
+            drop.extend(reps[1:k:2])
+            del reps[:k]
+        heappop(heap)
+        del buckets[v]
+        if not reps:
+            continue
+        if not heap:
+            return keep, drop, v
+        u = -heap[0]
+        ureps = buckets[u]
+        keep.append(reps[0])
+        drop.append(ureps.pop())
+        if not ureps:
+            heappop(heap)
+            del buckets[u]
+        d = v - u
+        dreps = buckets.get(d)
+        if dreps is None:
+            buckets[d] = [reps[0]]
+            heappush(heap, -d)
+        else:
+            dreps.append(reps[0])
+    return keep, drop, 0
+
+
+def differencing(scaled: List[int]) -> Tuple[List[int], int]:
+    """Largest-differencing partition. Returns (side_a indices, difference)."""
+    n = len(scaled)
+    if len(set(scaled)) * 2 > n:
+        keep, drop, diff = _differencing_heap(scaled)
+    else:
+        keep, drop, diff = _differencing_buckets(scaled)
+
+    # Every merge puts `drop` on the opposite side of `keep`; resolve the
+    # side of each car against its tree root by pointer jumping.
+    parent = np.arange(n)
+    parity = np.zeros(n, dtype=np.int8)
+    if keep:
+        parent[drop] = keep
+        parity[drop] = 1
+    while True:
+        grand = parent[parent]
+        if np.array_equal(grand, parent):
+            break
+        parity ^= parity[parent]
+        parent = grand
+    return np.flatnonzero(parity == 0).tolist(), diff
+
+
+def solve(lengths: List[float]) -> Solution:
+    scaled, factor = scale_lengths(lengths)
+    side_a, diff = differencing(scaled)
+
+    total = sum(scaled)
+    half = (total + 1) // 2
+    max_side = (total + diff) // 2
+    status = "OPTIMAL" if max_side == lower_bound(scaled) else "FEASIBLE"
+    return make_solution(lengths, side_a, status, gap=(max_side - half) / factor)
@@ -2,44 +2,100 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import List
 
 import os
-import time
 
 from ortools.sat.python import cp_model
 
-from .base import Solution, scale_lengths
+from .. import telemetry
+from . import profiles
+from .base import Solution, lower_bound, scale_lengths
+from .reduction import Groups, counts_for, expand, group_lengths
+from .solver_kk import differencing
 
 
-def solve(lengths: List[float]) -> Solution:
-    n = len(lengths)
+@dataclass
+class Model:
+    model: cp_model.CpModel
+    y: List[cp_model.IntVar]
+    L: cp_model.IntVar
+    scaled: List[int]
+    factor: int
+    groups: Groups
+
+
+def build_model(lengths: List[float]) -> Model:
+    """Aggregated CP-SAT model with the differencing hint."""
     scaled, factor = scale_lengths(lengths)
+    groups = group_lengths(scaled)
+    k = len(groups.values)
 
     model = cp_model.CpModel()
-    x = [model.NewBoolVar(f"x_{i}") for i in range(n)]
+    # y_k: how many cars of the k-th distinct length go on side A
+    y = [model.NewIntVar(0, len(groups.members[j]), f"y_{j}") for j in range(k)]
 
     sum_a = model.NewIntVar(0, sum(scaled), "sum_a")
     sum_b = model.NewIntVar(0, sum(scaled), "sum_b")
-    L = model.NewIntVar(0, sum(scaled), "L")
+    L = model.NewIntVar(lower_bound(scaled), sum(scaled), "L")
 
-    model.Add(sum_a == sum(scaled[i] * x[i] for i in range(n)))
-    model.Add(sum_b == sum(scaled[i] * (1 - x[i]) for i in range(n)))
+    model.Add(sum_a == sum(groups.values[j] * y[j] for j in range(k)))
+    model.Add(sum_b == sum(scaled) - sum_a)
     model.Add(sum_a <= L)
     model.Add(sum_b <= L)
     model.Minimize(L)
 
+    # Warm start from the largest-differencing partition
+    hint_a, hint_diff = differencing(scaled)
+    for j, count in enumerate(counts_for(groups, hint_a)):
+        model.AddHint(y[j], count)
+    model.AddHint(L, (sum(scaled) + hint_diff) // 2)
+    return Model(model=model, y=y, L=L, scaled=scaled, factor=factor, groups=groups)
+
+
+def extract(lengths: List[float], built: Model, solver: cp_model.CpSolver, status: int) -> Solution:
+    side_a = expand(built.groups, [solver.Value(v) for v in built.y])
+    in_a = set(side_a)
+    side_b = [i for i in range(len(lengths)) if i not in in_a]
+
+    sum_a_val = sum(lengths[i] for i in side_a)
+    sum_b_val = sum(lengths[i] for i in side_b)
+
+    return Solution(
+        status=solver.StatusName(status),
+        max_side=solver.Value(built.L) / built.factor,
+        side_a=side_a,
+        side_b=side_b,
+        sum_a=sum_a_val,
+        sum_b=sum_b_val,
+    )
+
+
+def solve(lengths: List[float]) -> Solution:
+    with telemetry.phase("build"):
+        built = build_model(lengths)
+    model, factor = built.model, built.factor
+
     solver = cp_model.CpSolver()
     solver.parameters.random_seed = 0
+    profiles.apply_cpsat(
+        solver.parameters,
+        profiles.params_for("ortools", profiles.features(built.scaled, built.groups)),
+    )
     try:
-        solver.parameters.max_time_in_seconds = float(os.getenv("SOLVER_TIME_LIMIT", "0"))
+        time_limit = float(os.getenv("SOLVER_TIME_LIMIT", "0"))
     except ValueError:
-        pass
+        time_limit = 0
+    # A zero limit would stop CP-SAT before it starts
+    if time_limit > 0:
+        solver.parameters.max_time_in_seconds = time_limit
     log_only = os.getenv("LOG_TO_FILE_ONLY", "").lower() == "true"
     per_run_log = os.getenv("PER_RUN_LOG", "").lower() == "true"
     log_enabled = os.getenv("SOLVER_LOG", "").lower() == "true" and (
         not log_only or per_run_log
     )
+    log_file = None
     if log_enabled:
         solver.parameters.log_search_progress = True
         log_path = os.getenv("SOLVER_LOG_PATH", "")
@@ -47,35 +103,27 @@ def solve(lengths: List[float]) -> Solution:
             log_file = open(log_path, "a", encoding="utf-8")
 
             def _cb(text: str) -> None:
+                # Buffered; a flush per line stalls the search thread.
                 log_file.write(text + "\n")
-                log_file.flush()
 
             solver.log_callback = _cb
 
-    conv_path = os.getenv("CONVERGENCE_LOG_PATH", "")
-    if conv_path:
-        start_time = time.perf_counter()
+    report = telemetry.reporter()
+    if report is not None:
 
         class _ConvCB(cp_model.CpSolverSolutionCallback):
-            def __init__(self) -> None:
-                super().__init__()
-                self._file = open(conv_path, "a", encoding="utf-8")
-
             def on_solution_callback(self) -> None:
-                t = time.perf_counter() - start_time
-                obj = self.ObjectiveValue() / factor
-                self._file.write(f"[convergence] {t:.6f},{obj},FEASIBLE\n")
-                self._file.flush()
+                if report(self.ObjectiveValue() / factor, self.BestObjectiveBound() / factor):
+                    self.StopSearch()
 
         conv_cb = _ConvCB()
     else:
         conv_cb = None
-    if conv_cb is not None and hasattr(solver, "SolveWithSolutionCallback"):
-        status = solver.SolveWithSolutionCallback(model, conv_cb)
-    else:
-        status = solver.Solve(model)
-
-    status_name = solver.StatusName(status)
+    # SolveWithSolutionCallback is gone from recent OR-Tools; Solve takes the callback
+    with telemetry.phase("search"):
+        status = solver.Solve(model, conv_cb)
+    if log_file is not None:
+        log_file.close()
 
     # Append solver statistics to log when enabled
     log_path = os.getenv("SOLVER_LOG_PATH", "")
@@ -85,17 +133,4 @@ def solve(lengths: List[float]) -> Solution:
             log_file.write(solver.ResponseStats())
             if not solver.ResponseStats().endswith("\n"):
                 log_file.write("\n")
-    side_a = [i for i in range(n) if solver.Value(x[i]) == 1]
-    side_b = [i for i in range(n) if i not in side_a]
-
-    sum_a_val = sum(lengths[i] for i in side_a)
-    sum_b_val = sum(lengths[i] for i in side_b)
-
-    return Solution(
-        status=status_name,
-        max_side=solver.Value(L) / factor,
-        side_a=side_a,
-        side_b=side_b,
-        sum_a=sum_a_val,
-        sum_b=sum_b_val,
-    )
+    return extract(lengths, built, solver, status)
@@ -0,0 +1,96 @@
+"""Portfolio backend racing several engines in separate processes."""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+import os
+import queue
+import signal
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from .base import Solution, is_optimal, log_is_stream
+
+DEFAULT_BACKENDS = "dp,ckk,ortools,pulp,highs"
+def _worker(backend: str, lengths: List[float], results) -> None:
+    # Own process group, so killing a loser also takes down CBC subprocesses.
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()
+    # The parent already ran the presolve step.
+    os.environ["PRESOLVE"] = "false"
+    log_path = os.getenv("SOLVER_LOG_PATH", "")
+    # A stream (e.g. /dev/stdout) is shared; a file gets one sibling per backend.
+    if log_path and not log_is_stream(log_path):
+        path = Path(log_path)
+        os.environ["SOLVER_LOG_PATH"] = str(path.with_name(f"{path.stem}_{backend}{path.suffix}"))
+
+    from ..solver_main import solve
+
+    try:
+        results.put((backend, solve(lengths, backend, "highs"), None))
+    except BaseException as exc:  # noqa: BLE001 - reported back to the parent
+        results.put((backend, None, repr(exc)))
+
+
+def _kill(proc) -> None:
+    if not proc.is_alive():
+        return
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (AttributeError, ProcessLookupError, PermissionError):
+        proc.kill()
+
+
+def solve(lengths: List[float]) -> Solution:
+    backends = [
+        b.strip() for b in os.getenv("PORTFOLIO_BACKENDS", DEFAULT_BACKENDS).split(",") if b.strip()
+    ]
+    if not backends or "portfolio" in backends:
+        raise SystemExit(f"Invalid PORTFOLIO_BACKENDS: {backends}")
+    try:
+        time_limit = float(os.getenv("SOLVER_TIME_LIMIT", "0"))
+    except ValueError:
+        time_limit = 0
+
+    results = mp.Queue()
+    procs = [
+        mp.Process(target=_worker, args=(backend, lengths, results), daemon=True)
+        for backend in backends
+    ]
+    for proc in procs:
+        proc.start()
+
+    # Every engine enforces SOLVER_TIME_LIMIT itself; the grace period only
+    # guards against one that ignores it.
+    deadline = time.perf_counter() + time_limit * 1.1 + 5 if time_limit > 0 else None
+    best: Optional[Solution] = None
+    pending = len(procs)
+    try:
+        while pending:
+            try:
+                _, solution, _ = results.get(timeout=0.5)
+            except queue.Empty:
+                if deadline is not None and time.perf_counter() > deadline:
+                    break
+                if not any(proc.is_alive() for proc in procs):
+                    break
+                continue
+            pending -= 1
+            if solution is None:
+                continue
+            if is_optimal(solution):
+                best = solution
+                break
+            if best is None or solution.max_side < best.max_side:
+                best = solution
+    finally:
+        for proc in procs:
+            _kill(proc)
+        for proc in procs:
+            proc.join()
+        results.close()
+
+    if best is None:
+        raise SystemExit(f"No portfolio backend returned a solution: {backends}")
+    return best
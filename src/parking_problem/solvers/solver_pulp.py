@@ -2,50 +2,261 @@
 
 from __future__ import annotations
 
-from typing import List
+from dataclasses import dataclass
+from typing import List, Optional
 
 import os
+import re
+import signal
+import tempfile
+import threading
 import pulp
 
-from .base import Solution
+from .. import telemetry
+from . import profiles
+from .base import (
+    Solution,
+    log_is_stream,
+    lower_bound,
+    make_solution,
+    proves_optimum,
+    scale_lengths,
+)
+from .reduction import Groups, counts_for, expand, group_lengths
+from .solver_kk import differencing
 
 
-def solve(lengths: List[float]) -> Solution:
-    n = len(lengths)
+def _time_limit() -> Optional[float]:
+    try:
+        time_limit = float(os.getenv("SOLVER_TIME_LIMIT", "0"))
+    except ValueError:
+        time_limit = 0
+    # CBC treats a zero limit as "stop now", so only pass a positive one
+    return time_limit if time_limit > 0 else None
+
+
+_CBC_INCUMBENT = re.compile(r"Integer solution of\s+([-+0-9.eE]+)\s+found")
+_CBC_BOUND = re.compile(r"best possible\s+([-+0-9.eE]+)")
+
+
+def _cbc_pid(log_path: str) -> Optional[int]:
+    """PID of the cbc process whose stdout is ``log_path`` (Linux /proc only)."""
+    target = os.path.realpath(log_path)
+    try:
+        entries = os.listdir("/proc")
+    except OSError:
+        return None
+    for entry in entries:
+        if not entry.isdigit() or int(entry) == os.getpid():
+            continue
+        try:
+            if os.readlink(f"/proc/{entry}/fd/1") == target:
+                return int(entry)
+        except OSError:
+            continue
+    return None
+
+
+class _CbcLogTail(threading.Thread):
+    """Reports incumbents from the CBC log while the cbc subprocess writes it.
+
+    Best effort: cbc block-buffers stdout into the file, so lines arrive in
+    batches, and objectives are as CBC prints them (8 significant digits).
+    When the report asks to stop, cbc gets SIGINT and returns its incumbent.
+    """
+
+    def __init__(self, path: str, report: telemetry.Reporter) -> None:
+        super().__init__(name="cbc-log-tail", daemon=True)
+        self.path = path
+        self.report = report
+        self.done = threading.Event()
+        self._stopped = False
+
+    def run(self) -> None:
+        bound: Optional[float] = None
+        pending = ""
+        with open(self.path, "r", encoding="utf-8", errors="ignore") as f:
+            while True:
+                finished = self.done.is_set()
+                chunk = f.read()
+                if not chunk:
+                    if finished:
+                        return
+                    self.done.wait(0.05)
+                    continue
+                *lines, pending = (pending + chunk).split("\n")
+                for line in lines:
+                    m = _CBC_BOUND.search(line)
+                    if m:
+                        bound = float(m.group(1))
+                    m = _CBC_INCUMBENT.search(line)
+                    if m and self.report(float(m.group(1)), bound) and not self._stopped:
+                        self._stopped = True
+                        pid = _cbc_pid(self.path)
+                        if pid is not None:
+                            os.kill(pid, signal.SIGINT)
+
+
+def _solve_in_process(lengths: List[float]) -> Solution:
+    """Same model on OR-Tools' linked CBC: no model files and no cbc subprocess."""
+    from ortools.linear_solver import pywraplp
+
+    solver = pywraplp.Solver.CreateSolver("CBC")
+    if solver is None:
+        raise SystemExit("CBC is not available through OR-Tools linear_solver")
+
+    scaled, factor = scale_lengths(lengths)
+    groups = group_lengths(scaled)
+    k = len(groups.values)
+    coef = [lengths[members[0]] for members in groups.members]
+    size = [len(members) for members in groups.members]
+
+    # y_k: how many cars of the k-th distinct length go on side A
+    y = [solver.IntVar(0, size[j], f"y_{j}") for j in range(k)]
+    L_low = lower_bound(scaled) / factor
+    L = solver.NumVar(L_low, solver.infinity(), "L")
+
+    sum_a = solver.Sum(coef[j] * y[j] for j in range(k))
+    solver.Add(sum_a <= L)
+    solver.Add(sum(coef[j] * size[j] for j in range(k)) - sum_a <= L)
+    solver.Minimize(L)
+
+    # Warm start from the largest-differencing partition
+    hint_a, _ = differencing(scaled)
+    hint = counts_for(groups, hint_a)
+    hint_sum_a = sum(lengths[i] for i in hint_a)
+    # Float sums can land a hair under the exact bound; keep the hint feasible.
+    solver.SetHint(y + [L], hint + [max(hint_sum_a, sum(lengths) - hint_sum_a, L_low)])
+
+    log_only = os.getenv("LOG_TO_FILE_ONLY", "").lower() == "true"
+    per_run_log = os.getenv("PER_RUN_LOG", "").lower() == "true"
+    if os.getenv("SOLVER_LOG", "").lower() == "true" and (not log_only or per_run_log):
+        # CBC logs to the process stdout, which the caller may redirect
+        solver.EnableOutput()
+    time_limit = _time_limit()
+    if time_limit is not None:
+        solver.SetTimeLimit(int(time_limit * 1000))
+
+    # MPSolver stops at a 1e-4 relative gap by default, which can stop CBC
+    # above the optimum and still report OPTIMAL.
+    mp_params = pywraplp.MPSolverParameters()
+    mp_params.SetDoubleParam(pywraplp.MPSolverParameters.RELATIVE_MIP_GAP, 0.0)
+    with telemetry.phase("search"):
+        result = solver.Solve(mp_params)
+    if result not in (pywraplp.Solver.OPTIMAL, pywraplp.Solver.FEASIBLE):
+        raise SystemExit(f"CBC returned no solution (status {result})")
+
+    side_a = expand(groups, [int(round(y[j].solution_value())) for j in range(k)])
+    # Same status names as the PULP_CBC_CMD path
+    optimal = result == pywraplp.Solver.OPTIMAL and proves_optimum(scaled, side_a)
+    # L is only tight up to the MIP feasibility tolerance; report the side sums
+    return make_solution(lengths, side_a, "Optimal" if optimal else "Feasible")
+
+
+@dataclass
+class Model:
+    problem: pulp.LpProblem
+    y: List[pulp.LpVariable]
+    L: pulp.LpVariable
+    scaled: List[int]
+    groups: Groups
+
+
+def build_model(lengths: List[float]) -> Model:
+    """Aggregated PuLP model with the differencing warm start."""
     model = pulp.LpProblem("parking_partition", pulp.LpMinimize)
 
-    x = [pulp.LpVariable(f"x_{i}", cat="Binary") for i in range(n)]
-    L = pulp.LpVariable("L", lowBound=0)
+    scaled, factor = scale_lengths(lengths)
+    groups = group_lengths(scaled)
+    k = len(groups.values)
+    coef = [lengths[members[0]] for members in groups.members]
+    size = [len(members) for members in groups.members]
+
+    # y_k: how many cars of the k-th distinct length go on side A
+    y = [pulp.LpVariable(f"y_{j}", lowBound=0, upBound=size[j], cat="Integer") for j in range(k)]
+    L_low = lower_bound(scaled) / factor
+    L = pulp.LpVariable("L", lowBound=L_low)
 
-    sum_a = pulp.lpSum(lengths[i] * x[i] for i in range(n))
-    sum_b = pulp.lpSum(lengths[i] * (1 - x[i]) for i in range(n))
+    sum_a = pulp.lpSum(coef[j] * y[j] for j in range(k))
+    sum_b = pulp.lpSum(coef[j] * (size[j] - y[j]) for j in range(k))
 
     model += L
     model += sum_a <= L
     model += sum_b <= L
 
+    # Warm start from the largest-differencing partition
+    hint_a, _ = differencing(scaled)
+    for j, count in enumerate(counts_for(groups, hint_a)):
+        y[j].setInitialValue(count)
+    hint_sum_a = sum(lengths[i] for i in hint_a)
+    # Float sums can land a hair under the exact bound, which PuLP rejects
+    L.setInitialValue(max(hint_sum_a, sum(lengths) - hint_sum_a, L_low))
+    return Model(problem=model, y=y, L=L, scaled=scaled, groups=groups)
+
+
+def extract(lengths: List[float], built: Model) -> Solution:
+    side_a = expand(built.groups, [int(round(pulp.value(v))) for v in built.y])
+
+    # CBC stopped by the time limit still maps to LpStatus "Optimal"
+    status = pulp.LpStatus[built.problem.status]
+    if built.problem.sol_status == pulp.LpSolutionIntegerFeasible:
+        status = "Feasible"
+    elif status == "Optimal" and not proves_optimum(built.scaled, side_a):
+        status = "Feasible"
+
+    # L is only tight up to the MIP feasibility tolerance (and CBC writes it
+    # with limited digits); report the side sums
+    return make_solution(lengths, side_a, status)
+
+
+def solve(lengths: List[float]) -> Solution:
+    if os.getenv("CBC_IN_PROCESS", "").lower() == "true":
+        return _solve_in_process(lengths)
+
+    with telemetry.phase("build"):
+        built = build_model(lengths)
+    model = built.problem
+
     log_only = os.getenv("LOG_TO_FILE_ONLY", "").lower() == "true"
     per_run_log = os.getenv("PER_RUN_LOG", "").lower() == "true"
     log_enabled = os.getenv("SOLVER_LOG", "").lower() == "true"
     log_path = os.getenv("SOLVER_LOG_PATH", "")
-    try:
-        time_limit = float(os.getenv("SOLVER_TIME_LIMIT", "0"))
-    except ValueError:
-        time_limit = 0
-    if log_enabled and per_run_log and log_path:
-        model.solve(pulp.PULP_CBC_CMD(msg=True, logPath=log_path, timeLimit=time_limit))
+    time_limit = _time_limit()
+    # CBC command-line options, e.g. {"cuts": "off"} becomes "-cuts off"
+    params = profiles.params_for("pulp", profiles.features(built.scaled, built.groups))
+    options = [f"{name} {value}" for name, value in params.items()]
+    msg = log_enabled and (not log_only or per_run_log)
+    report = telemetry.reporter()
+    tail_path = None
+    if log_enabled and per_run_log and log_path and not log_is_stream(log_path):
+        tail_path = log_path
+    elif report is not None and not msg:
+        # Live incumbents only exist in the log, so keep one for the tail.
+        fd, tail_path = tempfile.mkstemp(prefix="cbc_", suffix=".log")
+        os.close(fd)
+    if tail_path is not None:
+        command = pulp.PULP_CBC_CMD(
+            msg=tail_path == log_path,
+            logPath=tail_path,
+            timeLimit=time_limit,
+            warmStart=True,
+            options=options,
+        )
     else:
-        msg = log_enabled and (not log_only or per_run_log)
-        model.solve(pulp.PULP_CBC_CMD(msg=msg, timeLimit=time_limit))
-
-    side_a = [i for i in range(n) if pulp.value(x[i]) > 0.5]
-    side_b = [i for i in range(n) if i not in side_a]
-
-    return Solution(
-        status=pulp.LpStatus[model.status],
-        max_side=float(pulp.value(L)),
-        side_a=side_a,
-        side_b=side_b,
-        sum_a=sum(lengths[i] for i in side_a),
-        sum_b=sum(lengths[i] for i in side_b),
-    )
+        command = pulp.PULP_CBC_CMD(msg=msg, timeLimit=time_limit, warmStart=True, options=options)
+
+    tail = None
+    if report is not None and tail_path is not None:
+        open(tail_path, "w").close()
+        tail = _CbcLogTail(tail_path, report)
+        tail.start()
+    try:
+        with telemetry.phase("search"):
+            model.solve(command)
+    finally:
+        if tail is not None:
+            tail.done.set()
+            tail.join()
+        if tail_path is not None and tail_path != log_path:
+            os.remove(tail_path)
+    return extract(lengths, built)
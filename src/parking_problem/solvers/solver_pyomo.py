@@ -3,42 +3,111 @@
 from __future__ import annotations
 
 import os
-from typing import List
+from dataclasses import dataclass
+from typing import Any, List
 from contextlib import redirect_stderr, redirect_stdout
 
-from .base import Solution
+from .. import telemetry
+from .base import Solution, lower_bound, scale_lengths
+from .reduction import Groups, counts_for, expand, group_lengths
+from .solver_kk import differencing
 
 
-def solve(lengths: List[float], solver_name: str) -> Solution:
+def _pyomo():
     try:
         import pyomo.environ as pyo
     except Exception as exc:  # pragma: no cover - optional dependency
         raise SystemExit(f"Pyomo is not available: {exc}") from exc
+    return pyo
+
+
+@dataclass
+class Model:
+    model: Any
+    factor: int
+    groups: Groups
+
+
+def build_model(lengths: List[float]) -> Model:
+    """Aggregated Pyomo model with the differencing warm start."""
+    pyo = _pyomo()
+    scaled, factor = scale_lengths(lengths)
+    groups = group_lengths(scaled)
+    coef = [lengths[members[0]] for members in groups.members]
+    size = [len(members) for members in groups.members]
 
-    n = len(lengths)
     model = pyo.ConcreteModel()
-    model.I = pyo.RangeSet(0, n - 1)
-    model.x = pyo.Var(model.I, domain=pyo.Binary)
-    model.L = pyo.Var(domain=pyo.NonNegativeReals)
+    model.K = pyo.RangeSet(0, len(groups.values) - 1)
+    # y_k: how many cars of the k-th distinct length go on side A
+    model.y = pyo.Var(
+        model.K, domain=pyo.NonNegativeIntegers, bounds=lambda m, j: (0, size[j])
+    )
+    L_low = lower_bound(scaled) / factor
+    model.L = pyo.Var(domain=pyo.NonNegativeReals, bounds=(L_low, None))
 
-    model.sum_a = pyo.Expression(expr=sum(lengths[i] * model.x[i] for i in model.I))
-    model.sum_b = pyo.Expression(expr=sum(lengths[i] * (1 - model.x[i]) for i in model.I))
+    model.sum_a = pyo.Expression(expr=sum(coef[j] * model.y[j] for j in model.K))
+    model.sum_b = pyo.Expression(expr=sum(coef[j] * (size[j] - model.y[j]) for j in model.K))
 
     model.c1 = pyo.Constraint(expr=model.sum_a <= model.L)
     model.c2 = pyo.Constraint(expr=model.sum_b <= model.L)
     model.obj = pyo.Objective(expr=model.L, sense=pyo.minimize)
 
-    solver = pyo.SolverFactory(solver_name)
+    # Warm start from the largest-differencing partition
+    hint_a, _ = differencing(scaled)
+    for j, count in enumerate(counts_for(groups, hint_a)):
+        model.y[j].value = count
+    hint_sum_a = sum(lengths[i] for i in hint_a)
+    # Float sums can land a hair under the exact bound; keep the start feasible
+    model.L.value = max(hint_sum_a, sum(lengths) - hint_sum_a, L_low)
+    return Model(model=model, factor=factor, groups=groups)
+
+
+def extract(lengths: List[float], built: Model, status: str) -> Solution:
+    pyo = _pyomo()
+    model = built.model
+    side_a = expand(built.groups, [int(round(pyo.value(model.y[j]))) for j in model.K])
+    in_a = set(side_a)
+    side_b = [i for i in range(len(lengths)) if i not in in_a]
+
+    sum_a = sum(lengths[i] for i in side_a)
+    sum_b = sum(lengths[i] for i in side_b)
+
+    # L is only tight up to the MIP feasibility tolerance; report the side sums
+    return Solution(
+        status=status,
+        max_side=max(sum_a, sum_b),
+        side_a=side_a,
+        side_b=side_b,
+        sum_a=sum_a,
+        sum_b=sum_b,
+    )
+
+
+def solve(lengths: List[float], solver_name: str) -> Solution:
+    pyo = _pyomo()
+    with telemetry.phase("build"):
+        built = build_model(lengths)
+    model, factor = built.model, built.factor
+
+    # The APPSI HiGHS interface accepts MIP starts; the default one does not.
+    factory_name = "appsi_highs" if solver_name == "highs" else solver_name
+    solver = pyo.SolverFactory(factory_name)
     if solver is None or not solver.available(exception_flag=False):
         raise SystemExit(
             f"Solver '{solver_name}' not available via Pyomo. "
             "Make sure it is installed and on PATH (or python package for HiGHS)."
         )
 
+    solve_kwargs = {"warmstart": True} if solver.warm_start_capable() else {}
+
     try:
         time_limit = float(os.getenv("SOLVER_TIME_LIMIT", "0"))
     except ValueError:
         time_limit = 0
+    if solver_name == "highs":
+        # HiGHS stops at a 1e-4 relative gap by default; see solver_highspy
+        solver.options["mip_rel_gap"] = 0.0
+        solver.options["mip_abs_gap"] = 0.999 / factor
     if time_limit > 0:
         # Solver-specific time limit options
         if solver_name == "highs":
@@ -51,34 +120,25 @@ def solve(lengths: List[float], solver_name: str) -> Solution:
     per_run_log = os.getenv("PER_RUN_LOG", "").lower() == "true"
     log_enabled = os.getenv("SOLVER_LOG", "").lower() == "true"
     log_path = os.getenv("SOLVER_LOG_PATH", "")
-    if log_enabled and per_run_log and log_path:
-        # Enable more verbose output if supported
-        solver.options["output_flag"] = True
-        solver.options["log_to_console"] = False
-        try:
-            result = solver.solve(model, tee=False, logfile=log_path)
-        except NotImplementedError:
-            with open(log_path, "w", encoding="utf-8") as f, redirect_stdout(f), redirect_stderr(f):
-                result = solver.solve(model, tee=True)
-    else:
-        tee = log_enabled and (not log_only or per_run_log)
-        result = solver.solve(model, tee=tee)
+    with telemetry.phase("search"):
+        if log_enabled and per_run_log and log_path:
+            # Enable more verbose output if supported
+            solver.options["output_flag"] = True
+            solver.options["log_to_console"] = False
+            try:
+                result = solver.solve(model, tee=False, logfile=log_path, **solve_kwargs)
+            except NotImplementedError:
+                with open(log_path, "w", encoding="utf-8") as f, redirect_stdout(
+                    f
+                ), redirect_stderr(f):
+                    result = solver.solve(model, tee=True, **solve_kwargs)
+        else:
+            tee = log_enabled and (not log_only or per_run_log)
+            result = solver.solve(model, tee=tee, **solve_kwargs)
 
     if log_enabled and per_run_log and log_path:
         with open(log_path, "a", encoding="utf-8") as log_file:
             log_file.write("[pyomo_stats]\n")
             log_file.write(str(result.solver))
             log_file.write("\n")
-    status = str(result.solver.status)
-
-    side_a = [i for i in range(n) if pyo.value(model.x[i]) >= 0.5]
-    side_b = [i for i in range(n) if i not in side_a]
-
-    return Solution(
-        status=status,
-        max_side=float(pyo.value(model.L)),
-        side_a=side_a,
-        side_b=side_b,
-        sum_a=sum(lengths[i] for i in side_a),
-        sum_b=sum(lengths[i] for i in side_b),
-    )
+    return extract(lengths, built, str(result.solver.status))
@@ -0,0 +1,248 @@
+"""Structured solver telemetry written as JSON lines to TELEMETRY_PATH.
+
+Each solve through the facade is one run. It emits ``run_start``, ``phase``
+timings, an ``incumbent`` per improving solution (with the best bound when the
+engine knows it) and ``run_end`` with the final status. Lines are queued and
+appended by a background thread, one write per batch, so callers on a solver
+thread never block on the file.
+
+A run may also carry an ``on_incumbent(time, objective, bound)`` callback; a
+truthy return asks the engine to stop and return its incumbent.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextvars
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from .solvers.base import Solution, is_optimal
+
+OnIncumbent = Callable[[float, float, Optional[float]], Any]
+# report(objective, bound) -> True when the engine should stop
+Reporter = Callable[[float, Optional[float]], bool]
+
+
+@dataclass
+class _Run:
+    id: str
+    path: str
+    conv_path: str
+    start: float
+    on_incumbent: Optional[OnIncumbent]
+    incumbents: int = 0
+
+
+_current: contextvars.ContextVar[Optional[_Run]] = contextvars.ContextVar(
+    "telemetry_run", default=None
+)
+
+
+class _Writer:
+    """Appends queued lines to one file from a daemon thread."""
+
+    def __init__(self, path: str) -> None:
+        self._queue: "queue.SimpleQueue[Union[str, threading.Event, None]]" = queue.SimpleQueue()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        # O_APPEND keeps whole batches intact when several processes share a file.
+        self._fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._thread = threading.Thread(target=self._loop, name="telemetry-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, line: str) -> None:
+        self._queue.put(line)
+
+    def flush(self) -> None:
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def _loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch: List[str] = []
+            markers: List[threading.Event] = []
+            while True:
+                if item is None:
+                    self._write("".join(batch))
+                    for marker in markers:
+                        marker.set()
+                    os.close(self._fd)
+                    return
+                if isinstance(item, threading.Event):
+                    markers.append(item)
+                else:
+                    batch.append(item)
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            self._write("".join(batch))
+            for marker in markers:
+                marker.set()
+
+    def _write(self, text: str) -> None:
+        data = text.encode("utf-8")
+        while data:
+            data = data[os.write(self._fd, data) :]
+
+
+_writers: Dict[Tuple[int, str], _Writer] = {}
+_writers_lock = threading.Lock()
+
+
+def _after_fork() -> None:
+    # The lock may have been held by another thread at fork time.
+    global _writers_lock
+    _writers_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork)
+
+
+def _writer(path: str) -> _Writer:
+    # One writer per process; a forked child does not inherit the thread.
+    key = (os.getpid(), path)
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = _writers[key] = _Writer(path)
+    return writer
+
+
+def flush() -> None:
+    """Block until every event emitted by this process is on disk."""
+    for (pid, _), writer in list(_writers.items()):
+        if pid == os.getpid():
+            writer.flush()
+
+
+@atexit.register
+def close() -> None:
+    pid = os.getpid()
+    with _writers_lock:
+        mine = [key for key in _writers if key[0] == pid]
+        writers = [_writers.pop(key) for key in mine]
+    for writer in writers:
+        writer.close()
+
+
+def _emit(run: Optional[_Run], event: str, fields: Dict[str, Any]) -> None:
+    path = run.path if run is not None else os.getenv("TELEMETRY_PATH", "")
+    if not path:
+        return
+    record: Dict[str, Any] = {"event": event, "ts": time.time()}
+    if run is not None:
+        record["run"] = run.id
+        record["t"] = time.perf_counter() - run.start
+    record.update(fields)
+    _writer(path).put(json.dumps(record) + "\n")
+
+
+def emit(event: str, **fields: Any) -> None:
+    """Queue one event for the current run; a no-op when telemetry is off."""
+    _emit(_current.get(), event, fields)
+
+
+@contextmanager
+def run(backend: str, n: int, on_incumbent: Optional[OnIncumbent] = None) -> Iterator[None]:
+    """Scope of one solve; nested runs (e.g. portfolio workers) get their own id.
+
+    Events are on disk when the run exits, so callers can read them back.
+    """
+    current = _Run(
+        id=uuid.uuid4().hex[:12],
+        path=os.getenv("TELEMETRY_PATH", ""),
+        conv_path=os.getenv("CONVERGENCE_LOG_PATH", ""),
+        start=time.perf_counter(),
+        on_incumbent=on_incumbent,
+    )
+    token = _current.set(current)
+    try:
+        emit("run_start", backend=backend, n=n, pid=os.getpid())
+        yield
+    except BaseException as exc:
+        emit("run_end", status="error", error=repr(exc))
+        raise
+    finally:
+        _current.reset(token)
+        for path in (current.path, current.conv_path):
+            if path and (os.getpid(), path) in _writers:
+                _writers[(os.getpid(), path)].flush()
+
+
+def run_end(solution: Solution, cached: bool = False) -> None:
+    """Close the run; engines that never reported report their answer here."""
+    run = _current.get()
+    if run is not None and run.incumbents == 0:
+        bound = solution.max_side if is_optimal(solution) else None
+        _report(run, solution.max_side, bound)
+    emit(
+        "run_end",
+        status=solution.status,
+        max_side=solution.max_side,
+        gap=solution.gap,
+        cached=cached,
+    )
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        emit("phase", name=name, seconds=time.perf_counter() - start)
+
+
+def _report(run: _Run, objective: float, bound: Optional[float]) -> bool:
+    # Also appends the legacy [convergence] line to CONVERGENCE_LOG_PATH.
+    run.incumbents += 1
+    t = time.perf_counter() - run.start
+    _emit(run, "incumbent", {"objective": objective, "bound": bound})
+    if run.conv_path:
+        _writer(run.conv_path).put(f"[convergence] {t:.6f},{objective},FEASIBLE\n")
+    if run.on_incumbent is None:
+        return False
+    return bool(run.on_incumbent(t, objective, bound))
+
+
+def reporter() -> Optional[Reporter]:
+    """Incumbent sink bound to the current run, or None when nothing listens.
+
+    Engines call it from their own callback threads, which do not see the
+    run's context, so they take it before the search starts.
+    """
+    run = _current.get()
+    if run is None or not (run.path or run.conv_path or run.on_incumbent):
+        return None
+    return lambda objective, bound=None: _report(run, objective, bound)
+
+
+def read_events(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """Parsed events from a telemetry file, skipping a torn final line."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def convergence(events: List[Dict[str, Any]]) -> List[Tuple[float, float]]:
+    """(seconds since run start, objective) for each incumbent."""
+    return [(e["t"], e["objective"]) for e in events if e["event"] == "incumbent" and "t" in e]
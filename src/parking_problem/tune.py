@@ -0,0 +1,178 @@
+"""Offline parameter tuning: ``python -m parking_problem.tune``.
+
+Sweeps a small grid of parameters per backend over the dataset corpus and a
+generated benchmark set, measures time-to-optimal over repeated seeds, and
+writes the winners as a profile file for SOLVER_PROFILE_PATH.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import statistics
+import time
+from itertools import product
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .generators import benchmark_set
+from .solvers import profiles, solver_highspy, solver_ortools, solver_pulp
+from .solvers.base import Solution, is_optimal, scale_lengths
+from .solvers.reduction import group_lengths
+
+
+def _grid(**axes: List[Any]) -> List[Dict[str, Any]]:
+    names = list(axes)
+    return [dict(zip(names, values)) for values in product(*axes.values())]
+
+
+# Search space per backend, and the parameter that reseeds it per repeat.
+SPACES: Dict[str, Tuple[Callable[[List[float]], Solution], List[Dict[str, Any]], str]] = {
+    "ortools": (
+        solver_ortools.solve,
+        _grid(
+            num_workers=[1, 4, 8],
+            cp_model_presolve=[True, False],
+            linearization_level=[0, 1, 2],
+        ),
+        "random_seed",
+    ),
+    "pulp": (
+        solver_pulp.solve,
+        _grid(cuts=["on", "off"], heuristics=["on", "off"], preprocess=["on", "off"]),
+        "randomCbcSeed",
+    ),
+    "highs": (
+        solver_highspy.solve,
+        _grid(
+            presolve=["on", "off"],
+            mip_heuristic_effort=[0.05, 0.3],
+            mip_detect_symmetry=[True, False],
+        ),
+        "random_seed",
+    ),
+}
+
+# Instances are bucketed by distinct length count; one rule per bucket.
+BUCKETS = [16, 128, 1024, None]
+
+
+def _bucket(lengths: List[float]) -> Optional[int]:
+    scaled, _ = scale_lengths(lengths)
+    distinct = profiles.features(scaled, group_lengths(scaled)).distinct
+    for limit in BUCKETS:
+        if limit is None or distinct <= limit:
+            return limit
+    return None
+
+
+def _corpus(datasets: Path, generated: bool, seed: int) -> Dict[str, List[float]]:
+    corpus: Dict[str, List[float]] = {}
+    for path in sorted(datasets.rglob("*.json")):
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        if isinstance(payload, dict) and "lengths" in payload:
+            corpus[path.stem] = payload["lengths"]
+    if generated:
+        corpus.update(benchmark_set(seed))
+    return corpus
+
+
+def _time_to_optimal(
+    solve: Callable[[List[float]], Solution], lengths: List[float], time_limit: float
+) -> float:
+    """Wall time to a proven optimum; unsolved runs count twice the limit (PAR2)."""
+    start = time.perf_counter()
+    solution = solve(lengths)
+    elapsed = time.perf_counter() - start
+    return elapsed if is_optimal(solution) else 2 * time_limit
+
+
+def _geomean(values: List[float]) -> float:
+    return math.exp(statistics.fmean(math.log(max(v, 1e-6)) for v in values))
+
+
+def tune_backend(
+    backend: str,
+    corpus: Dict[str, List[float]],
+    seeds: int,
+    time_limit: float,
+    log: Callable[[str], None] = print,
+) -> List[Dict[str, Any]]:
+    """Best parameters per bucket for ``backend``, as profile rules."""
+    solve, grid, seed_param = SPACES[backend]
+    # Worker counts above this run's CPU share would be capped to the same run.
+    budget = profiles.thread_budget()
+    grid = [p for p in grid if p.get("num_workers", 1) <= budget] or grid
+    by_bucket: Dict[Optional[int], List[List[float]]] = {}
+    for lengths in corpus.values():
+        by_bucket.setdefault(_bucket(lengths), []).append(lengths)
+
+    rules: List[Dict[str, Any]] = []
+    for limit in BUCKETS:
+        instances = by_bucket.get(limit)
+        if not instances:
+            continue
+        scores: List[Tuple[float, Dict[str, Any]]] = []
+        for params in grid:
+            times = []
+            for lengths in instances:
+                runs = []
+                for seed in range(seeds):
+                    with profiles.override(backend, {**params, seed_param: seed}):
+                        runs.append(_time_to_optimal(solve, lengths, time_limit))
+                times.append(statistics.median(runs))
+            score = _geomean(times)
+            scores.append((score, params))
+            log(f"[tune] {backend} distinct<={limit} {params} score={score:.4f}s")
+        score, best = min(scores, key=lambda item: item[0])
+        log(f"[tune] {backend} distinct<={limit} best {best} score={score:.4f}s")
+        rules.append({"when": {"max_distinct": limit} if limit else {}, "params": best})
+    return rules
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Tune solver parameters per instance size")
+    parser.add_argument(
+        "--backend",
+        action="append",
+        choices=sorted(SPACES),
+        help="Backend to tune (repeatable; default: all)",
+    )
+    parser.add_argument("--datasets", default="datasets", help="Directory of instance files")
+    parser.add_argument(
+        "--no-generated", action="store_true", help="Skip the generated benchmark set"
+    )
+    parser.add_argument("--seeds", type=int, default=3, help="Repeats per configuration")
+    parser.add_argument("--time-limit", type=float, default=10.0, help="Seconds per solve")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for generated instances")
+    parser.add_argument("--output", default="solver_profiles.json", help="Profile file to write")
+    args = parser.parse_args(argv)
+
+    # Measure the engines themselves: no presolve shortcut, cache or solver logs.
+    os.environ["SOLVER_TIME_LIMIT"] = str(args.time_limit)
+    os.environ["PRESOLVE"] = "false"
+    os.environ["SOLVER_LOG"] = "false"
+    os.environ.pop("SOLUTION_CACHE_PATH", None)
+    os.environ.pop("CONVERGENCE_LOG_PATH", None)
+    os.environ.pop("CBC_IN_PROCESS", None)
+
+    corpus = _corpus(Path(args.datasets), not args.no_generated, args.seed)
+    if not corpus:
+        raise SystemExit(f"No instances found under {args.datasets}")
+
+    output = Path(args.output)
+    profile: Dict[str, Any] = {}
+    if output.exists():
+        profile = json.loads(output.read_text(encoding="utf-8"))
+    for backend in args.backend or sorted(SPACES):
+        profile[backend] = tune_backend(backend, corpus, args.seeds, args.time_limit)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(profile, indent=2) + "\n", encoding="utf-8")
+    print(f"[tune] wrote {output}; set SOLVER_PROFILE_PATH={output} to use it")
+
+
+if __name__ == "__main__":
+    main()
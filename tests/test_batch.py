@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from tests.utils import ROOT, load_instance
+
+from parking_problem import solve, solve_many  # noqa: E402
+from parking_problem.validator import validate_solution  # noqa: E402
+
+
+def _instances() -> list[list[float]]:
+    paths = [
+        ROOT / "datasets" / "disponibilizada" / "figure_2_1.json",
+        ROOT / "datasets" / "adaptada" / "bp20_first_15.json",
+        ROOT / "datasets" / "gerada" / "heavy_uniform_50.json",
+        ROOT / "datasets" / "gerada" / "heavy_bimodal_100.json",
+        ROOT / "datasets" / "gerada" / "heavy_narrow_200.json",
+    ]
+    return [load_instance(Path(p)) for p in paths]
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+@pytest.mark.parametrize("chunksize", [1, 2])
+def test_solve_many_matches_solve(ordered: bool, chunksize: int) -> None:
+    instances = _instances() * 6
+    results = list(
+        solve_many(
+            iter(instances),
+            "dp",
+            workers=2,
+            ordered=ordered,
+            chunksize=chunksize,
+            max_in_flight=2,
+        )
+    )
+
+    indices = [index for index, _ in results]
+    if ordered:
+        assert indices == list(range(len(instances)))
+    assert sorted(indices) == list(range(len(instances)))
+    for index, solution in results:
+        validate_solution(instances[index], solution)
+        assert solution.max_side == solve(instances[index], "dp", "highs").max_side
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from tests.utils import ROOT
+
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+import compare  # noqa: E402
+import micro  # noqa: E402
+import scaling  # noqa: E402
+
+
+def test_micro_writes_samples_and_percentiles(tmp_path: Path) -> None:
+    output = tmp_path / "micro.json"
+    micro.main(
+        [
+            "--sizes", "15,200",
+            "--filter", "scale_lengths|build_model\\[highs\\]|validate",
+            "--warmup", "0",
+            "--repeats", "3",
+            "--min-time", "0",
+            "--output", str(output),
+        ]
+    )
+
+    payload = json.loads(output.read_text(encoding="utf-8"))
+    assert payload["kind"] == "micro"
+    keys = {(r["name"], r["backend"], r["instance"]) for r in payload["results"]}
+    assert ("build_model", "highs", "n=200") in keys
+    assert ("validate_solution", None, "n=15") in keys
+    for record in payload["results"]:
+        assert len(record["samples"]) == 3
+        stats = record["stats"]
+        assert stats["min"] <= stats["p50"] <= stats["p90"] <= stats["p99"] <= stats["max"]
+
+
+def test_scaling_records_runs_and_fits(tmp_path: Path) -> None:
+    output = tmp_path / "scaling.json"
+    scaling.main(
+        [
+            "--sizes", "15,60",
+            "--magnitudes", "1e3",
+            "--backends", "dp,kk",
+            "--repeats", "1",
+            "--time-limit", "10",
+            "--output", str(output),
+        ]
+    )
+
+    payload = json.loads(output.read_text(encoding="utf-8"))
+    assert payload["kind"] == "scaling"
+    assert {(r["backend"], r["instance"]) for r in payload["results"]} >= {("dp", "n=60,max=1000")}
+    for record in payload["results"]:
+        (run,) = record["runs"]
+        assert run["wall"] > 0 and run["peak_rss_mb"] > 0
+        assert run["first_incumbent"] <= run["wall"]
+    assert any(fit["backend"] == "dp" for fit in payload["fits"])
+
+
+def _result_file(path: Path, samples: dict) -> Path:
+    results = [
+        {"name": "solve", "backend": backend, "instance": "n=100", "samples": values}
+        for backend, values in samples.items()
+    ]
+    path.write_text(json.dumps({"kind": "micro", "results": results}), encoding="utf-8")
+    return path
+
+
+def test_compare_flags_significant_slowdown_only(tmp_path: Path) -> None:
+    base = [1.0, 1.02, 0.99, 1.01, 1.0, 0.98, 1.03, 1.0]
+    baseline = _result_file(tmp_path / "base.json", {"kk": base, "dp": base})
+    noise = [1.01, 0.99, 1.0, 1.02, 0.98, 1.0, 1.01, 1.0]
+    candidate = _result_file(
+        tmp_path / "cand.json", {"kk": noise, "dp": [v * 1.3 for v in base]}
+    )
+    output = tmp_path / "compare.json"
+
+    with pytest.raises(SystemExit) as exc:
+        compare.main([str(baseline), str(candidate), "--output", str(output)])
+    assert exc.value.code == 1
+
+    verdicts = {c["backend"]: c for c in json.loads(output.read_text(encoding="utf-8"))["comparisons"]}
+    assert verdicts["dp"]["verdict"] == "regression"
+    assert verdicts["dp"]["cliffs_delta"] == 1.0
+    assert verdicts["kk"]["verdict"] == "same"
+
+    compare.main([str(baseline), str(baseline)])
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+
+from tests.utils import ROOT, load_instance
+
+from parking_problem import cache, solver_main  # noqa: E402
+from parking_problem.solver_main import solve  # noqa: E402
+from parking_problem.validator import validate_solution  # noqa: E402
+
+
+@pytest.fixture
+def cache_path(tmp_path: Path, monkeypatch) -> Path:
+    path = tmp_path / "solutions.sqlite"
+    monkeypatch.setenv("SOLUTION_CACHE_PATH", str(path))
+    monkeypatch.setenv("PRESOLVE", "false")
+    cache._memory.clear()
+    return path
+
+
+def _no_solver(lengths):
+    raise AssertionError("solver should not run on a cache hit")
+
+
+def test_cache_serves_permuted_instance(cache_path: Path, monkeypatch) -> None:
+    lengths = load_instance(ROOT / "datasets" / "gerada" / "heavy_bimodal_100.json")
+    first = solve(lengths, "dp", "highs")
+
+    permuted = list(lengths)
+    random.Random(7).shuffle(permuted)
+    monkeypatch.setattr(solver_main.solver_dp, "solve", _no_solver)
+    cache._memory.clear()  # force the on-disk path
+    hit = solve(permuted, "dp", "highs")
+
+    validate_solution(permuted, hit)
+    assert hit.status == "OPTIMAL"
+    assert hit.max_side == pytest.approx(first.max_side)
+    assert cache_path.exists()
+
+
+def test_cache_skips_non_optimal_and_evicts(cache_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("SOLUTION_CACHE_MAX_ENTRIES", "2")
+    instances = [[1.0, 2.0, 3.5], [1.0, 2.0, 4.5], [1.0, 2.0, 5.5]]
+    for lengths in instances:
+        solve(lengths, "dp", "highs")
+    # kk cannot prove [4.0, 4.5, 5.0] optimal, so nothing is stored for it
+    solve([4.0, 4.5, 5.0], "kk", "highs")
+
+    conn = cache._connect(str(cache_path))
+    assert conn.execute("SELECT COUNT(*) FROM solutions").fetchone()[0] == 2
+
+    cache._memory.clear()
+    monkeypatch.setattr(solver_main.solver_dp, "solve", _no_solver)
+    assert solve(instances[2], "dp", "highs").status == "OPTIMAL"
+    with pytest.raises(AssertionError):
+        solve(instances[0], "dp", "highs")
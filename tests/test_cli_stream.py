@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import io
+import json
+import sys
+
+import pytest
+
+from tests.utils import ROOT, load_instance
+
+from parking_problem import cli  # noqa: E402
+
+
+def _run(monkeypatch, capsys, lines: list[str], *flags: str) -> list[dict]:
+    monkeypatch.setattr(sys, "stdin", io.StringIO("\n".join(lines) + "\n"))
+    monkeypatch.setattr(sys, "argv", ["parking_problem", "--stream", "--solver", "dp", *flags])
+    cli.main()
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+@pytest.mark.parametrize("workers", ["1", "2"])
+def test_stream_writes_one_record_per_line_in_order(monkeypatch, capsys, workers: str) -> None:
+    figure = load_instance(ROOT / "datasets" / "disponibilizada" / "figure_2_1.json")
+    bimodal = load_instance(ROOT / "datasets" / "gerada" / "heavy_bimodal_100.json")
+    lines = [
+        json.dumps({"id": "figure", "lengths": figure}),
+        "not json",
+        json.dumps(bimodal),
+        json.dumps({"lengths": [1.0, -2.0]}),
+        json.dumps(figure),
+    ]
+
+    records = _run(monkeypatch, capsys, lines, "--ordered", "--workers", workers)
+
+    assert [r["id"] for r in records] == ["figure", 2, 3, 4, 5]
+    assert "error" in records[1] and "error" in records[3]
+    for record, lengths in ((records[0], figure), (records[2], bimodal), (records[4], figure)):
+        assert record["max_side"] == cli.solve(lengths, "dp", "highs").max_side
+
+
+def test_stream_expected_count(monkeypatch, capsys) -> None:
+    records = _run(monkeypatch, capsys, ["[1, 2, 3]", "[1, 2]"], "--expected-count", "2")
+    assert "error" in records[0]
+    assert records[1]["max_side"] == 2
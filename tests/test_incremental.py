@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from tests.utils import ROOT, load_instance
+
+from parking_problem import IncrementalPartitioner  # noqa: E402
+from parking_problem.solvers import solver_dp  # noqa: E402
+from parking_problem.validator import validate_solution  # noqa: E402
+
+
+def test_incremental_matches_full_solve() -> None:
+    rng = random.Random(7)
+    lengths = load_instance(ROOT / "datasets" / "disponibilizada" / "figure_2_1.json")
+    lot = IncrementalPartitioner(lengths)
+    current = list(lengths)
+
+    for _ in range(60):
+        if current and rng.random() < 0.4:
+            index = rng.randrange(len(current))
+            current.pop(index)
+            solution = lot.remove(index)
+        else:
+            length = round(rng.uniform(2.0, 6.0), rng.choice([1, 2]))
+            current.append(length)
+            solution = lot.add(length)
+
+        assert lot.lengths == current
+        validate_solution(current, solution)
+        assert solution.max_side == pytest.approx(solver_dp.solve(current).max_side)
+
+
+def test_incremental_remove_rejects_bad_index() -> None:
+    lot = IncrementalPartitioner([1.0, 2.0])
+    with pytest.raises(IndexError):
+        lot.remove(2)
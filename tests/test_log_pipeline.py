@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import subprocess
+
+from tests.utils import ROOT, _OutputTee, load_instance, run_and_validate
+
+
+def test_tee_streams_native_output_and_parses_cbc_incumbents(tmp_path) -> None:
+    log_path = tmp_path / "out.log.gz"
+    with gzip.open(log_path, "wb") as f:
+        with _OutputTee(f) as tee:
+            os.write(1, b"Cbc0012I Integer solution of 12.5 found by heuristic (0.25 seconds)\n")
+            subprocess.run(["echo", "from a child"], check=True)
+            os.write(2, b"Cbc0004I Integer solution of 11 found after 9 iterations and 3 nodes (0.5 seconds)")
+
+    text = gzip.open(log_path, "rt").read()
+    assert "from a child" in text
+    assert text.endswith("(0.5 seconds)\n")
+    assert tee.points == [(0.25, 12.5), (0.5, 11.0)]
+
+
+def test_run_writes_one_compressed_log_and_a_sidecar(monkeypatch) -> None:
+    monkeypatch.setenv("SOLVER_LOG", "true")
+    monkeypatch.setenv("PER_RUN_LOG", "true")
+    lengths = load_instance(ROOT / "datasets" / "disponibilizada" / "figure_2_1.json")
+    log_dir = ROOT / "tests" / "logs"
+    before = set(log_dir.glob("*")) if log_dir.exists() else set()
+
+    run_and_validate(lengths, "ortools", label="pipeline")
+
+    new = sorted(p.name for p in set(log_dir.glob("*")) - before)
+    assert [name.split("_")[0] for name in new] == ["convergence", "output"]
+    log_name, sidecar_name = new[1], new[0]
+    assert log_name.endswith(".log.gz")
+
+    text = gzip.open(log_dir / log_name, "rt").read()
+    assert "[result] status=OPTIMAL" in text
+    # CP-SAT's own log file went through the tee too.
+    assert "[ortools_stats]" in text
+
+    sidecar = json.loads((log_dir / sidecar_name).read_text(encoding="utf-8"))
+    assert sidecar["status"] == "OPTIMAL"
+    assert sidecar["points"][-1][1] == sidecar["max_side"]
+    assert len(sidecar["points"]) >= 2
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from tests.utils import ROOT, load_instance, run_matrix
+
+from parking_problem import solver_main  # noqa: E402
+from parking_problem.generators import gen_integers  # noqa: E402
+from parking_problem.solver_main import solve  # noqa: E402
+from parking_problem.solvers.base import is_optimal, lower_bound, scale_lengths  # noqa: E402
+from parking_problem.solvers.reduction import counts_for, expand, group_lengths  # noqa: E402
+from parking_problem.validator import validate_solution  # noqa: E402
+
+
+# Optimal max side per instance, as proven by CP-SAT in tests/logs.
+OPTIMA = {
+    "figure_2_1.json": 28.6,
+    "bp20_first_15.json": 19.3,
+    "heavy_uniform_50.json": 138.6,
+    "heavy_bimodal_100.json": 254.05,
+    "heavy_narrow_200.json": 499.08,
+}
+
+
+def _instance_paths() -> list[Path]:
+    return [
+        ROOT / "datasets" / "disponibilizada" / "figure_2_1.json",
+        ROOT / "datasets" / "adaptada" / "bp20_first_15.json",
+        ROOT / "datasets" / "gerada" / "heavy_uniform_50.json",
+        ROOT / "datasets" / "gerada" / "heavy_bimodal_100.json",
+        ROOT / "datasets" / "gerada" / "heavy_narrow_200.json",
+    ]
+
+
+def test_all_instances_native_solvers() -> None:
+    solvers = ["dp", "kk", "portfolio"]
+
+    tasks = []
+    for path in _instance_paths():
+        lengths = load_instance(path)
+        for solver in solvers:
+            tasks.append((lengths, solver, "highs", path.name))
+    run_matrix(tasks)
+
+
+@pytest.mark.parametrize("path", _instance_paths(), ids=lambda p: p.name)
+def test_dp_matches_known_optimum(path: Path) -> None:
+    lengths = load_instance(path)
+    result = solve(lengths, "dp", "highs")
+    validate_solution(lengths, result)
+    assert result.status == "OPTIMAL"
+    assert result.max_side == pytest.approx(OPTIMA[path.name])
+
+
+@pytest.mark.parametrize("path", _instance_paths(), ids=lambda p: p.name)
+def test_highs_matches_known_optimum(path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("PRESOLVE", "false")
+    lengths = load_instance(path)
+    result = solve(lengths, "highs", "highs")
+    validate_solution(lengths, result)
+    assert result.status == "OPTIMAL"
+    assert result.max_side == pytest.approx(OPTIMA[path.name])
+
+
+@pytest.mark.parametrize(
+    "path",
+    [p for p in _instance_paths() if p.name != "heavy_bimodal_100.json"],
+    ids=lambda p: p.name,
+)
+def test_pulp_in_process_cbc_matches_known_optimum(path: Path, monkeypatch) -> None:
+    # CBC cannot close the 0.02 gap on heavy_bimodal_100 within the test time
+    # limit, in-process or not.
+    def _no_subprocess(*args, **kwargs):
+        raise AssertionError("in-process CBC must not spawn a subprocess")
+
+    monkeypatch.setenv("PRESOLVE", "false")
+    monkeypatch.setenv("CBC_IN_PROCESS", "true")
+    monkeypatch.setattr(subprocess, "Popen", _no_subprocess)
+    lengths = load_instance(path)
+    result = solve(lengths, "pulp", "highs")
+    validate_solution(lengths, result)
+    assert result.status == "Optimal"
+    assert result.max_side == pytest.approx(OPTIMA[path.name])
+
+
+@pytest.mark.parametrize("path", _instance_paths(), ids=lambda p: p.name)
+def test_kk_reports_gap_to_half_sum(path: Path) -> None:
+    lengths = load_instance(path)
+    result = solve(lengths, "kk", "highs")
+    validate_solution(lengths, result)
+    scaled, factor = scale_lengths(lengths)
+    half = (sum(scaled) + 1) // 2 / factor
+    assert result.max_side >= OPTIMA[path.name] - 1e-6
+    assert result.gap == pytest.approx(result.max_side - half, abs=1e-6)
+
+
+@pytest.mark.parametrize(
+    "path",
+    [p for p in _instance_paths() if p.name != "heavy_bimodal_100.json"],
+    ids=lambda p: p.name,
+)
+def test_ckk_proves_perfect_partitions(path: Path, tmp_path: Path, monkeypatch) -> None:
+    # heavy_bimodal_100 has no perfect partition, so CKK would have to
+    # exhaust the whole tree; it is left to dp/ortools.
+    conv_path = tmp_path / "conv.log"
+    monkeypatch.setenv("CONVERGENCE_LOG_PATH", str(conv_path))
+    monkeypatch.setenv("PRESOLVE", "false")
+    lengths = load_instance(path)
+    result = solve(lengths, "ckk", "highs")
+    validate_solution(lengths, result)
+    assert result.status == "OPTIMAL"
+    assert result.max_side == pytest.approx(OPTIMA[path.name])
+    lines = conv_path.read_text(encoding="utf-8").splitlines()
+    assert lines and all(line.endswith(",FEASIBLE") for line in lines)
+
+
+def test_presolve_skips_model_when_bound_is_met(monkeypatch) -> None:
+    def _no_model(lengths):
+        raise AssertionError("model should not be built")
+
+    monkeypatch.setenv("PRESOLVE", "true")
+    monkeypatch.setattr(solver_main.solver_ortools, "solve", _no_model)
+    lengths = load_instance(ROOT / "datasets" / "gerada" / "heavy_narrow_200.json")
+    result = solve(lengths, "ortools", "highs")
+    validate_solution(lengths, result)
+    assert result.status == "OPTIMAL"
+    assert result.max_side == pytest.approx(OPTIMA["heavy_narrow_200.json"])
+
+
+def test_presolve_defers_when_bound_is_not_met() -> None:
+    # The optimum of heavy_bimodal_100 (254.05) sits above ceil(sum/2) (254.03).
+    lengths = load_instance(ROOT / "datasets" / "gerada" / "heavy_bimodal_100.json")
+    assert solver_main.presolve(lengths) is None
+
+
+def test_portfolio_returns_first_optimum(monkeypatch) -> None:
+    monkeypatch.setenv("PRESOLVE", "false")
+    monkeypatch.setenv("PORTFOLIO_BACKENDS", "ortools,pulp,highs")
+    lengths = load_instance(ROOT / "datasets" / "disponibilizada" / "figure_2_1.json")
+    result = solve(lengths, "portfolio", "highs")
+    validate_solution(lengths, result)
+    assert result.status in {"OPTIMAL", "Optimal"}
+    assert result.max_side == pytest.approx(OPTIMA["figure_2_1.json"])
+
+
+def test_reduction_round_trips_per_car_assignment() -> None:
+    lengths = load_instance(ROOT / "datasets" / "gerada" / "heavy_bimodal_100.json")
+    scaled, _ = scale_lengths(lengths)
+    groups = group_lengths(scaled)
+    assert len(groups.values) < len(scaled)
+
+    side_a = list(range(0, len(scaled), 3))
+    expanded = expand(groups, counts_for(groups, side_a))
+    assert len(expanded) == len(side_a)
+    assert sum(scaled[i] for i in expanded) == sum(scaled[i] for i in side_a)
+
+
+@pytest.mark.parametrize("in_process", [False, True], ids=["highs", "cbc"])
+def test_mip_optimality_needs_exact_bound_beyond_tolerance(in_process: bool, monkeypatch) -> None:
+    # Lengths near 1e9 put the 1e-6 integrality slack far above one unit, where
+    # HiGHS and CBC both stop above the perfect split and still claim OPTIMAL.
+    monkeypatch.setenv("PRESOLVE", "false")
+    monkeypatch.setenv("SOLVER_TIME_LIMIT", "10")
+    monkeypatch.setenv("CBC_IN_PROCESS", "true")
+    lengths = gen_integers(60, 10**9, seed=1)
+    result = solve(lengths, "pulp" if in_process else "highs", "highs")
+    validate_solution(lengths, result)
+    scaled, _ = scale_lengths(lengths)
+    assert is_optimal(result) == (result.max_side == lower_bound(scaled))
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import math
+
+from tests.utils import ROOT  # noqa: F401
+
+from parking_problem import plotting  # noqa: E402
+from parking_problem.plotting import PlotJob  # noqa: E402
+
+
+def test_lttb_keeps_endpoints_and_peaks() -> None:
+    points = [(float(i), math.sin(i / 50)) for i in range(10_000)]
+    points[5_000] = (5_000.0, 10.0)
+
+    sampled = plotting.lttb(points, 500)
+
+    assert len(sampled) == 500
+    assert sampled[0] == points[0] and sampled[-1] == points[-1]
+    assert (5_000.0, 10.0) in sampled
+    assert [x for x, _ in sampled] == sorted(x for x, _ in sampled)
+    assert plotting.lttb(points[:100], 500) == points[:100]
+
+
+def test_convergence_job_sorts_and_downsamples() -> None:
+    points = [(float(t), 1e6 - t) for t in range(50_000, 0, -1)]
+    job = plotting.convergence_job(points, "out.png", "run")
+    assert len(job.data["points"]) == plotting.MAX_POINTS
+    assert job.data["points"][0] == (1.0, 1e6 - 1)
+
+
+def test_render_all_skips_unchanged_charts(tmp_path, monkeypatch) -> None:
+    drawn = []
+
+    def fake_render(job: PlotJob) -> None:
+        drawn.append(job.path)
+        open(job.path, "wb").close()
+
+    monkeypatch.setattr(plotting, "render", fake_render)
+    jobs = [
+        plotting.convergence_job([(0, 2), (1, 1)], str(tmp_path / "a.png"), "a"),
+        PlotJob("bar", str(tmp_path / "b.png"), "b", {"labels": ["x"], "values": [1]}),
+    ]
+
+    assert plotting.render_all(jobs, workers=1) == (2, 0)
+    assert plotting.render_all(jobs, workers=1) == (0, 2)
+
+    jobs[1] = PlotJob("bar", str(tmp_path / "b.png"), "b", {"labels": ["x"], "values": [2]})
+    (tmp_path / "a.png").unlink()
+    drawn.clear()
+    assert plotting.render_all(jobs, workers=1) == (2, 0)
+    assert sorted(drawn) == [str(tmp_path / "a.png"), str(tmp_path / "b.png")]
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from tests.utils import ROOT, load_instance
+
+from parking_problem.solver_main import solve  # noqa: E402
+from parking_problem.solvers import profiles  # noqa: E402
+from parking_problem.solvers.base import scale_lengths  # noqa: E402
+from parking_problem.solvers.reduction import group_lengths  # noqa: E402
+
+
+def _features(path: Path) -> profiles.Features:
+    scaled, _ = scale_lengths(load_instance(path))
+    return profiles.features(scaled, group_lengths(scaled))
+
+
+def test_small_instance_gets_single_worker(monkeypatch) -> None:
+    monkeypatch.delenv("SOLVER_PROFILE_PATH", raising=False)
+    feats = _features(ROOT / "datasets" / "adaptada" / "bp20_first_15.json")
+    assert feats.n == 15 and feats.distinct == 12
+    params = profiles.params_for("ortools", feats)
+    assert params["num_workers"] == 1
+    assert params["cp_model_presolve"] is False
+
+
+def test_workers_capped_by_concurrent_runs(monkeypatch) -> None:
+    monkeypatch.delenv("SOLVER_PROFILE_PATH", raising=False)
+    monkeypatch.setattr(profiles.os, "cpu_count", lambda: 12)
+    monkeypatch.setattr(profiles.os, "sched_getaffinity", lambda pid: set(range(12)), raising=False)
+    monkeypatch.setenv("MAX_THREADS", "6")
+    feats = profiles.Features(n=5000, distinct=5000, bits=40, duplicate_ratio=0.0)
+    assert profiles.params_for("ortools", feats)["num_workers"] == 2
+
+
+def test_profile_file_overrides_builtin(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "profile.json"
+    rule = {"when": {"min_duplicate_ratio": 0.1}, "params": {"linearization_level": 2}}
+    path.write_text(json.dumps({"ortools": [rule]}), encoding="utf-8")
+    monkeypatch.setenv("SOLVER_PROFILE_PATH", str(path))
+    monkeypatch.setenv("PRESOLVE", "false")
+
+    bimodal = ROOT / "datasets" / "gerada" / "heavy_bimodal_100.json"
+    narrow = ROOT / "datasets" / "gerada" / "heavy_narrow_200.json"
+    assert profiles.params_for("ortools", _features(bimodal)) == {"linearization_level": 2}
+    assert "num_workers" in profiles.params_for("ortools", _features(narrow))
+    assert solve(load_instance(bimodal), "ortools", "highs").status == "OPTIMAL"
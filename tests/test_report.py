@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import time
+
+from tests.utils import ROOT  # noqa: F401
+
+from parking_problem import report  # noqa: E402
+from parking_problem.report import Stage  # noqa: E402
+
+# Each script appends its name to runs.log, so the test sees what ran.
+COPY = """import time
+from pathlib import Path
+open("runs.log", "a").write("{name}\\n")
+time.sleep({sleep})
+Path("{out}").write_text("".join(Path(p).read_text() for p in {inputs!r}) + "{name}")
+"""
+APPEND = """from pathlib import Path
+open("runs.log", "a").write("table\\n")
+md = Path("report.md").read_text().split("## table")[0]
+Path("report.md").write_text(md + "## table " + Path("a.out").read_text())
+"""
+
+
+def _stages(root) -> list[Stage]:
+    scripts = root / "scripts"
+    scripts.mkdir()
+    specs = [
+        ("a", ["src.txt"], "a.out", 0),
+        # b and c only need a; both sleep, so they must overlap to finish in time.
+        ("b", ["a.out"], "b.out", 0.5),
+        ("c", ["a.out"], "c.out", 0.5),
+        ("d", ["b.out", "c.out", "report.md"], "d.out", 0),
+    ]
+    stages = []
+    for name, inputs, out, sleep in specs:
+        (scripts / f"{name}.py").write_text(
+            COPY.format(name=name, inputs=inputs, out=out, sleep=sleep)
+        )
+        stages.append(Stage(name, f"scripts/{name}.py", tuple(inputs), (out,)))
+    (scripts / "table.py").write_text(APPEND)
+    stages.append(Stage("table", "scripts/table.py", ("a.out", "report.md"), ("report.md",)))
+    return stages
+
+
+def _runs(root) -> list[str]:
+    path = root / "runs.log"
+    runs = sorted(path.read_text().split()) if path.exists() else []
+    path.unlink(missing_ok=True)
+    return runs
+
+
+def test_build_reruns_only_changed_stages_in_parallel(tmp_path) -> None:
+    stages = _stages(tmp_path)
+    (tmp_path / "src.txt").write_text("v1")
+    (tmp_path / "report.md").write_text("# report\n")
+
+    start = time.perf_counter()
+    outcome = report.build(tmp_path, stages, jobs=4)
+    assert time.perf_counter() - start < 2.5
+    assert set(outcome.values()) == {"built"}
+    assert _runs(tmp_path) == ["a", "b", "c", "d", "table"]
+    assert (tmp_path / "report.md").read_text() == "# report\n## table v1a"
+
+    # Nothing changed, including the markdown the table stage rewrote.
+    assert set(report.build(tmp_path, stages).values()) == {"fresh"}
+    assert _runs(tmp_path) == []
+
+    # A deleted output rebuilds its stage and only the stages reading it.
+    (tmp_path / "b.out").unlink()
+    report.build(tmp_path, stages)
+    assert _runs(tmp_path) == ["b"]
+
+    # New input content flows down the whole graph.
+    (tmp_path / "src.txt").write_text("v2")
+    assert report.build(tmp_path, stages, dry_run=True)["d"] == "stale"
+    assert _runs(tmp_path) == []
+    report.build(tmp_path, stages)
+    assert _runs(tmp_path) == ["a", "b", "c", "d", "table"]
+
+
+def test_build_skips_dependents_of_a_failed_stage(tmp_path) -> None:
+    stages = _stages(tmp_path)
+    (tmp_path / "src.txt").write_text("v1")
+    (tmp_path / "report.md").write_text("# report\n")
+    (tmp_path / "scripts" / "b.py").write_text("raise SystemExit(3)\n")
+
+    outcome = report.build(tmp_path, stages)
+
+    assert outcome["b"] == "failed"
+    assert outcome["d"] == "skipped"
+    assert outcome["c"] == "built"
+    # The failure is retried on the next build; the rest is up to date.
+    _runs(tmp_path)
+    assert report.build(tmp_path, stages)["c"] == "fresh"
+    assert _runs(tmp_path) == []
+    (tmp_path / "scripts" / "b.py").write_text(
+        COPY.format(name="b", inputs=["a.out"], out="b.out", sleep=0)
+    )
+    assert report.build(tmp_path, stages)["d"] == "built"
+    assert _runs(tmp_path) == ["b", "d"]
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+
+from tests.utils import ROOT, load_instance
+
+from parking_problem import results, telemetry  # noqa: E402
+from parking_problem.solver_main import solve  # noqa: E402
+
+LEGACY_LOG = """[run] instance=bp20 solver=pulp
+[done] instance=bp20 solver=pulp elapsed=0.512s
+[result] status=Optimal max_side=28.6
+[convergence] time_sec,objective,status
+[convergence] 0.512000,28.6,Optimal
+[convergence] 0.100000,29.1,FEASIBLE
+"""
+
+GZ_LOG = """[run] instance=fig solver=ortools
+[solver_log_begin]
+[ortools_stats]
+CpSolverResponse summary:
+status: OPTIMAL
+conflicts: 3
+[solver_log_end]
+[result] status=OPTIMAL max_side=28.6
+"""
+
+
+def _write_runs(log_dir) -> None:
+    (log_dir / "output_bp20_pulp_20260101-120000-000001.log").write_text(LEGACY_LOG)
+    run = "fig_ortools_20260101-120001-000002"
+    with gzip.open(log_dir / f"output_{run}.log.gz", "wt") as f:
+        f.write(GZ_LOG)
+    sidecar = {
+        "instance": "fig",
+        "solver": "ortools",
+        "timestamp": "2026-01-01T12:00:01.000002",
+        "code_version": "abc1234",
+        "status": "OPTIMAL",
+        "max_side": 28.6,
+        "time_sec": 0.25,
+        "points": [[0.1, 28.8], [0.2, 28.6], [0.25, 28.6]],
+    }
+    (log_dir / f"convergence_{run}.json").write_text(json.dumps(sidecar))
+
+
+def test_log_ingestion_is_incremental(tmp_path) -> None:
+    _write_runs(tmp_path)
+    conn = results.connect(tmp_path / "results.sqlite")
+
+    assert results.ingest_logs(conn, tmp_path) == 2
+    assert results.ingest_logs(conn, tmp_path) == 0
+
+    rows = {r["solver"]: r for r in results.report_rows(conn)}
+    assert rows["pulp"]["instance"] == "bp20"
+    assert rows["pulp"]["time_sec"] == "0.512000"
+    assert rows["pulp"]["conv_points"] == "2"
+    assert rows["ortools"]["conv_points"] == "3"
+    assert conn.execute(
+        "SELECT code_version FROM runs WHERE backend = 'ortools'"
+    ).fetchone() == ("abc1234",)
+    stats = dict(conn.execute("SELECT name, value FROM solver_stats"))
+    assert stats["conflicts"] == "3"
+
+    # A rewritten log replaces its run instead of adding another.
+    legacy = tmp_path / "output_bp20_pulp_20260101-120000-000001.log"
+    legacy.write_text(LEGACY_LOG.replace("28.6", "28.7"))
+    os.utime(legacy, ns=(1, 1))
+    assert results.ingest_logs(conn, tmp_path) == 1
+    rows = results.report_rows(conn)
+    assert len(rows) == 2
+    assert {r["max_side"] for r in rows if r["solver"] == "pulp"} == {"28.7"}
+
+
+def test_telemetry_ingestion_reads_only_appended_events(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "telemetry.jsonl"
+    monkeypatch.setenv("TELEMETRY_PATH", str(path))
+    monkeypatch.setenv("PRESOLVE", "false")
+    lengths = load_instance(ROOT / "datasets" / "disponibilizada" / "figure_2_1.json")
+    conn = results.connect(tmp_path / "results.sqlite")
+
+    solve(lengths, "ckk", "highs")
+    telemetry.flush()
+    first = results.ingest_telemetry(conn, path)
+    assert first > 0
+    assert results.ingest_telemetry(conn, path) == 0
+
+    solve(lengths, "ortools", "highs")
+    telemetry.flush()
+    assert results.ingest_telemetry(conn, path) > 0
+
+    runs = conn.execute("SELECT backend, status FROM runs ORDER BY id").fetchall()
+    assert [backend for backend, _ in runs] == ["ckk", "ortools"]
+    assert runs[0][1] == "OPTIMAL"
+    stats = dict(conn.execute("SELECT name, value FROM solver_stats WHERE run_id = 2"))
+    assert "phase_search_sec" in stats
+
+
+def test_report_rows_fall_back_to_csv(tmp_path) -> None:
+    csv_path = tmp_path / "solver_comparison.csv"
+    results.write_csv(csv_path, [dict.fromkeys(results.REPORT_COLUMNS, "x")])
+    rows = results.load_report_rows(csv_path, tmp_path / "missing.sqlite")
+    assert rows == [dict.fromkeys(results.REPORT_COLUMNS, "x")]
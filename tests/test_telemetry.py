@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from tests.utils import ROOT, load_instance
+
+from parking_problem import telemetry  # noqa: E402
+from parking_problem.solver_main import solve  # noqa: E402
+from parking_problem.solvers import profiles, solver_pulp  # noqa: E402
+from parking_problem.validator import validate_solution  # noqa: E402
+
+
+def test_solve_emits_run_phases_and_incumbents(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "telemetry.jsonl"
+    monkeypatch.setenv("TELEMETRY_PATH", str(path))
+    monkeypatch.setenv("PRESOLVE", "false")
+    monkeypatch.delenv("SOLUTION_CACHE_PATH", raising=False)
+    lengths = load_instance(ROOT / "datasets" / "disponibilizada" / "figure_2_1.json")
+    result = solve(lengths, "ckk", "highs")
+
+    events = list(telemetry.read_events(path))
+    assert [e["event"] for e in events][0] == "run_start"
+    assert events[-1]["event"] == "run_end"
+    assert events[-1]["status"] == result.status
+    assert events[-1]["max_side"] == result.max_side
+    assert {e["run"] for e in events} == {events[0]["run"]}
+
+    points = telemetry.convergence(events)
+    assert points and points[-1][1] == result.max_side
+    assert all(e["bound"] <= e["objective"] for e in events if e["event"] == "incumbent")
+    assert [t for t, _ in points] == sorted(t for t, _ in points)
+
+
+def test_mip_backend_reports_phases(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "telemetry.jsonl"
+    monkeypatch.setenv("TELEMETRY_PATH", str(path))
+    monkeypatch.setenv("PRESOLVE", "false")
+    monkeypatch.delenv("SOLUTION_CACHE_PATH", raising=False)
+    lengths = load_instance(ROOT / "datasets" / "disponibilizada" / "figure_2_1.json")
+    solve(lengths, "ortools", "highs")
+
+    events = list(telemetry.read_events(path))
+    phases = [e["name"] for e in events if e["event"] == "phase"]
+    assert phases == ["build", "search"]
+    incumbents = [e for e in events if e["event"] == "incumbent"]
+    # CP-SAT calls back from its own threads; events must still carry the run.
+    assert incumbents and all(e["run"] == events[0]["run"] for e in incumbents)
+
+
+def test_concurrent_emitters_write_whole_lines(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "telemetry.jsonl"
+    monkeypatch.setenv("TELEMETRY_PATH", str(path))
+
+    def _emit(worker: int) -> None:
+        for i in range(500):
+            telemetry.emit("tick", worker=worker, i=i)
+
+    threads = [threading.Thread(target=_emit, args=(w,)) for w in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    telemetry.flush()
+
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert len(records) == 2000
+    for worker in range(4):
+        assert [r["i"] for r in records if r["worker"] == worker] == list(range(500))
+
+
+@pytest.mark.parametrize("backend", ["ckk", "ortools", "highs"])
+def test_on_incumbent_can_stop_the_search(backend: str, monkeypatch) -> None:
+    monkeypatch.setenv("PRESOLVE", "false")
+    monkeypatch.setenv("SOLVER_TIME_LIMIT", "30")
+    monkeypatch.delenv("SOLUTION_CACHE_PATH", raising=False)
+    lengths = load_instance(ROOT / "datasets" / "gerada" / "heavy_bimodal_100.json")
+    calls = []
+
+    def _first_only(t: float, objective: float, bound) -> bool:
+        calls.append((t, objective, bound))
+        return True
+
+    with profiles.override("ortools", {"num_workers": 4}):
+        result = solve(lengths, backend, "highs", on_incumbent=_first_only)
+    validate_solution(lengths, result)
+    assert calls
+    t, objective, bound = calls[0]
+    assert t >= 0 and result.max_side <= objective + 1e-6
+    assert bound is None or bound <= objective + 1e-6
+
+
+@pytest.mark.parametrize("backend", ["dp", "kk"])
+def test_single_answer_backends_report_once(backend: str, monkeypatch) -> None:
+    monkeypatch.setenv("PRESOLVE", "false")
+    monkeypatch.delenv("SOLUTION_CACHE_PATH", raising=False)
+    lengths = load_instance(ROOT / "datasets" / "disponibilizada" / "figure_2_1.json")
+    calls = []
+    result = solve(lengths, backend, "highs", on_incumbent=lambda *args: calls.append(args))
+    assert len(calls) == 1
+    assert calls[0][1] == result.max_side
+
+
+def test_cbc_log_tail_reports_incumbents_with_bound(tmp_path: Path) -> None:
+    path = tmp_path / "cbc.log"
+    path.write_text("", encoding="utf-8")
+    seen = []
+    tail = solver_pulp._CbcLogTail(str(path), lambda obj, bound: seen.append((obj, bound)) or False)
+    tail.start()
+    with path.open("a", encoding="utf-8") as f:
+        f.write(
+            "Cbc0010I After 0 nodes, 1 on tree, 1e+50 best solution, best possible 250 (0.01 seconds)\n"
+            "Cbc0012I Integer solution of 254.05 found by DiveCoefficient after 10 iterations "
+            "and 0 nodes (0.02 seconds)\n"
+        )
+    tail.done.set()
+    tail.join()
+    assert seen == [(254.05, 250.0)]
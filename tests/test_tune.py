@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+from tests.utils import ROOT, load_instance
+
+from parking_problem import tune  # noqa: E402
+from parking_problem.solver_main import solve  # noqa: E402
+from parking_problem.solvers import profiles  # noqa: E402
+from parking_problem.solvers.base import scale_lengths  # noqa: E402
+from parking_problem.solvers.reduction import group_lengths  # noqa: E402
+
+
+def test_tune_writes_loadable_profile(tmp_path: Path, monkeypatch) -> None:
+    # tune.main overrides these for the sweep; monkeypatch restores them.
+    for key in ("SOLVER_TIME_LIMIT", "PRESOLVE", "SOLVER_LOG"):
+        monkeypatch.setenv(key, "")
+    datasets = tmp_path / "datasets"
+    datasets.mkdir()
+    instance = ROOT / "datasets" / "adaptada" / "bp20_first_15.json"
+    shutil.copy(instance, datasets)
+    output = tmp_path / "profile.json"
+
+    tune.main(
+        [
+            "--backend", "ortools",
+            "--datasets", str(datasets),
+            "--no-generated",
+            "--seeds", "1",
+            "--time-limit", "5",
+            "--output", str(output),
+        ]
+    )
+
+    profile = json.loads(output.read_text(encoding="utf-8"))
+    assert list(profile) == ["ortools"]
+    rule = profile["ortools"][0]
+    assert rule["when"] == {"max_distinct": 16}
+    assert rule["params"] in tune.SPACES["ortools"][1]
+
+    monkeypatch.setenv("SOLVER_PROFILE_PATH", str(output))
+    lengths = load_instance(instance)
+    scaled, _ = scale_lengths(lengths)
+    assert profiles.params_for("ortools", profiles.features(scaled, group_lengths(scaled))) == rule["params"]
+    assert solve(lengths, "ortools", "highs").status == "OPTIMAL"
@@ -1,21 +1,24 @@
 from __future__ import annotations
 
+import fcntl
+import gzip
 import json
+import select
+import threading
 from pathlib import Path
 from typing import List, Optional
 
 import os
 import sys
 import time
-from contextlib import redirect_stderr, redirect_stdout
 from datetime import datetime
 import re
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
-import contextlib
 
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "src"))
 
+from parking_problem import plotting, results  # noqa: E402
 from parking_problem.validator import validate_solution  # noqa: E402
 from parking_problem.solver_main import solve  # noqa: E402
 
@@ -64,98 +67,20 @@ def _plot_enabled() -> bool:
     return os.getenv("PLOT_CONVERGENCE", "").lower() == "true"
 
 
-def _parse_cbc_convergence(log_text: str) -> list[tuple[float, float]]:
-    # Example:
-    # Cbc0010I After 2265000 nodes, ..., 138.6 best solution, best possible 138.55 (2145.67 seconds)
-    pattern = re.compile(
-        r",\s*([0-9.]+)\s*best solution,\s*best possible\s*([0-9.]+)\s*\((\d+\.?\d*) seconds\)",
-        re.IGNORECASE,
-    )
-    points = []
-    for line in log_text.splitlines():
-        m = pattern.search(line)
-        if m:
-            best_solution = float(m.group(1))
-            t = float(m.group(3))
-            obj = best_solution
-            points.append((t, obj))
-    return points
-
-
-def _parse_highs_convergence(log_text: str) -> list[tuple[float, float]]:
-    # Heuristic: capture lines like "Objective value:  28.6" with nearby "Time"
-    # or "Time (Wallclock seconds): 0.21"
-    obj_pattern = re.compile(r"Objective value:\\s*([0-9.+-eE]+)")
-    time_pattern = re.compile(r"Time \\(Wallclock seconds\\):\\s*([0-9.]+)")
-    points = []
-    last_time = None
-    for line in log_text.splitlines():
-        tm = time_pattern.search(line)
-        if tm:
-            last_time = float(tm.group(1))
-        om = obj_pattern.search(line)
-        if om and last_time is not None:
-            obj = float(om.group(1))
-            points.append((last_time, obj))
-    return points
-
-
-def _parse_ortools_convergence(log_text: str) -> list[tuple[float, float]]:
-    # Example: "#3       0.01s best:286   next:[]"
-    pattern = re.compile(r"^#\\d+\\s+(\\d+\\.?\\d*)s\\s+best:([0-9.]+)", re.MULTILINE)
-    points = []
-    for m in pattern.finditer(log_text):
-        t = float(m.group(1))
-        obj = float(m.group(2))
-        points.append((t, obj))
-    return points
-
-
-def _parse_convergence_lines(log_text: str) -> list[tuple[float, float]]:
-    points = []
-    for line in log_text.splitlines():
-        if line.startswith("[convergence]") and "," in line:
-            parts = line.replace("[convergence]", "").strip().split(",")
-            if len(parts) >= 2 and parts[0] != "time_sec":
-                try:
-                    t = float(parts[0])
-                    obj = float(parts[1])
-                    points.append((t, obj))
-                except ValueError:
-                    continue
-    return points
-
-
-def _plot_convergence(log_path: Path, title: str) -> None:
-    try:
-        import matplotlib
+# CBC prints each incumbent as it finds it; the other engines report theirs
+# through on_incumbent. Example:
+# Cbc0012I Integer solution of 138.6 found by DiveCoefficient after 0 iterations and 0 nodes (0.03 seconds)
+_CBC_INCUMBENT = re.compile(rb"Integer solution of\s+([-+0-9.eE]+)\s+found.*\(([0-9.]+) seconds\)")
 
-        matplotlib.use("Agg")
-        import matplotlib.pyplot as plt  # noqa: E402
-    except Exception:
-        return
 
-    log_text = log_path.read_text(encoding="utf-8", errors="ignore")
-    points = _parse_convergence_lines(log_text)
+def _plot_convergence(points: list[tuple[float, float]], name: str, title: str) -> None:
     if not points:
         return
-
-    times = [p[0] for p in points]
-    objs = [p[1] for p in points]
-
-    plots_dir = ROOT / "tests" / "plots"
-    plots_dir.mkdir(parents=True, exist_ok=True)
-    plot_path = plots_dir / (log_path.stem + ".png")
-
-    plt.figure(figsize=(6, 4))
-    plt.plot(times, objs, marker="o", linewidth=1)
-    plt.title(title)
-    plt.xlabel("Time (s)")
-    plt.ylabel("Objective (max side)")
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(plot_path, dpi=150)
-    plt.close()
+    job = plotting.convergence_job(points, str(ROOT / "tests" / "plots" / f"{name}.png"), title)
+    try:
+        plotting.render(job)
+    except ImportError:
+        return
 
 
 def _log(msg: str) -> None:
@@ -163,21 +88,80 @@ def _log(msg: str) -> None:
         print(msg, flush=True)
 
 
-@contextlib.contextmanager
-def _redirect_fds(target_path: Path):
-    target_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(target_path, "a", encoding="utf-8") as f:
-        fd_out = os.dup(1)
-        fd_err = os.dup(2)
-        os.dup2(f.fileno(), 1)
-        os.dup2(f.fileno(), 2)
+# Fds 1 and 2 are process-wide, so tees in threads of one process take turns;
+# PER_RUN_LOG runs them in separate processes instead.
+_TEE_LOCK = threading.Lock()
+
+
+class _OutputTee:
+    """Streams native stdout/stderr into a compressed log through a pipe.
+
+    Fds 1 and 2 point at the pipe while the context is open; a reader thread
+    compresses what arrives and picks CBC incumbents out of it line by line,
+    so the output is never written to disk uncompressed or read back.
+    """
+
+    def __init__(self, out) -> None:
+        self._out = out
+        self._done = threading.Event()
+        self.points: list[tuple[float, float]] = []
+        self._thread = threading.Thread(target=self._drain, name="output-tee", daemon=True)
+
+    def __enter__(self) -> "_OutputTee":
+        _TEE_LOCK.acquire()
+        self._read_fd, write_fd = os.pipe()
         try:
-            yield
+            # A bigger pipe absorbs bursts from engines that hold the GIL
+            # while they log (in-process CBC), when this thread cannot drain.
+            fcntl.fcntl(write_fd, fcntl.F_SETPIPE_SZ, 1 << 20)
+        except (AttributeError, OSError):
+            pass
+        sys.stdout.flush()
+        sys.stderr.flush()
+        self._saved = (os.dup(1), os.dup(2))
+        os.dup2(write_fd, 1)
+        os.dup2(write_fd, 2)
+        os.close(write_fd)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            for fd, saved in zip((1, 2), self._saved):
+                os.dup2(saved, fd)
+                os.close(saved)
+            # Not EOF: a leftover engine child may still hold the write end.
+            self._done.set()
+            self._thread.join()
+            os.close(self._read_fd)
         finally:
-            os.dup2(fd_out, 1)
-            os.dup2(fd_err, 2)
-            os.close(fd_out)
-            os.close(fd_err)
+            _TEE_LOCK.release()
+
+    def _drain(self) -> None:
+        pending = b""
+        while True:
+            ready, _, _ = select.select([self._read_fd], [], [], 0.1)
+            if not ready:
+                if self._done.is_set():
+                    break
+                continue
+            chunk = os.read(self._read_fd, 1 << 16)
+            if not chunk:
+                break
+            self._out.write(chunk)
+            *lines, pending = (pending + chunk).split(b"\n")
+            for line in lines:
+                self._parse(line)
+        if pending:
+            self._out.write(b"\n")
+            self._parse(pending)
+
+    def _parse(self, line: bytes) -> None:
+        m = _CBC_INCUMBENT.search(line)
+        if m:
+            self.points.append((float(m.group(2)), float(m.group(1))))
 
 
 def run_and_validate(
@@ -192,61 +176,57 @@ def run_and_validate(
     ts = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
     log_dir = ROOT / "tests" / "logs"
     log_dir.mkdir(parents=True, exist_ok=True)
-    log_path = log_dir / f"output_{safe_instance}_{safe_solver}_{ts}.log"
-    solver_log_path = log_dir / f"solver_{safe_instance}_{safe_solver}_{ts}.log"
-
-    os.environ["SOLVER_LOG_PATH"] = str(solver_log_path)
-    os.environ["CONVERGENCE_LOG_PATH"] = str(log_path)
-    with log_path.open("w", encoding="utf-8") as f:
-        f.write(f"[run] instance={instance_name} solver={solver}\n")
+    name = f"{safe_instance}_{safe_solver}_{ts}"
+    log_path = log_dir / f"output_{name}.log.gz"
+    sidecar_path = log_dir / f"convergence_{name}.json"
+
+    # Engines that write their own log file write it into the tee as well.
+    os.environ["SOLVER_LOG_PATH"] = "/dev/stdout"
+    os.environ.pop("CONVERGENCE_LOG_PATH", None)
+    points: list[tuple[float, float]] = []
+
+    def _on_incumbent(t: float, objective: float, bound: Optional[float]) -> bool:
+        points.append((t, objective))
+        return False
+
+    with gzip.open(log_path, "wb", compresslevel=6) as f:
+        f.write(f"[run] instance={instance_name} solver={solver}\n".encode())
+        f.write(b"[solver_log_begin]\n")
         start = time.perf_counter()
-        # Redirect native solver stdout/stderr to solver_log_path
-        with _redirect_fds(solver_log_path):
-            result = solve(lengths, solver, pyomo_solver)
+        with _OutputTee(f) as tee:
+            result = solve(lengths, solver, pyomo_solver, on_incumbent=_on_incumbent)
         elapsed = time.perf_counter() - start
-        f.write(f"[done] instance={instance_name} solver={solver} elapsed={elapsed:.3f}s\n")
-        f.write(f"[result] status={result.status} max_side={result.max_side}\n")
-        f.write(f"[result] sum_a={result.sum_a} sum_b={result.sum_b}\n")
-        f.write(f"[result] side_a={result.side_a}\n")
-        f.write(f"[result] side_b={result.side_b}\n")
         validate_solution(lengths, result)
-        # Always write at least the final convergence point
-        f.write("[convergence] time_sec,objective,status\n")
-        f.write(f"[convergence] {elapsed:.6f},{result.max_side},{result.status}\n")
-
-    if solver_log_path.exists() and solver_log_path.stat().st_size > 0:
-        solver_log_text = solver_log_path.read_text(encoding="utf-8", errors="ignore")
-        with log_path.open("a", encoding="utf-8") as f:
-            f.write("[solver_log_begin]\n")
-            f.write(solver_log_text)
-            if not solver_log_text.endswith("\n"):
-                f.write("\n")
-            f.write("[solver_log_end]\n")
-
-    # Append parsed convergence for solvers that log progress to file
-    if solver in {"pulp", "highs", "pyomo", "ortools"}:
-        log_text = (
-            solver_log_path.read_text(encoding="utf-8", errors="ignore")
-            if solver_log_path.exists()
-            else log_path.read_text(encoding="utf-8", errors="ignore")
-        )
-        if solver == "pulp":
-            points = _parse_cbc_convergence(log_text)
-        elif solver == "ortools":
-            points = _parse_ortools_convergence(log_text)
-        else:
-            points = _parse_highs_convergence(log_text)
-        if points:
-            with log_path.open("a", encoding="utf-8") as f:
-                f.write("[convergence] time_sec,objective,status\n")
-                for t, obj in points:
-                    f.write(f"[convergence] {t:.6f},{obj},FEASIBLE\n")
+        points.extend(tee.points)
+        points.sort()
+        lines = [
+            "[solver_log_end]",
+            f"[done] instance={instance_name} solver={solver} elapsed={elapsed:.3f}s",
+            f"[result] status={result.status} max_side={result.max_side}",
+            f"[result] sum_a={result.sum_a} sum_b={result.sum_b}",
+            f"[result] side_a={result.side_a}",
+            f"[result] side_b={result.side_b}",
+            # Always write at least the final convergence point
+            "[convergence] time_sec,objective,status",
+            f"[convergence] {elapsed:.6f},{result.max_side},{result.status}",
+            *(f"[convergence] {t:.6f},{obj},FEASIBLE" for t, obj in points),
+        ]
+        f.write(("\n".join(lines) + "\n").encode())
+
+    sidecar = {
+        "instance": instance_name,
+        "solver": solver,
+        "timestamp": datetime.strptime(ts, "%Y%m%d-%H%M%S-%f").isoformat(),
+        "code_version": results.code_version(),
+        "status": result.status,
+        "max_side": result.max_side,
+        "time_sec": elapsed,
+        "points": points + [(elapsed, result.max_side)],
+    }
+    sidecar_path.write_text(json.dumps(sidecar) + "\n", encoding="utf-8")
 
     if _plot_enabled():
-        _plot_convergence(
-            log_path,
-            title=f"{instance_name} | {solver}",
-        )
+        _plot_convergence(sidecar["points"], f"output_{name}", title=f"{instance_name} | {solver}")
 
 
 def run_matrix(tasks: List[tuple[List[float], str, str, Optional[str]]]) -> None: